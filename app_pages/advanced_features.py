@@ -0,0 +1,241 @@
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from chat import ChatHistory, get_backend
+from progress import st_progress, track
+from sample_data import expensive_computation, load_sample_data
+
+st.markdown('<div class="section-header"><h2>🚀 Advanced Features</h2></div>', unsafe_allow_html=True)
+
+# Session State
+st.subheader("Session State Management")
+st.write(f"Page views this session: {st.session_state.counter}")
+
+# Keep only the latest messages; a deque drops the oldest on append
+if 'messages' not in st.session_state:
+    st.session_state.messages = deque(maxlen=20)
+    st.session_state.message_count = 0
+
+col1, col2 = st.columns(2)
+with col1:
+    if st.button("Add Message"):
+        st.session_state.message_count += 1
+        st.session_state.messages.append(f"Message {st.session_state.message_count}")
+with col2:
+    if st.button("Clear Messages"):
+        st.session_state.messages.clear()
+        st.session_state.message_count = 0
+
+st.write(f"Messages (latest {st.session_state.messages.maxlen}):", list(st.session_state.messages))
+
+st.divider()
+
+# Caching
+st.subheader("Caching Demonstration")
+
+st.write("First run will take 2 seconds, subsequent runs are instant:")
+start_time = time.time()
+result = expensive_computation(100)
+elapsed = time.time() - start_time
+st.write(f"Computation took {elapsed:.2f} seconds")
+st.line_chart(result)
+
+st.divider()
+
+# Form
+st.subheader("Forms (Batch Input Submission)")
+with st.form("sample_form"):
+    st.write("Fill out this form:")
+    name = st.text_input("Name")
+    age = st.number_input("Age", min_value=0, max_value=120, value=25)
+    category = st.selectbox("Category", ['A', 'B', 'C'])
+    submitted = st.form_submit_button("Submit Form")
+    
+    if submitted:
+        st.success(f"Form submitted! Name: {name}, Age: {age}, Category: {category}")
+
+st.divider()
+
+# Spinner and Progress
+st.subheader("Loading Indicators")
+col1, col2 = st.columns(2)
+
+with col1:
+    if st.button("Show Spinner"):
+        with st.spinner("Processing..."):
+            rolling = load_sample_data()['value'].rolling(24).agg(['mean', 'std'])
+        st.success(f"Done! Computed {len(rolling):,} rolling windows.")
+
+with col2:
+    if st.button("Show Progress"):
+        progress_df = load_sample_data()
+        chunk_rows = -(-len(progress_df) // 10)
+        chunks = [progress_df.iloc[i:i + chunk_rows] for i in range(0, len(progress_df), chunk_rows)]
+        with st_progress("Summarising data in chunks...") as progress:
+            summaries = [chunk['value'].describe() for chunk in track(chunks, len(chunks), progress)]
+        st.success(f"Complete! Summarised {len(summaries)} chunks.")
+
+st.divider()
+
+# Toast notifications
+st.subheader("Toast Notifications")
+col1, col2, col3 = st.columns(3)
+with col1:
+    if st.button("Show Success Toast"):
+        st.toast("Success! 🎉", icon="✅")
+with col2:
+    if st.button("Show Info Toast"):
+        st.toast("Information", icon="ℹ️")
+with col3:
+    if st.button("Show Warning Toast"):
+        st.toast("Warning!", icon="⚠️")
+
+st.divider()
+
+# Balloons and Snow
+st.subheader("Celebrations")
+col1, col2 = st.columns(2)
+with col1:
+    if st.button("🎈 Show Balloons"):
+        st.balloons()
+with col2:
+    if st.button("❄️ Show Snow"):
+        st.snow()
+
+st.divider()
+
+# Stop execution
+st.subheader("Execution Control")
+show_stop_demo = st.checkbox("Show stop execution demo")
+if show_stop_demo:
+    st.warning("Content below this will not render if you click 'Stop Here'")
+    if st.button("Stop Here"):
+        st.stop()
+    st.info("This only shows if you didn't click the stop button")
+
+st.divider()
+
+# Rerun
+st.subheader("Rerun Application")
+if st.button("🔄 Rerun App"):
+    st.rerun()
+
+st.divider()
+
+# Fragment (Partial Rerun)
+st.subheader("Fragment - Partial Reruns")
+st.write("Fragments allow you to rerun only specific sections without rerunning the entire app")
+
+@st.fragment
+def fragment_counter():
+    if 'fragment_count' not in st.session_state:
+        st.session_state.fragment_count = 0
+    
+    st.write(f"Fragment counter: {st.session_state.fragment_count}")
+    if st.button("Increment (Only Fragment Reruns)", key="frag_btn"):
+        st.session_state.fragment_count += 1
+
+fragment_counter()
+st.write(f"Main app counter: {st.session_state.counter} (doesn't change when fragment reruns)")
+
+st.divider()
+
+# Echo - Show code
+st.subheader("Echo - Display Code Being Executed")
+with st.echo():
+    # This code will be displayed and executed
+    sample_data = pd.DataFrame({
+        'x': range(10),
+        'y': np.random.randn(10)
+    })
+    st.write("Data generated inside echo block:")
+    st.dataframe(sample_data)
+
+st.divider()
+
+# Help
+st.subheader("Help Documentation")
+if st.button("Show help for st.write"):
+    st.help(st.write)
+
+st.divider()
+
+# Query Parameters
+st.subheader("Query Parameters")
+st.write("You can get and set URL query parameters:")
+st.code("""
+# Get query params
+params = st.query_params
+st.write(params)
+
+# Set query params
+st.query_params['key'] = 'value'
+st.query_params['page'] = '2'
+""", language='python')
+
+current_params = st.query_params
+st.write("Current query params:", dict(current_params))
+
+st.divider()
+
+# Status container
+st.subheader("Status Container")
+if st.button("Run Task with Status"):
+    with st.status("Loading data...", expanded=True) as status:
+        st.write("Loading sample data...")
+        task_df = load_sample_data()
+        st.write(f"Loaded {len(task_df):,} rows!")
+        st.write("Processing...")
+        st.dataframe(task_df.groupby('category')['value'].agg(['mean', 'std', 'count']))
+        status.update(label="Processing complete!", state="complete", expanded=False)
+
+st.divider()
+
+# Chat interface
+st.subheader("Chat Messages")
+st.write("Streamlit has built-in chat message components:")
+
+with st.chat_message("user"):
+    st.write("Hello! This is a user message.")
+
+with st.chat_message("assistant"):
+    st.write("Hi! This is an assistant response.")
+
+with st.chat_message("user", avatar="🧑‍💻"):
+    st.write("Messages can have custom avatars too!")
+
+# Chat with a streaming backend and bounded history
+if 'chat_history' not in st.session_state:
+    st.session_state.chat_history = ChatHistory()
+chat_history = st.session_state.chat_history
+
+col1, col2 = st.columns([3, 1])
+with col1:
+    st.caption(f"{len(chat_history)} messages, {chat_history.paged} paged out to disk")
+with col2:
+    if st.button("Clear Chat"):
+        chat_history.clear()
+
+if chat_history.paged:
+    with st.expander(f"Earlier messages ({chat_history.paged})"):
+        if st.button("Load last 50 earlier messages"):
+            for message in chat_history.older(50):
+                with st.chat_message(message['role']):
+                    st.write(message['content'])
+
+for message in chat_history.recent:
+    with st.chat_message(message['role']):
+        st.write(message['content'])
+
+user_input = st.chat_input("Type a message...")
+if user_input:
+    chat_history.append("user", user_input)
+    with st.chat_message("user"):
+        st.write(user_input)
+    with st.chat_message("assistant"):
+        reply = st.write_stream(get_backend().stream(list(chat_history.recent)))
+    chat_history.append("assistant", reply)
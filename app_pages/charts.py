@@ -0,0 +1,130 @@
+import numpy as np
+import streamlit as st
+
+from assets import map_layout
+from lazy_import import lazy_import
+from quantile_sketch import box_stats, box_trace, grouped_sketches
+from query_engine import get_engine
+from sample_data import dataset_version, generate_timeseries_data, load_sample_data
+from sampling import cached_sample
+from spatial_binning import bin_points
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+
+@st.cache_data(max_entries=16)
+def binned_points(_df, version, kind, cells_across):
+    """Grid-aggregated map points, cached per dataset version."""
+    return bin_points(_df, kind=kind, cells_across=cells_across, value='count')
+
+
+@st.cache_data(max_entries=4)
+def box_plot_stats(_df, version, column, by):
+    """Quartiles and fences per group from quantile sketches, cached per dataset version."""
+    return box_stats(grouped_sketches(_df, column, by))
+
+
+df = load_sample_data()
+ts_data = generate_timeseries_data()
+
+st.markdown('<div class="section-header"><h2>📈 Charts & Visualizations</h2></div>', unsafe_allow_html=True)
+
+engine = get_engine()
+
+# Native Streamlit charts
+st.subheader("Native Streamlit Charts")
+
+col1, col2 = st.columns(2)
+with col1:
+    st.write("**Line Chart**")
+    st.line_chart(ts_data.set_index('date')[['metric1', 'metric2']])
+with col2:
+    st.write("**Area Chart**")
+    st.area_chart(ts_data.set_index('date')['metric1'])
+
+col1, col2 = st.columns(2)
+with col1:
+    st.write("**Bar Chart**")
+    st.bar_chart(engine.group_agg(df, 'category', 'value', how='mean').set_index('category'))
+with col2:
+    st.write("**Scatter Chart**")
+    chart_df = cached_sample(df, dataset_version(), 100, strata='category')[['value', 'temperature']]
+    st.scatter_chart(chart_df, x='value', y='temperature', size='value', color='temperature')
+
+st.divider()
+
+# Plotly charts
+st.subheader("Plotly Charts")
+
+col1, col2 = st.columns(2)
+with col1:
+    fig = px.histogram(df, x='value', color='category', title="Histogram by Category")
+    st.plotly_chart(fig, use_container_width=True)
+with col2:
+    # Five precomputed numbers per box instead of every raw value
+    fig = go.Figure(box_trace(box_plot_stats(df, dataset_version(), 'temperature', 'category'), name='temperature'))
+    fig.update_layout(title="Box Plot", xaxis_title='category', yaxis_title='temperature')
+    st.plotly_chart(fig, use_container_width=True)
+
+# 3D Scatter
+st.subheader("3D Visualization")
+fig = px.scatter_3d(cached_sample(df, dataset_version(), 200, strata='category'), x='value', y='temperature', z='humidity', 
+                    color='category', size='count', title="3D Scatter Plot")
+st.plotly_chart(fig, use_container_width=True)
+
+st.divider()
+
+# Maps
+st.subheader("Map Visualizations")
+st.caption("Every point is aggregated into grid cells, so the maps stay small however many rows are loaded.")
+
+col1, col2 = st.columns(2)
+with col1:
+    bin_kind = st.radio("Cell Shape", ["hex", "square"], horizontal=True, format_func=str.title)
+with col2:
+    cells_across = st.slider("Cells Across", 10, 100, 40, step=5)
+
+binned = binned_points(df, dataset_version(), bin_kind, cells_across)
+
+col1, col2 = st.columns(2)
+with col1:
+    st.write("**Simple Map**")
+    # st.map sizes are in meters: scale each cell's marker by its point count.
+    cell_m = (df['longitude'].max() - df['longitude'].min()) / cells_across * 111_320 * np.cos(np.radians(df['latitude'].mean()))
+    map_data = binned.assign(radius=cell_m / 2 * np.sqrt(binned['points'] / binned['points'].max()))
+    st.map(map_data, latitude='latitude', longitude='longitude', size='radius', zoom=11)
+
+with col2:
+    st.write("**Scatter Map (Plotly)**")
+    fig = px.scatter_mapbox(binned, lat='latitude', lon='longitude', 
+                            color='count_mean', size='points',
+                            hover_data={'points': True, 'count_mean': ':.1f'},
+                            zoom=10, height=400)
+    # Tiles come from the local cache when `python assets.py` has filled it
+    fig.update_layout(**map_layout())
+    st.plotly_chart(fig, use_container_width=True)
+
+st.divider()
+
+# Heatmap
+st.subheader("Heatmap")
+pivot_data = engine.pivot_agg(df, index='category', columns='status', values='value', how='mean')
+fig = px.imshow(pivot_data, title="Heatmap: Value by Category and Status",
+                labels=dict(x="Status", y="Category", color="Value"))
+st.plotly_chart(fig, use_container_width=True)
+
+st.divider()
+
+# Vega-Lite (Alternative)
+st.subheader("Vega-Lite Chart")
+chart_data = cached_sample(df, dataset_version(), 100, strata='category')[['value', 'temperature', 'category']]
+st.vega_lite_chart(chart_data, {
+    'mark': {'type': 'circle', 'tooltip': True},
+    'encoding': {
+        'x': {'field': 'value', 'type': 'quantitative'},
+        'y': {'field': 'temperature', 'type': 'quantitative'},
+        'color': {'field': 'category', 'type': 'nominal'},
+        'size': {'value': 100}
+    },
+}, use_container_width=True)
@@ -0,0 +1,91 @@
+import numpy as np
+import streamlit as st
+
+from sample_data import data_rows, versioned_sample_data
+from streaming_stats import StreamingStats
+
+data = versioned_sample_data()
+df = data.df
+
+st.markdown('<div class="section-header"><h2>📊 Data Display Elements</h2></div>', unsafe_allow_html=True)
+
+# DataFrame with all features
+st.subheader("DataFrame Display")
+st.dataframe(
+    df.head(20),
+    use_container_width=True,
+    hide_index=False,
+    column_config={
+        "timestamp": st.column_config.DatetimeColumn("Date/Time", format="DD/MM/YYYY HH:mm"),
+        "value": st.column_config.NumberColumn("Value", format="%.2f"),
+        "temperature": st.column_config.ProgressColumn("Temperature", min_value=0, max_value=50),
+        "score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100),
+        "status": st.column_config.TextColumn("Status", help="Current status"),
+    },
+    height=400
+)
+
+st.divider()
+
+# Static table
+st.subheader("Static Table")
+st.table(df.head(10)[['category', 'value', 'count', 'status']])
+
+st.divider()
+
+# Metrics row
+st.subheader("Metrics Display")
+col1, col2, col3, col4, col5 = st.columns(5)
+metrics_data = data.aggregate('category_mean', ['category', 'value'],
+                              lambda d: d.groupby('category')['value'].mean())
+
+for idx, (col, cat) in enumerate(zip([col1, col2, col3, col4], metrics_data.index)):
+    with col:
+        st.metric(
+            label=f"Category {cat}",
+            value=f"{metrics_data[cat]:.2f}",
+            delta=f"{np.random.uniform(-10, 10):.2f}",
+            delta_color="normal"
+        )
+
+st.divider()
+
+# JSON display
+st.subheader("JSON Display")
+numeric_columns = df.select_dtypes('number').columns
+sample_json = {
+    "user": "demo_user",
+    "settings": {
+        "theme": "dark",
+        "notifications": True,
+        "data_points": data_rows()
+    },
+    "stats": data.aggregate('stats', numeric_columns, lambda d: StreamingStats.from_frame(d, numeric_columns),
+                            append=StreamingStats.update).describe().to_dict()
+}
+st.json(sample_json)
+
+st.divider()
+
+# Data editor
+st.subheader("Data Editor (Editable DataFrame)")
+editor_view = df.head(10)[['category', 'value', 'count', 'status']]
+editor_key = f"data_editor:{data.key}"
+st.data_editor(
+    editor_view,
+    key=editor_key,
+    use_container_width=True,
+    num_rows="dynamic",
+    column_config={
+        "category": st.column_config.SelectboxColumn("Category", options=['A', 'B', 'C', 'D']),
+        "value": st.column_config.NumberColumn("Value", min_value=0, max_value=200, step=0.1),
+        "status": st.column_config.SelectboxColumn("Status", options=['Active', 'Inactive', 'Pending']),
+    }
+)
+
+if st.button("Apply Edits"):
+    changed = data.apply_editor_state(st.session_state[editor_key], editor_view.index)
+    if changed:
+        st.toast(f"Applied edits to {', '.join(sorted(changed))} (version {data.version})")
+        st.rerun()
+    st.info("No edits to apply")
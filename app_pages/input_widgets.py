@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import streamlit as st
+
+from sample_data import load_sample_data
+
+df = load_sample_data()
+
+st.markdown('<div class="section-header"><h2>🎛️ Input Widgets</h2></div>', unsafe_allow_html=True)
+
+# Buttons
+st.subheader("Buttons")
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    if st.button("Standard Button"):
+        st.toast("Standard button clicked!")
+with col2:
+    if st.button("Primary Button", type="primary"):
+        st.toast("Primary button clicked!")
+with col3:
+    if st.download_button("Download CSV", data=df.to_csv(index=False), file_name="data.csv", mime="text/csv"):
+        st.toast("Download initiated!")
+with col4:
+    st.link_button("Visit Streamlit", "https://streamlit.io")
+
+st.divider()
+
+# Text inputs
+st.subheader("Text Inputs")
+col1, col2 = st.columns(2)
+with col1:
+    text_input = st.text_input("Text Input", placeholder="Enter text here...")
+    text_area = st.text_area("Text Area", placeholder="Enter multiple lines...")
+with col2:
+    number_input = st.number_input("Number Input", min_value=0, max_value=100, value=50, step=1)
+    password = st.text_input("Password", type="password", placeholder="Enter password...")
+
+st.divider()
+
+# Selection widgets
+st.subheader("Selection Widgets")
+col1, col2 = st.columns(2)
+with col1:
+    checkbox = st.checkbox("Checkbox", value=True)
+    toggle = st.toggle("Toggle Switch", value=False)
+    radio = st.radio("Radio Buttons", ['Option 1', 'Option 2', 'Option 3'], horizontal=True)
+with col2:
+    selectbox = st.selectbox("Select Box", ['Choice A', 'Choice B', 'Choice C', 'Choice D'])
+    multiselect = st.multiselect("Multi-Select", ['Item 1', 'Item 2', 'Item 3', 'Item 4'], default=['Item 1'])
+    select_slider = st.select_slider("Select Slider", options=['Low', 'Medium', 'High', 'Very High'])
+
+st.divider()
+
+# Sliders
+st.subheader("Sliders")
+slider_val = st.slider("Single Value Slider", 0, 100, 50)
+range_val = st.slider("Range Slider", 0.0, 100.0, (25.0, 75.0))
+
+col1, col2 = st.columns(2)
+with col1:
+    date_input = st.date_input("Date Input", value=datetime.now())
+with col2:
+    time_input = st.time_input("Time Input", value=datetime.now().time())
+
+st.divider()
+
+# File uploader
+st.subheader("File Uploader")
+uploaded_file = st.file_uploader("Choose a file", type=['csv', 'txt', 'json', 'xlsx'], accept_multiple_files=False)
+if uploaded_file is not None:
+    st.success(f"File uploaded: {uploaded_file.name}")
+    st.write(f"File size: {uploaded_file.size} bytes")
+
+st.divider()
+
+# Camera input
+st.subheader("Camera Input")
+camera_photo = st.camera_input("Take a picture")
+if camera_photo is not None:
+    st.image(camera_photo)
+
+st.divider()
+
+# Color picker
+st.subheader("Color Picker")
+color = st.color_picker("Pick a color", "#FF4B4B")
+st.write(f"Selected color: {color}")
+
+# Display all inputs
+with st.expander("📋 View All Input Values"):
+    st.json({
+        "text_input": text_input,
+        "number_input": number_input,
+        "checkbox": checkbox,
+        "toggle": toggle,
+        "radio": radio,
+        "selectbox": selectbox,
+        "multiselect": multiselect,
+        "slider": slider_val,
+        "range": range_val,
+        "date": str(date_input),
+        "time": str(time_input),
+        "color": color
+    })
@@ -0,0 +1,103 @@
+import streamlit as st
+
+from lazy_import import lazy_import
+from sample_data import generate_timeseries_data, load_sample_data
+
+px = lazy_import("plotly.express")
+
+df = load_sample_data()
+ts_data = generate_timeseries_data()
+
+st.markdown('<div class="section-header"><h2>📐 Layout Components</h2></div>', unsafe_allow_html=True)
+
+# Columns
+st.subheader("Columns Layout")
+col1, col2, col3 = st.columns([2, 1, 1])
+with col1:
+    st.info("Wide column (2 units)")
+    st.write("This column is twice as wide as the others.")
+with col2:
+    st.success("Column 2")
+    st.write("Standard width")
+with col3:
+    st.warning("Column 3")
+    st.write("Standard width")
+
+st.divider()
+
+# Tabs
+st.subheader("Tabs")
+tab1, tab2, tab3, tab4 = st.tabs(["📊 Data", "📈 Charts", "⚙️ Settings", "ℹ️ Info"])
+
+with tab1:
+    st.write("Data Tab Content")
+    st.dataframe(df.head(10))
+
+with tab2:
+    st.write("Charts Tab Content")
+    fig = px.line(ts_data, x='date', y=['metric1', 'metric2', 'metric3'], title="Time Series")
+    st.plotly_chart(fig, use_container_width=True)
+
+with tab3:
+    st.write("Settings Tab Content")
+    st.slider("Setting 1", 0, 100, 50)
+    st.checkbox("Enable Feature")
+
+with tab4:
+    st.write("Info Tab Content")
+    st.info("This is additional information about the application.")
+
+st.divider()
+
+# Expander
+st.subheader("Expanders")
+with st.expander("Click to expand - Section 1", expanded=True):
+    st.write("This is expanded by default")
+    st.line_chart(ts_data.set_index('date')['metric1'])
+
+with st.expander("Click to expand - Section 2"):
+    st.write("This is collapsed by default")
+    st.bar_chart(df.groupby('category')['value'].mean())
+
+st.divider()
+
+# Container
+st.subheader("Containers")
+container = st.container(border=True)
+container.write("This is inside a bordered container")
+container.metric("Metric in Container", 42, delta=5)
+
+st.divider()
+
+# Empty placeholder
+st.subheader("Empty Placeholder (Dynamic)")
+placeholder = st.empty()
+
+if st.button("Update Placeholder"):
+    groups = df.groupby('category')['value']
+    for i, (cat, values) in enumerate(groups, start=1):
+        placeholder.write(f"Update {i}/{groups.ngroups}: category {cat} mean = {values.mean():.2f}")
+    placeholder.success("Updates complete!")
+
+st.divider()
+
+# Popover
+st.subheader("Popover")
+with st.popover("Open Popover"):
+    st.write("This is content inside a popover!")
+    st.selectbox("Choose option", ['A', 'B', 'C'])
+
+st.divider()
+
+# Dialog (Modal)
+st.subheader("Dialog (Modal)")
+
+@st.dialog("Sample Dialog")
+def show_dialog():
+    st.write("This is a modal dialog!")
+    st.text_input("Enter something:")
+    if st.button("Close"):
+        st.rerun()
+
+if st.button("Open Dialog"):
+    show_dialog()
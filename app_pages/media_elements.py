@@ -0,0 +1,50 @@
+import streamlit as st
+
+from assets import asset
+from lazy_import import lazy_import
+from sample_data import dataset_version, load_sample_data
+from sampling import cached_sample
+
+px = lazy_import("plotly.express")
+
+df = load_sample_data()
+
+st.markdown('<div class="section-header"><h2>🎨 Media Elements</h2></div>', unsafe_allow_html=True)
+
+# Images
+st.subheader("Images")
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.image(asset("sample_image_1"), caption="Sample Image 1", use_container_width=True)
+with col2:
+    st.image(asset("sample_image_2"), caption="Sample Image 2", use_container_width=True)
+with col3:
+    st.image(asset("sample_image_3"), caption="Sample Image 3", use_container_width=True)
+
+st.divider()
+
+# Logo
+st.subheader("Logo Display")
+st.logo(asset("streamlit_logo"))
+
+st.divider()
+
+# Audio (placeholder)
+st.subheader("Audio Player")
+st.info("Audio player component (requires actual audio file)")
+# st.audio("path/to/audio.mp3")
+
+st.divider()
+
+# Video (placeholder)
+st.subheader("Video Player")
+st.info("Video player component (requires actual video file)")
+# st.video("path/to/video.mp4")
+
+st.divider()
+
+# Matplotlib/Plotly charts
+st.subheader("Chart as Image")
+fig = px.scatter(cached_sample(df, dataset_version(), 100, strata='category'), x='value', y='temperature', color='category', 
+                 title="Scatter Plot Example", size='count')
+st.plotly_chart(fig, use_container_width=True)
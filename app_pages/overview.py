@@ -0,0 +1,63 @@
+import time
+
+import streamlit as st
+
+from lazy_import import lazy_import
+from sample_data import load_sample_data
+
+px = lazy_import("plotly.express")
+
+load_start = time.perf_counter()
+df = load_sample_data()
+load_seconds = time.perf_counter() - load_start
+
+st.header("📊 Application Overview")
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("Total Records", len(df), delta=100)
+with col2:
+    st.metric("Categories", df['category'].nunique(), delta=None)
+with col3:
+    st.metric("Avg Value", f"{df['value'].mean():.2f}", delta=f"{df['value'].std():.2f}")
+with col4:
+    st.metric("Active Status", len(df[df['status']=='Active']), delta=50)
+
+st.divider()
+
+# Container example
+with st.container():
+    st.subheader("🎯 Welcome Message")
+    st.info("This comprehensive demo showcases **all** Streamlit features including text elements, data display, input widgets, charts, layouts, media elements, and advanced features.")
+
+    # Expander
+    with st.expander("📖 See Feature Categories"):
+        st.write("""
+        - **Text Elements**: Titles, headers, markdown, code, LaTeX
+        - **Data Display**: DataFrames, tables, metrics, JSON
+        - **Input Widgets**: Buttons, sliders, text inputs, file uploaders
+        - **Media Elements**: Images, audio, video
+        - **Layouts**: Columns, tabs, sidebar, containers
+        - **Charts**: Line, bar, area, scatter, maps
+        - **Advanced**: Caching, state management, custom components
+        """)
+
+st.divider()
+
+# Columns with different content
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.subheader("📈 Quick Data Preview")
+    st.dataframe(df.head(10), use_container_width=True, hide_index=True)
+
+with col2:
+    st.subheader("📊 Category Distribution")
+    category_counts = df['category'].value_counts()
+    fig = px.pie(values=category_counts.values, names=category_counts.index, 
+                 title="Category Split")
+    st.plotly_chart(fig, use_container_width=True)
+
+# Progress and status
+st.subheader("⏳ System Status")
+st.success(f"System ready! ✅ Loaded {len(df):,} records in {load_seconds:.2f}s")
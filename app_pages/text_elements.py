@@ -0,0 +1,76 @@
+import pandas as pd
+import streamlit as st
+
+st.markdown('<div class="section-header"><h2>📝 Text Elements</h2></div>', unsafe_allow_html=True)
+
+# Title and headers
+st.title("This is a Title")
+st.header("This is a Header")
+st.subheader("This is a Subheader")
+st.text("This is simple text")
+st.caption("This is a caption with smaller text")
+
+st.divider()
+
+# Markdown
+st.subheader("Markdown Support")
+st.markdown("""
+### Markdown Features
+- **Bold text** and *italic text*
+- `Inline code` and code blocks
+- [Links to Streamlit](https://streamlit.io)
+- Lists and sublists
+    - Nested item 1
+    - Nested item 2
+- > Blockquotes
+- Horizontal rules below
+""")
+
+st.divider()
+
+# Code display
+st.subheader("Code Display")
+code = '''def hello_streamlit():
+    st.write("Hello, Streamlit!")
+    return "Success"
+    
+result = hello_streamlit()'''
+st.code(code, language='python', line_numbers=True)
+
+st.divider()
+
+# LaTeX
+st.subheader("LaTeX Formulas")
+st.latex(r'''
+E = mc^2
+''')
+st.latex(r'''
+\int_0^\infty e^{-x^2} dx = \frac{\sqrt{\pi}}{2}
+''')
+
+st.divider()
+
+# Write (universal)
+st.subheader("st.write() - Universal Function")
+st.write("String:", "This is a string")
+st.write("Number:", 42)
+st.write("DataFrame:", pd.DataFrame({
+    'category': ['A', 'B', 'C'],
+    'value': [101.2, 99.8, 100.5],
+    'status': ['Active', 'Pending', 'Inactive']
+}))
+st.write("Dictionary:", {"key1": "value1", "key2": [1, 2, 3]})
+
+st.divider()
+
+# Status messages
+st.subheader("Status Messages")
+col1, col2 = st.columns(2)
+with col1:
+    st.success("This is a success message!")
+    st.info("This is an info message!")
+with col2:
+    st.warning("This is a warning message!")
+    st.error("This is an error message!")
+
+st.exception(ValueError("This is an exception display"))
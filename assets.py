@@ -0,0 +1,239 @@
+"""Local copies of the images and map tiles the pages display.
+
+Images are pre-resized PNGs under ``static/``: remote images (logos) are
+downloaded once, placeholders are drawn locally with Pillow, and a remote
+image that cannot be fetched falls back to a drawn placeholder, so pages
+render offline.  ``asset(name)`` returns the file path for ``st.image`` /
+``st.logo``.  It never waits on the network: a missing placeholder is drawn
+on the spot, while a missing remote image is shown from its remote URL and
+downloaded in a background thread (the cache warmer normally has it ready
+first).  With static serving enabled in ``.streamlit/config.toml`` files
+under ``static/`` are also reachable at ``static_url(path)``, which
+includes the server's ``baseUrlPath`` so it works behind a path-prefixed
+proxy.
+
+Map tiles are cached on disk under ``static/tiles/{z}/{x}/{y}.png`` and
+served by Streamlit.  Plotly maps draw them over the remote OpenStreetMap
+style, at the cached zoom levels only, so the cached area shows without
+waiting on OpenStreetMap while tiles that were never cached (other areas)
+still come from the remote style underneath.
+
+    python assets.py                     # build all images, cache tiles for the sample data area
+    python assets.py --offline           # placeholders only, no downloads
+"""
+import argparse
+import io
+import logging
+import math
+import os
+import threading
+import uuid
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+TILE_DIR = os.path.join(STATIC_DIR, 'tiles')
+TILE_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+USER_AGENT = "streamlit-demo-asset-cache/1.0"
+
+logger = logging.getLogger(__name__)
+
+# name -> (width, height, background, foreground, text, remote url or None)
+ASSETS = {
+    'streamlit_logo': (200, 200, '#ffffff', '#ff4b4b', 'Streamlit',
+                       "https://streamlit.io/images/brand/streamlit-mark-color.png"),
+    'dashboard_logo': (300, 100, '#667eea', '#ffffff', 'LOGO', None),
+    'sample_image_1': (300, 200, '#cccccc', '#969696', 'Image 1', None),
+    'sample_image_2': (300, 200, '#cccccc', '#969696', 'Image 2', None),
+    'sample_image_3': (300, 200, '#cccccc', '#969696', 'Image 3', None),
+}
+
+# Bounding box (lat_min, lat_max, lon_min, lon_max) of the sample map data
+SAMPLE_AREA = (40.7, 40.8, -74.0, -73.9)
+SAMPLE_ZOOMS = range(9, 15)
+
+
+def _path(name):
+    return os.path.join(STATIC_DIR, f'{name}.png')
+
+
+def _placeholder(width, height, background, foreground, text):
+    from PIL import Image, ImageDraw, ImageFont
+
+    image = Image.new('RGB', (width, height), background)
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.load_default(size=max(12, height // 5))
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    draw.text(((width - right + left) / 2, (height - bottom + top) / 2 - top), text, fill=foreground, font=font)
+    return image
+
+
+def _download(url, timeout=10):
+    import urllib.request
+
+    request = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def _save(image, path):
+    # Unique temp name: the cache warmer and a page may build the same file.
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+    image.save(tmp, format='PNG', optimize=True)
+    os.replace(tmp, path)
+
+
+def build(name, offline=False):
+    """Write the asset file, downloading it unless ``offline``; returns its path."""
+    from PIL import Image
+
+    width, height, background, foreground, text, url = ASSETS[name]
+    image = None
+    if url and not offline:
+        try:
+            image = Image.open(io.BytesIO(_download(url))).convert('RGBA')
+            image.thumbnail((width, height))
+        except OSError:
+            image = None
+    if image is None:
+        image = _placeholder(width, height, background, foreground, text)
+    path = _path(name)
+    _save(image, path)
+    return path
+
+
+_building = set()
+_building_lock = threading.Lock()
+
+
+def _build_in_background(name):
+    with _building_lock:
+        if name in _building:
+            return
+        _building.add(name)
+
+    def run():
+        try:
+            build(name)
+        except Exception as exc:
+            logger.warning("Building asset %s failed: %s", name, exc)
+        finally:
+            with _building_lock:
+                _building.discard(name)
+
+    threading.Thread(target=run, name=f"asset-{name}", daemon=True).start()
+
+
+def asset(name):
+    """Local file for ``name``, or its remote URL while the file is being downloaded."""
+    path = _path(name)
+    if os.path.exists(path):
+        return path
+    url = ASSETS[name][5]
+    if url is None:
+        return build(name, offline=True)
+    _build_in_background(name)
+    return url
+
+
+def ensure_all():
+    """Build every missing asset (used by the cache warmer)."""
+    for name in ASSETS:
+        if not os.path.exists(_path(name)):
+            build(name)
+
+
+def static_url(path):
+    """URL at which the running server serves ``static/<path>``."""
+    import streamlit as st
+
+    base = (st.get_option('server.baseUrlPath') or '').strip('/')
+    return f"/{base}/app/static/{path}" if base else f"/app/static/{path}"
+
+
+# Map tiles
+
+def tile_xy(lat, lon, zoom):
+    """Web-mercator tile containing (lat, lon) at ``zoom``."""
+    n = 2 ** zoom
+    x = int((lon + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_path(z, x, y):
+    return os.path.join(TILE_DIR, str(z), str(x), f'{y}.png')
+
+
+def fetch_tile(z, x, y):
+    """Return the cached tile, downloading it once if it is not on disk yet."""
+    path = tile_path(z, x, y)
+    if not os.path.exists(path):
+        data = _download(TILE_URL.format(z=z, x=x, y=y))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    return path
+
+
+def prefetch_tiles(bounds=SAMPLE_AREA, zooms=SAMPLE_ZOOMS):
+    """Cache every tile covering ``bounds`` at ``zooms``; returns the number fetched or found."""
+    lat_min, lat_max, lon_min, lon_max = bounds
+    count = 0
+    for z in zooms:
+        x0, y0 = tile_xy(lat_max, lon_min, z)
+        x1, y1 = tile_xy(lat_min, lon_max, z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                fetch_tile(z, x, y)
+                count += 1
+    return count
+
+
+def cached_zooms():
+    """Zoom levels with at least one cached tile, ascending."""
+    try:
+        return sorted(int(z) for z in os.listdir(TILE_DIR) if z.isdigit())
+    except FileNotFoundError:
+        return []
+
+
+def map_layout():
+    """Plotly mapbox layout: the remote OpenStreetMap style, with the local tiles over it.
+
+    The local layer is limited to the cached zoom levels; where a tile is
+    missing (outside the prefetched area) the remote style shows through.
+    """
+    zooms = cached_zooms()
+    if not zooms:
+        return {'mapbox_style': 'open-street-map'}
+    return {
+        'mapbox_style': 'open-street-map',
+        'mapbox_layers': [{
+            'below': 'traces',
+            'sourcetype': 'raster',
+            'sourceattribution': '© OpenStreetMap contributors',
+            'source': [static_url('tiles/{z}/{x}/{y}.png')],
+            'minzoom': zooms[0],
+            'maxzoom': zooms[-1] + 1,
+        }],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build local images and the map tile cache.")
+    parser.add_argument('--offline', action='store_true', help="draw placeholders instead of downloading")
+    args = parser.parse_args()
+
+    for name in ASSETS:
+        print(f"{name}: {build(name, offline=args.offline)}")
+    if not args.offline:
+        try:
+            print(f"Cached {prefetch_tiles()} map tiles in {TILE_DIR}")
+        except OSError as exc:
+            print(f"Could not fetch map tiles ({exc}); maps will use remote tiles")
+
+
+if __name__ == '__main__':
+    main()
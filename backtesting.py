@@ -0,0 +1,164 @@
+"""Rolling-origin backtests of the forecast models.
+
+Every model is refitted at many historical cutoffs ("origins") of a daily
+series and scored on the ``horizon`` days that followed each one, the same
+way it is used on the AI Predictions tab.  Series are the total sales and
+the sales of each region and product; each (series, model) pair is an
+independent task, so they run in a process pool.
+
+    python backtesting.py --horizon 30 --step 7 --workers 4
+
+``BacktestJob`` runs a backtest in a background thread so a page can show
+its results once they are ready without waiting for them.
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from forecasting import MODELS, predict
+from progress import null_progress
+
+logger = logging.getLogger(__name__)
+
+TOTAL = ('All', 'All')
+
+
+def daily_series(df, by=('Region', 'Product')):
+    """Daily ``Sales`` totals: overall and per value of each ``by`` column.
+
+    Returns {(dimension, key): values}, with ``TOTAL`` for the overall series.
+    """
+    days = df['Date'].dt.normalize()
+    calendar = pd.date_range(days.min(), days.max(), freq='D')
+    series = {TOTAL: df.groupby(days)['Sales'].sum().reindex(calendar, fill_value=0).to_numpy(dtype=float)}
+    for column in by:
+        table = df.groupby([days, column])['Sales'].sum().unstack(fill_value=0).reindex(calendar, fill_value=0)
+        for key in table.columns:
+            series[(column, key)] = table[key].to_numpy(dtype=float)
+    return series
+
+
+def origins(length, horizon, initial, step):
+    """Cutoffs with at least ``initial`` days of history and ``horizon`` days after them."""
+    return list(range(initial, length - horizon + 1, step))
+
+
+def _run_task(task):
+    name, values, model, horizon, cutoffs = task
+    errors, actuals = [], []
+    for cutoff in cutoffs:
+        forecast, _ = predict(values[:cutoff], horizon, model=model)
+        actual = values[cutoff:cutoff + horizon]
+        errors.append(forecast - actual)
+        actuals.append(actual)
+    errors, actuals = np.concatenate(errors), np.concatenate(actuals)
+    nonzero = actuals != 0
+    return {
+        'Dimension': name[0],
+        'Key': name[1],
+        'Model': model,
+        'MAPE': float(np.mean(np.abs(errors[nonzero] / actuals[nonzero])) * 100) if nonzero.any() else np.nan,
+        'RMSE': float(np.sqrt(np.mean(errors ** 2))),
+        'Origins': len(cutoffs),
+        'Horizon': horizon,
+    }
+
+
+def backtest(series, models=MODELS, horizon=30, initial=90, step=7, workers=None, progress=None):
+    """MAPE (%) and RMSE of every model on every series, one row per (series, model)."""
+    tasks = []
+    for name, values in series.items():
+        cutoffs = origins(len(values), horizon, initial, step)
+        if cutoffs:
+            tasks.extend((name, values, model, horizon, cutoffs) for model in models)
+
+    progress = progress or null_progress
+    rows = []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        for i, task in enumerate(tasks, start=1):
+            rows.append(_run_task(task))
+            progress(i / len(tasks), f"Backtested {i}/{len(tasks)}")
+    else:
+        # Spawned workers: forking a threaded server process can deadlock
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)), mp_context=context) as pool:
+            futures = [pool.submit(_run_task, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), start=1):
+                rows.append(future.result())
+                progress(done / len(tasks), f"Backtested {done}/{len(tasks)}")
+
+    columns = ['Dimension', 'Key', 'Model', 'MAPE', 'RMSE', 'Origins', 'Horizon']
+    return pd.DataFrame(rows, columns=columns).sort_values(['Dimension', 'Key', 'Model'], ignore_index=True)
+
+
+def best_models(results):
+    """The lowest-MAPE row of every series, indexed by (Dimension, Key)."""
+    ranked = results.dropna(subset=['MAPE']).sort_values('MAPE')
+    return ranked.drop_duplicates(['Dimension', 'Key']).set_index(['Dimension', 'Key']).sort_index()
+
+
+def score(results, name, model):
+    """The results row of ``model`` on the series ``name``, or None."""
+    rows = results[(results['Dimension'] == name[0]) & (results['Key'] == name[1]) & (results['Model'] == model)]
+    return rows.iloc[0] if len(rows) else None
+
+
+class BacktestJob:
+    """Runs ``backtest`` in a daemon thread; ``results`` is set once it has finished."""
+
+    def __init__(self, series, **kwargs):
+        self.series = series
+        self.kwargs = kwargs
+        self.fraction = 0.0
+        self.results = None
+        self.error = None
+        self.finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="forecast-backtest", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _progress(self, fraction, text=None):
+        self.fraction = fraction
+
+    def _run(self):
+        try:
+            self.results = backtest(self.series, progress=self._progress, **self.kwargs)
+        except Exception as exc:
+            logger.warning("Forecast backtest failed: %s", exc)
+            self.error = repr(exc)
+        finally:
+            self.finished.set()
+
+
+def main():
+    from dashboard_data import sales_rows
+
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of the forecast models.")
+    parser.add_argument('--days', type=int, default=365, help="days of generated sales history")
+    parser.add_argument('--horizon', type=int, default=30)
+    parser.add_argument('--initial', type=int, default=90, help="minimum history before the first cutoff")
+    parser.add_argument('--step', type=int, default=7, help="days between cutoffs")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    series = daily_series(sales_rows(pd.date_range(end=pd.Timestamp.now(), periods=args.days, freq='D')))
+    t0 = time.perf_counter()
+    results = backtest(series, horizon=args.horizon, initial=args.initial, step=args.step, workers=args.workers)
+    elapsed = time.perf_counter() - t0
+    print(results.to_string(index=False, float_format='{:,.2f}'.format))
+    print(f"\n{len(results)} (series, model) backtests in {elapsed:.1f}s")
+    print(best_models(results)[['Model', 'MAPE']].to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Parity check and benchmark of the query engines on large sales frames.
+
+Every engine runs the same dashboard pipeline (global date/region filter,
+then the Date/Region/Product rollups and the Region x Product pivot).  The
+results are first compared against the pandas reference, then timed.  The
+one-off conversion of the source frame to the engine's format (pandas ->
+Polars) is timed separately from the queries.
+
+    python bench_query_engine.py --rows 1000000 10000000 --engines pandas polars duckdb
+"""
+import argparse
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from query_engine import get_engine
+
+
+REGIONS = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
+PRODUCTS = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
+
+
+def make_sales(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(end='2025-12-31', periods=365, freq='D')
+    return pd.DataFrame({
+        'Date': days[np.sort(rng.integers(0, len(days), rows))],
+        'Region': rng.choice(REGIONS, rows),
+        'Product': rng.choice(PRODUCTS, rows),
+        'Sales': rng.integers(1000, 50000, rows),
+        'Units': rng.integers(10, 500, rows),
+        'Cost': rng.integers(500, 30000, rows),
+        'Customer_Satisfaction': rng.uniform(3.5, 5.0, rows).round(2),
+        'Returns': rng.integers(0, 50, rows),
+    })
+
+
+def pipeline(engine, df, start, end, regions):
+    filtered = engine.filter_sales(df, start, end, regions)
+    return {
+        'filtered': filtered.reset_index(drop=True),
+        'by_date': engine.group_agg(filtered, 'Date', 'Sales'),
+        'by_region': engine.group_agg(filtered, 'Region', 'Sales'),
+        'by_product': engine.group_agg(filtered, 'Product', 'Customer_Satisfaction', how='mean'),
+        'counts': engine.group_agg(filtered, 'Region', how='count'),
+        'pivot': engine.pivot_agg(filtered, 'Product', 'Region', 'Sales', how='sum'),
+    }
+
+
+def check_parity(expected, actual, engine_name):
+    for key, frame in expected.items():
+        try:
+            pd.testing.assert_frame_equal(frame, actual[key], check_dtype=False,
+                                          check_index_type=False, check_column_type=False)
+        except AssertionError as exc:
+            raise AssertionError(f"{engine_name}: '{key}' differs from pandas\n{exc}") from None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--engines', nargs='+', default=['pandas', 'polars', 'duckdb'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    start, end = date(2025, 10, 1), date(2025, 12, 31)
+    regions = REGIONS[:3]
+
+    for rows in args.rows:
+        expected = pipeline(get_engine('pandas'), make_sales(rows), start, end, regions)
+        print(f"\n{rows:,} rows")
+        for name in args.engines:
+            engine = get_engine(name)
+            df = make_sales(rows)
+            t0 = time.perf_counter()
+            engine.prepare(df)
+            convert = time.perf_counter() - t0
+            check_parity(expected, pipeline(engine, df, start, end, regions), name)
+            timings = []
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                pipeline(engine, df, start, end, regions)
+                timings.append(time.perf_counter() - t0)
+            print(f"  {name:<8} parity ok   convert {convert:7.3f}s   "
+                  f"best {min(timings):7.3f}s   mean {np.mean(timings):7.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Cold-start benchmark for the Streamlit entry points.
+
+Each entry point runs in a fresh interpreter (like a new autoscaled
+replica) through ``streamlit.testing.v1.AppTest``.  For every script it
+reports the time spent importing modules the script itself pulled in
+(measured with ``-X importtime`` after the test harness is loaded), the
+time to the first complete render, and which heavy modules got loaded.
+
+    python bench_startup.py
+    python bench_startup.py app.py st_page02.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+ENTRY_POINTS = ['app.py', 'st_page.py', 'st_page01.py', 'st_page02.py', 'st_sidebar.py']
+HEAVY_MODULES = ['pandas', 'numpy', 'plotly.express', 'plotly.graph_objects', 'pyarrow']
+MARKER = "--- bench_startup: harness ready ---"
+
+CHILD = r'''
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+print({marker!r}, file=sys.stderr, flush=True)
+at = AppTest.from_file({path!r}, default_timeout=300)
+t0 = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - t0
+print(json.dumps({{
+    "first_render": elapsed,
+    "exceptions": len(at.exception),
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+'''
+
+
+def measure(path):
+    code = CHILD.format(marker=MARKER, path=os.path.abspath(path), heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    # importtime lines: "import time: <self us> | <cumulative us> | <name>"
+    import_us = 0
+    seen_marker = False
+    for line in proc.stderr.splitlines():
+        if line == MARKER:
+            seen_marker = True
+        elif seen_marker and line.startswith('import time:'):
+            fields = line.split('|')
+            try:
+                import_us += int(fields[0].split(':')[1])
+            except ValueError:
+                continue  # header line
+    result['imports'] = import_us / 1e6
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold-start import time and time-to-first-render.")
+    parser.add_argument('entries', nargs='*', default=ENTRY_POINTS)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'entry point':<16}{'imports':>10}{'first render':>15}   heavy modules loaded")
+    for entry in args.entries:
+        runs = [measure(entry) for _ in range(args.repeat)]
+        imports = statistics.median(r['imports'] for r in runs)
+        render = statistics.median(r['first_render'] for r in runs)
+        loaded = ', '.join(runs[-1]['loaded']) or '-'
+        errors = f"   ({runs[-1]['exceptions']} exceptions)" if runs[-1]['exceptions'] else ''
+        print(f"{entry:<16}{imports:>9.3f}s{render:>14.3f}s   {loaded}{errors}")
+
+
+if __name__ == '__main__':
+    main()
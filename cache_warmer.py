@@ -0,0 +1,94 @@
+"""Background warm-up of the caches that the first visitors would otherwise fill.
+
+``start(entries)`` is cached with ``st.cache_resource``, so the first script
+run of a server process starts one daemon thread that calls every entry in
+turn; the run itself continues immediately.  Each entry point passes the
+entries it will look up itself (``SAMPLE_ENTRIES`` for the component
+gallery, ``DASHBOARD_ENTRIES`` for the dashboard), so a replica never warms
+data its app does not use.  Entries are ``("module:function", [args...])``
+pairs and can be replaced with the ``CACHE_WARM_ENTRIES`` environment
+variable (the same list as JSON).  ``CACHE_WARMER=0`` turns the warmer off.
+"""
+import importlib
+import json
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# app.py (component gallery)
+SAMPLE_ENTRIES = [
+    ("assets:ensure_all", []),
+    ("sample_data:generate_sample_data", [1000]),
+    ("sample_data:generate_timeseries_data", []),
+    ("sample_data:expensive_computation", [100]),
+]
+
+# st_page02.py; the forecast backtest is left to the first AI Predictions visit
+DASHBOARD_ENTRIES = [
+    ("assets:ensure_all", []),
+    ("dashboard_data:generate_sales_data", []),
+    ("dashboard_data:generate_customer_data", []),
+    ("dashboard_data:generate_inventory_data", []),
+    ("dashboard_data:warm_default_views", []),
+]
+
+
+def configured_entries(entries):
+    raw = os.environ.get('CACHE_WARM_ENTRIES')
+    return [tuple(entry) for entry in json.loads(raw)] if raw else [tuple(entry) for entry in entries]
+
+
+class CacheWarmer:
+    def __init__(self, entries):
+        self.entries = entries
+        self.done = 0
+        self.current = None
+        self.errors = []
+        self.elapsed = None
+        self.finished = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="cache-warmer", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        t0 = time.perf_counter()
+        for target, args in self.entries:
+            self.current = target
+            try:
+                module, name = target.split(':')
+                getattr(importlib.import_module(module), name)(*args)
+            except Exception as exc:
+                logger.warning("Cache warm-up of %s failed: %s", target, exc)
+                self.errors.append((target, repr(exc)))
+            self.done += 1
+            logger.info("Cache warm-up %d/%d: %s", self.done, len(self.entries), target)
+        self.current = None
+        self.elapsed = time.perf_counter() - t0
+        self.finished.set()
+
+    @property
+    def fraction(self):
+        return self.done / len(self.entries) if self.entries else 1.0
+
+
+@st.cache_resource
+def start(entries):
+    """Start a warmer for ``entries`` once per server process (None when disabled)."""
+    if os.environ.get('CACHE_WARMER', '1') == '0':
+        return None
+    return CacheWarmer(configured_entries(entries)).start()
+
+
+def show_status(warmer):
+    """Warm-up progress bar, shown only while the warmer is running."""
+    if warmer is None or warmer.finished.is_set():
+        return
+    st.progress(warmer.fraction, text=f"Warming caches: {warmer.current or 'starting'} "
+                                      f"({warmer.done}/{len(warmer.entries)})")
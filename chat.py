@@ -0,0 +1,111 @@
+"""Chat backends and a bounded chat history.
+
+Backends turn the conversation so far into a stream of text chunks, which
+pages hand to ``st.write_stream`` so the first words show up immediately.
+``CHAT_BACKEND`` picks one from ``BACKENDS``; ``echo`` is a local stand-in
+model that needs no network access.
+
+``ChatHistory`` keeps the last ``CHAT_MAX_MESSAGES`` messages in memory and
+appends older ones to a per-conversation JSONL file under
+``CHAT_HISTORY_DIR``, so long conversations neither grow the session nor
+re-render every message on each rerun.  Files left behind by sessions that
+ended without clearing are pruned whenever a history is created, once they
+have not been written to for ``CHAT_HISTORY_MAX_AGE_HOURS``.
+"""
+import json
+import os
+import time
+import uuid
+from collections import deque
+
+
+HISTORY_DIR = os.environ.get('CHAT_HISTORY_DIR', os.path.join('.cache', 'chat'))
+MAX_MESSAGES = int(os.environ.get('CHAT_MAX_MESSAGES', 50))
+MAX_AGE_SECONDS = float(os.environ.get('CHAT_HISTORY_MAX_AGE_HOURS', 24)) * 3600
+
+
+class EchoBackend:
+    """Replies by echoing the last user message, one word at a time."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+
+    def stream(self, messages):
+        last = next((m['content'] for m in reversed(messages) if m['role'] == 'user'), '')
+        words = f"Echo: {last}".split(' ')
+        for i, word in enumerate(words):
+            if self.delay:
+                time.sleep(self.delay)
+            yield word if i == len(words) - 1 else word + ' '
+
+
+BACKENDS = {
+    'echo': EchoBackend,
+}
+
+
+def get_backend(name=None):
+    name = name or os.environ.get('CHAT_BACKEND', 'echo')
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown chat backend {name!r}; choose one of {sorted(BACKENDS)}")
+    return BACKENDS[name]()
+
+
+def prune(directory=HISTORY_DIR, max_age=MAX_AGE_SECONDS):
+    """Remove history files idle for over ``max_age`` seconds."""
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.name.endswith('.jsonl')]
+    except FileNotFoundError:
+        return 0
+    files = []
+    for entry in entries:
+        try:
+            files.append((entry.stat().st_mtime, entry.path))
+        except FileNotFoundError:
+            pass  # removed by another session
+    cutoff = time.time() - max_age
+    stale = [path for mtime, path in files if mtime < cutoff]
+    for path in stale:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    return len(stale)
+
+
+class ChatHistory:
+    def __init__(self, max_messages=MAX_MESSAGES, directory=HISTORY_DIR):
+        prune(directory)
+        self.recent = deque(maxlen=max_messages)
+        self.path = os.path.join(directory, f"{uuid.uuid4().hex}.jsonl")
+        self.paged = 0
+
+    def append(self, role, content):
+        if len(self.recent) == self.recent.maxlen:
+            self._page_out(self.recent[0])
+        self.recent.append({'role': role, 'content': content})
+
+    def _page_out(self, message):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(message) + '\n')
+        self.paged += 1
+
+    def older(self, limit=50):
+        """The last ``limit`` paged-out messages, oldest first."""
+        if not self.paged:
+            return []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return [json.loads(line) for line in deque(f, maxlen=limit)]
+        except FileNotFoundError:
+            return []  # pruned while this session was idle
+
+    def clear(self):
+        self.recent.clear()
+        self.paged = 0
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __len__(self):
+        return self.paged + len(self.recent)
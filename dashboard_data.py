@@ -0,0 +1,185 @@
+"""Cached datasets and derived views of the enterprise dashboard (st_page02.py).
+
+They live in a module rather than in the page script so the cache warmer
+can precompute exactly the cache entries the page will look up.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from backtesting import BacktestJob, daily_series
+from disk_cache import persistent_cache
+from kpi_index import SOURCE_COLUMNS as KPI_COLUMNS, KPIIndex
+from sales_store import SalesStore
+from segmentation import segment_customers
+from streaming_stats import StreamingStats
+
+
+DEFAULT_DAYS = 90
+SUMMARY_COLUMNS = ['Sales', 'Units', 'Cost', 'Customer_Satisfaction', 'Returns']
+
+
+def sales_rows(dates):
+    """Random sales for every region and product on each of ``dates``."""
+    regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
+    products = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
+    
+    data = []
+    for date in dates:
+        for region in regions:
+            for product in products:
+                data.append({
+                    'Date': date,
+                    'Region': region,
+                    'Product': product,
+                    'Sales': np.random.randint(1000, 50000),
+                    'Units': np.random.randint(10, 500),
+                    'Cost': np.random.randint(500, 30000),
+                    'Customer_Satisfaction': round(np.random.uniform(3.5, 5.0), 2),
+                    'Returns': np.random.randint(0, 50)
+                })
+    
+    return pd.DataFrame(data)
+
+
+# Generate realistic data
+@st.cache_data
+@persistent_cache(daily=True, depends=[sales_rows])
+def generate_sales_data():
+    return sales_rows(pd.date_range(end=datetime.now(), periods=365, freq='D'))
+
+
+@st.cache_data
+@persistent_cache
+def generate_customer_data():
+    segments = ['Enterprise', 'Mid-Market', 'SMB', 'Startup']
+    industries = ['Technology', 'Healthcare', 'Finance', 'Retail', 'Manufacturing']
+    
+    data = []
+    for i in range(500):
+        data.append({
+            'Customer_ID': f'CUST{i:04d}',
+            'Company': f'Company {i}',
+            'Segment': np.random.choice(segments),
+            'Industry': np.random.choice(industries),
+            'Annual_Revenue': np.random.randint(50000, 5000000),
+            'Employees': np.random.randint(10, 10000),
+            'Contract_Value': np.random.randint(5000, 500000),
+            'Churn_Risk': np.random.choice(['Low', 'Medium', 'High'], p=[0.6, 0.3, 0.1]),
+            'NPS_Score': np.random.randint(0, 100),
+            'Account_Age_Days': np.random.randint(30, 1825)
+        })
+    
+    return pd.DataFrame(data)
+
+
+@st.cache_data
+@persistent_cache(daily=True)
+def generate_inventory_data():
+    warehouses = ['WH-NY', 'WH-LA', 'WH-CHI', 'WH-HOU', 'WH-PHX']
+    products = [f'SKU-{i:04d}' for i in range(50)]
+    
+    data = []
+    for warehouse in warehouses:
+        for product in products:
+            data.append({
+                'Warehouse': warehouse,
+                'SKU': product,
+                'Stock': np.random.randint(0, 1000),
+                'Reorder_Point': np.random.randint(50, 200),
+                'Lead_Time_Days': np.random.randint(7, 30),
+                'Unit_Cost': round(np.random.uniform(10, 500), 2),
+                'Last_Restocked': datetime.now() - timedelta(days=np.random.randint(1, 60))
+            })
+    
+    return pd.DataFrame(data)
+
+
+_sales_store = SalesStore(loader=generate_sales_data)
+
+
+def sales_store():
+    """The partitioned sales table.
+
+    Written from ``generate_sales_data`` on first use; days since the last
+    stored one are appended to the current month's partition.
+    """
+    store = _sales_store.ensure()
+    last = store.max_date()
+    new_days = pd.date_range(last + pd.Timedelta(days=1), datetime.now(), freq='D') if last is not None else []
+    if len(new_days):
+        store.append(sales_rows(new_days))
+    return store
+
+
+def read_sales(columns, start, end, regions):
+    """Filtered sales rows, reading only ``columns`` (None: all) of the overlapping partitions."""
+    return _read_sales(sales_store().version, columns, start, end, regions)
+
+
+@st.cache_data(max_entries=64)
+def _read_sales(version, columns, start, end, regions):
+    return sales_store().read(columns, start, end, regions)
+
+
+def sales_regions():
+    return list(sales_store().distinct('Region'))
+
+
+def sales_stats(start, end, regions):
+    """One-pass summary statistics of the filtered sales data."""
+    return _sales_stats(sales_store().version, start, end, tuple(regions))
+
+
+@st.cache_data(max_entries=64)
+def _sales_stats(version, start, end, regions):
+    df = read_sales(tuple(SUMMARY_COLUMNS), start, end, regions)
+    return StreamingStats.from_frame(df, SUMMARY_COLUMNS)
+
+
+def kpi_index():
+    """Running sums of the daily sales totals per region, for date-range KPIs."""
+    return _kpi_index(sales_store().version)
+
+
+@st.cache_data(max_entries=4)
+def _kpi_index(version):
+    return KPIIndex(read_sales(tuple(KPI_COLUMNS), None, None, None))
+
+
+def forecast_backtest():
+    """Backtest of the forecast models on the stored sales, running in the background."""
+    return _forecast_backtest(sales_store().version)
+
+
+@st.cache_resource(max_entries=1)
+def _forecast_backtest(version):
+    df = read_sales(('Date', 'Region', 'Product', 'Sales'), None, None, None)
+    return BacktestJob(daily_series(df)).start()
+
+
+def reset_sales():
+    """Drop the stored sales table and the backtest of it (st.cache_resource outlives st.cache_data.clear)."""
+    _sales_store.invalidate()
+    _forecast_backtest.clear()
+
+
+@st.cache_data
+def customer_clusters(k, seed=0):
+    """k-means clusters of the customer base, cached per parameter set."""
+    return segment_customers(generate_customer_data(), k=k, seed=seed)
+
+
+def default_date_range():
+    """The sidebar's initial "Date Range" value."""
+    return (datetime.now() - timedelta(days=DEFAULT_DAYS)).date(), datetime.now().date()
+
+
+def warm_default_views():
+    """Compute the views the dashboard shows before any filter is touched."""
+    regions = sales_regions()
+    sales_stats(*default_date_range(), regions)
+    kpi_index()
+    customer_clusters(4)
@@ -0,0 +1,149 @@
+"""Chunked, deterministic synthetic data generation for load testing.
+
+The date range is split into fixed-size chunks and every chunk draws from
+its own ``np.random.Generator``, spawned from one ``SeedSequence`` by chunk
+index.  The output therefore only depends on ``seed`` and ``chunk_days`` and
+is identical whether it is produced by one worker or by a whole process
+pool.  Chunks are written straight to Parquet (one file per chunk) when an
+output directory is given.
+
+    python data_generation.py sales --rows 10000000 --workers 8 --out data/sales
+    python data_generation.py sample --rows 50000000 --out data/sample
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from progress import null_progress
+
+
+REGIONS = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
+PRODUCTS = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
+CATEGORIES = ['A', 'B', 'C', 'D']
+STATUSES = ['Active', 'Inactive', 'Pending']
+
+
+def _sales_chunk(rng, dates, rows_per_day):
+    # Same columns and distributions as st_page02.generate_sales_data; every
+    # day cycles through the Region x Product grid.
+    n = len(dates) * rows_per_day
+    combos = len(REGIONS) * len(PRODUCTS)
+    combo = np.tile(np.arange(rows_per_day) % combos, len(dates))
+    return pd.DataFrame({
+        'Date': np.repeat(dates.values, rows_per_day),
+        'Region': pd.Categorical.from_codes(combo // len(PRODUCTS), REGIONS),
+        'Product': pd.Categorical.from_codes(combo % len(PRODUCTS), PRODUCTS),
+        'Sales': rng.integers(1000, 50000, n),
+        'Units': rng.integers(10, 500, n),
+        'Cost': rng.integers(500, 30000, n),
+        'Customer_Satisfaction': rng.uniform(3.5, 5.0, n).round(2),
+        'Returns': rng.integers(0, 50, n),
+    })
+
+
+def _sample_chunk(rng, dates, rows_per_day):
+    # Same columns as app.generate_sample_data. The 'value' random walk is
+    # anchored at 100 at the start of every chunk so chunks stay independent.
+    n = len(dates) * rows_per_day
+    offsets = pd.to_timedelta(np.tile(np.arange(rows_per_day) * (86400 / rows_per_day), len(dates)), unit='s')
+    return pd.DataFrame({
+        'timestamp': np.repeat(dates.values, rows_per_day) + offsets.values,
+        'category': pd.Categorical.from_codes(rng.integers(0, len(CATEGORIES), n), CATEGORIES),
+        'value': rng.standard_normal(n).cumsum() + 100,
+        'count': rng.integers(1, 100, n),
+        'temperature': rng.normal(25, 5, n),
+        'humidity': rng.uniform(30, 90, n),
+        'status': pd.Categorical.from_codes(rng.integers(0, len(STATUSES), n), STATUSES),
+        'latitude': rng.uniform(40.7, 40.8, n),
+        'longitude': rng.uniform(-74.0, -73.9, n),
+        'score': rng.uniform(0, 100, n),
+    })
+
+
+GENERATORS = {
+    'sales': _sales_chunk,
+    'sample': _sample_chunk,
+}
+
+
+def _run_chunk(task):
+    kind, index, seed_seq, dates, rows_per_day, out_dir = task
+    frame = GENERATORS[kind](np.random.default_rng(seed_seq), dates, rows_per_day)
+    if out_dir is None:
+        return frame
+    path = os.path.join(out_dir, f'part-{index:05d}.parquet')
+    frame.to_parquet(path, index=False)
+    return path
+
+
+def plan_chunks(start, days, chunk_days):
+    """Split ``days`` daily periods from ``start`` into consecutive chunks."""
+    dates = pd.date_range(start=pd.Timestamp(start).normalize(), periods=days, freq='D')
+    return [dates[i:i + chunk_days] for i in range(0, days, chunk_days)]
+
+
+def generate(kind, start, days, rows_per_day, chunk_days=31, seed=42, workers=None, out_dir=None,
+             progress=None):
+    """Generate a ``kind`` dataset ('sales' or 'sample') chunk by chunk.
+
+    Returns the concatenated DataFrame, or the list of written Parquet
+    files when ``out_dir`` is given.  ``progress`` is called with the
+    fraction of chunks completed.
+    """
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown dataset {kind!r}; choose one of {sorted(GENERATORS)}")
+    chunks = plan_chunks(start, days, chunk_days)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    tasks = [(kind, i, seeds[i], dates, rows_per_day, out_dir) for i, dates in enumerate(chunks)]
+
+    progress = progress or null_progress
+    results = [None] * len(tasks)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) == 1:
+        for i, task in enumerate(tasks):
+            results[i] = _run_chunk(task)
+            progress((i + 1) / len(tasks), f"Generated chunk {i + 1}/{len(tasks)}")
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            futures = {pool.submit(_run_chunk, task): task[1] for task in tasks}
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                progress(done / len(tasks), f"Generated chunk {done}/{len(tasks)}")
+
+    if out_dir is not None:
+        return results
+    return pd.concat(results, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate large synthetic datasets in parallel.")
+    parser.add_argument('kind', choices=sorted(GENERATORS))
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--start', default='2025-01-01')
+    parser.add_argument('--chunk-days', type=int, default=31)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--out', required=True, help="output directory for the Parquet chunks")
+    args = parser.parse_args()
+
+    rows_per_day = math.ceil(args.rows / args.days)
+    t0 = time.perf_counter()
+    paths = generate(args.kind, args.start, args.days, rows_per_day,
+                     chunk_days=args.chunk_days, seed=args.seed,
+                     workers=args.workers, out_dir=args.out)
+    elapsed = time.perf_counter() - t0
+    total = rows_per_day * args.days
+    print(f"Wrote {total:,} rows in {len(paths)} chunks to {args.out} "
+          f"in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""Persistent on-disk cache tier that survives server restarts.
+
+``@st.cache_data`` only lives as long as the server process.  Stacking
+``@persistent_cache`` underneath it makes a cold process look on disk
+before recomputing:
+
+    @st.cache_data
+    @persistent_cache
+    def generate_sales_data():
+        ...
+
+Entries are keyed by the function's qualified name, a hash of its source
+code (so editing the function invalidates its entries) and its arguments.
+Helpers whose edits should invalidate the entries too are declared with
+``depends``; their source is hashed alongside:
+
+    @persistent_cache(depends=[sales_rows])
+    def generate_sales_data():
+        return sales_rows(...)
+
+Values are stored with pickle protocol 5 and the directory is kept below
+``DISK_CACHE_MAX_MB`` by evicting the least recently used entries.
+
+Functions whose result depends on the current date (data "for the last
+365 days") use ``@persistent_cache(daily=True)``, which adds today's date
+to the key; ``ttl`` (seconds or a ``timedelta``) expires entries by age.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+
+CACHE_DIR = os.environ.get("DISK_CACHE_DIR", os.path.join(".cache", "disk_cache"))
+MAX_BYTES = int(float(os.environ.get("DISK_CACHE_MAX_MB", "512")) * 1024 * 1024)
+SUFFIX = ".pkl"
+
+_lock = threading.Lock()
+
+
+def _source_hash(func):
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def _entries(directory):
+    try:
+        with os.scandir(directory) as it:
+            return [(e.path, e.stat()) for e in it if e.name.endswith(SUFFIX)]
+    except FileNotFoundError:
+        return []
+
+
+def evict(directory=CACHE_DIR, max_bytes=MAX_BYTES):
+    """Delete least recently used entries until the cache fits ``max_bytes``."""
+    with _lock:
+        entries = sorted(_entries(directory), key=lambda e: e[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+
+
+def clear(directory=CACHE_DIR):
+    """Remove every entry from the cache directory."""
+    with _lock:
+        for path, _ in _entries(directory):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def persistent_cache(func=None, *, directory=None, max_bytes=None, ttl=None, daily=False, depends=()):
+    """Decorator persisting ``func``'s return values in ``directory``.
+
+    Entries older than ``ttl`` are recomputed; with ``daily`` they are only
+    reused on the day they were written.  Editing ``func`` or any function
+    in ``depends`` starts a new set of entries.
+    """
+    if func is None:
+        return functools.partial(persistent_cache, directory=directory, max_bytes=max_bytes, ttl=ttl,
+                                 daily=daily, depends=depends)
+
+    if isinstance(ttl, timedelta):
+        ttl = ttl.total_seconds()
+    directory = directory or CACHE_DIR
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    prefix = f"{func.__module__}.{func.__qualname__}".replace("<", "").replace(">", "")
+    func_hash = _source_hash(func)
+    if depends:
+        combined = ''.join([func_hash, *(_source_hash(dependency) for dependency in depends)])
+        func_hash = hashlib.sha256(combined.encode()).hexdigest()[:16]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            day = date.today().isoformat() if daily else None
+            arg_bytes = pickle.dumps((args, sorted(kwargs.items()), day), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return func(*args, **kwargs)
+        key = hashlib.sha256(arg_bytes).hexdigest()[:32]
+        path = os.path.join(directory, f"{prefix}-{func_hash}-{key}{SUFFIX}")
+
+        try:
+            with open(path, "rb") as f:
+                created, value = pickle.load(f)
+            if ttl is None or time.time() - created <= ttl:
+                os.utime(path)  # mark as recently used for LRU eviction
+                return value
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Truncated or stale entry: drop it and recompute.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        value = func(*args, **kwargs)
+        tmp = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                # The write time is stored with the value: mtime tracks last use
+                pickle.dump((time.time(), value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # The cache is best effort; never fail the caller over it.
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+            return value
+        evict(directory, max_bytes)
+        return value
+
+    return wrapper
@@ -0,0 +1,90 @@
+"""Forecast models behind the AI Predictions "Sales Forecast" tab.
+
+All models work on a daily series and only need NumPy:
+
+- ``Linear``: least-squares trend line.
+- ``Exponential``: Holt's double exponential smoothing (level + trend).
+- ``Prophet``: Prophet's additive trend + weekly seasonality, without its
+  changepoints or yearly term: least-squares trend plus day-of-week effects.
+  The ``prophet`` package itself is not needed.
+"""
+import numpy as np
+import pandas as pd
+
+from progress import null_progress
+
+
+MODELS = ["Linear", "Exponential", "Prophet"]
+Z_SCORES = {80: 1.2816, 90: 1.6449, 95: 1.9600, 99: 2.5758}
+
+
+def _linear(y, horizon, progress):
+    t = np.arange(len(y))
+    slope, intercept = np.polyfit(t, y, 1)
+    progress(0.8)
+    fitted = intercept + slope * t
+    future = intercept + slope * np.arange(len(y), len(y) + horizon)
+    return future, y - fitted
+
+
+def _exponential(y, horizon, progress, alpha=0.3, beta=0.1):
+    level, trend = y[0], (y[min(7, len(y) - 1)] - y[0]) / max(min(7, len(y) - 1), 1)
+    residuals = np.empty(len(y))
+    step = max(len(y) // 20, 1)
+    for i, value in enumerate(y):
+        residuals[i] = value - (level + trend)
+        prev_level = level
+        level = alpha * value + (1 - alpha) * (level + trend)
+        trend = beta * (level - prev_level) + (1 - beta) * trend
+        if i % step == 0:
+            progress(0.9 * i / len(y))
+    future = level + trend * np.arange(1, horizon + 1)
+    return future, residuals
+
+
+def _additive(y, horizon, progress, period=7):
+    n = len(y)
+    t = np.arange(n + horizon)
+    season = np.eye(period)[t % period][:, 1:]  # day-of-week dummies, first day as baseline
+    design = np.column_stack([np.ones(n + horizon), t, season])
+    coef, *_ = np.linalg.lstsq(design[:n], y, rcond=None)
+    progress(0.8)
+    fitted = design @ coef
+    return fitted[n:], y - fitted[:n]
+
+
+_FITTERS = {
+    "Linear": _linear,
+    "Exponential": _exponential,
+    "Prophet": _additive,
+}
+
+
+def predict(values, horizon, model="Linear", progress=None):
+    """Forecast ``horizon`` steps after ``values``; returns (forecast, residual std)."""
+    if model not in _FITTERS:
+        raise ValueError(f"Unknown model {model!r}; choose one of {MODELS}")
+    progress = progress or null_progress
+    y = np.asarray(values, dtype=float)
+    if len(y) < 2:
+        raise ValueError("At least two observations are needed to fit a forecast")
+    forecast, residuals = _FITTERS[model](y, horizon, progress)
+    progress(1.0)
+    return forecast, float(np.std(residuals))
+
+
+def fit_forecast(history, horizon, model="Linear", confidence=95, progress=None):
+    """Forecast a daily ``history`` series (indexed by date) ``horizon`` days ahead.
+
+    Returns a frame with Date, Forecast, Lower_Bound and Upper_Bound, the
+    bounds being the ``confidence`` % interval from the in-sample residuals.
+    """
+    forecast, sigma = predict(history.values, horizon, model=model, progress=progress)
+    margin = Z_SCORES.get(confidence, 1.96) * sigma
+    future_dates = pd.date_range(start=history.index.max() + pd.Timedelta(days=1), periods=horizon, freq='D')
+    return pd.DataFrame({
+        'Date': future_dates,
+        'Forecast': forecast,
+        'Upper_Bound': forecast + margin,
+        'Lower_Bound': forecast - margin,
+    })
@@ -0,0 +1,172 @@
+"""Rules that turn the current data into alerts and recommendations.
+
+Rules are declared as data: the inputs they read, a vectorised measure,
+and either a threshold (``ThresholdRule``) or a ranking (``RankingRule``).
+``InsightsEngine.evaluate`` is given the input frames (or loaders for
+them) together with a version string for each one, and only re-evaluates
+rules whose input versions changed since the last call.
+"""
+import operator
+
+import pandas as pd
+
+
+PRIORITY_ORDER = {'High': 0, 'Medium': 1, 'Low': 2}
+GROWTH_DAYS = 30
+
+OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+}
+
+
+def insight(title, description, priority='Medium', icon='💡', level='info'):
+    return {'title': title, 'description': description, 'priority': priority, 'icon': icon, 'level': level}
+
+
+class ThresholdRule:
+    """Fires when ``measure(*inputs) <op> threshold``."""
+
+    def __init__(self, name, inputs, measure, op, threshold, title, message, priority='Medium', icon='💡',
+                 level='warning'):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.measure = measure
+        self.op = OPERATORS[op]
+        self.threshold = threshold
+        self.title = title
+        self.message = message
+        self.priority = priority
+        self.icon = icon
+        self.level = level
+
+    def evaluate(self, *frames):
+        value = self.measure(*frames)
+        if not self.op(value, self.threshold):
+            return []
+        priority = self.priority(value) if callable(self.priority) else self.priority
+        return [insight(self.title, self.message.format(value=value), priority, self.icon, self.level)]
+
+
+class RankingRule:
+    """Reports the ``top`` entries of the Series ``measure(*inputs)``.
+
+    Only entries passing ``keep`` (if given) are reported; ``ascending``
+    ranks from the smallest value instead of the largest.
+    """
+
+    def __init__(self, name, inputs, measure, title, message, top=1, ascending=False, keep=None,
+                 priority='Medium', icon='💡', level='info'):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.measure = measure
+        self.title = title
+        self.message = message
+        self.top = top
+        self.ascending = ascending
+        self.keep = keep
+        self.priority = priority
+        self.icon = icon
+        self.level = level
+
+    def evaluate(self, *frames):
+        values = self.measure(*frames).dropna()
+        if self.keep is not None:
+            values = values[self.keep(values)]
+        values = values.sort_values(ascending=self.ascending).head(self.top)
+        results = []
+        for key, value in values.items():
+            priority = self.priority(value) if callable(self.priority) else self.priority
+            results.append(insight(self.title, self.message.format(key=key, value=value), priority,
+                                   self.icon, self.level))
+        return results
+
+
+class InsightsEngine:
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._results = {}  # rule name -> (input versions, insights)
+
+    def evaluate(self, data, versions):
+        """Insights for ``data`` (name -> DataFrame), most urgent first.
+
+        A value in ``data`` may be a callable returning the frame; it is only
+        called if a rule reading it has to be re-evaluated.
+        """
+        loaded = {}
+
+        def frame(name):
+            if name not in loaded:
+                loaded[name] = data[name]() if callable(data[name]) else data[name]
+            return loaded[name]
+
+        found = []
+        for rule in self.rules:
+            key = tuple(versions[name] for name in rule.inputs)
+            cached = self._results.get(rule.name)
+            if cached is None or cached[0] != key:
+                cached = (key, rule.evaluate(*(frame(name) for name in rule.inputs)))
+                self._results[rule.name] = cached
+            found.extend(cached[1])
+        return sorted(found, key=lambda item: PRIORITY_ORDER.get(item['priority'], len(PRIORITY_ORDER)))
+
+
+# Measures over the dashboard data
+
+def growth_window(end, days=GROWTH_DAYS):
+    """First and last calendar day of the sales rows the growth rules compare.
+
+    That is the ``days`` up to ``end`` and the ``days`` before them, whatever
+    start date the page filters on, so neither period is cut short.
+    """
+    end = pd.Timestamp(end)
+    return (end - pd.Timedelta(days=2 * days - 1)).date(), end.date()
+
+
+def _period_change(df, column, by=None, days=GROWTH_DAYS, how='sum'):
+    """Relative change of ``column`` over the last ``days`` days vs the ``days`` before.
+
+    NaN (no entries with ``by``) when the rows do not cover both periods.
+    """
+    end = df['Date'].max()
+    if df.empty or df['Date'].min() > end - pd.Timedelta(days=2 * days - 1):
+        return pd.Series(dtype=float) if by else float('nan')
+    recent = df[df['Date'] > end - pd.Timedelta(days=days)]
+    previous = df[(df['Date'] <= end - pd.Timedelta(days=days)) & (df['Date'] > end - pd.Timedelta(days=2 * days))]
+    if by:
+        return recent.groupby(by)[column].agg(how) / previous.groupby(by)[column].agg(how) - 1
+    return recent[column].agg(how) / previous[column].agg(how) - 1
+
+
+def low_stock_count(inventory):
+    return int((inventory['Stock'] < inventory['Reorder_Point']).sum())
+
+
+def high_value_churn_count(customers):
+    high_value = customers['Contract_Value'] >= customers['Contract_Value'].quantile(0.75)
+    return int((high_value & (customers['Churn_Risk'] == 'High')).sum())
+
+
+DASHBOARD_RULES = [
+    ThresholdRule('low_stock', ['inventory'], low_stock_count, '>', 0,
+                  "Inventory Alert", "{value} items below reorder point",
+                  priority=lambda n: 'High' if n > 20 else 'Medium', icon='📊'),
+    ThresholdRule('high_value_churn', ['customers'], high_value_churn_count, '>', 0,
+                  "Customer Retention", "{value} high-value customers at churn risk",
+                  priority='High', icon='⚠️', level='error'),
+    ThresholdRule('sales_growth', ['sales'], lambda s: _period_change(s, 'Sales'), '>=', 0,
+                  "Sales Momentum", "Revenue up {value:.1%} on the previous 30 days",
+                  priority='Low', icon='✅', level='success'),
+    ThresholdRule('sales_decline', ['sales'], lambda s: _period_change(s, 'Sales'), '<', 0,
+                  "Sales Slowdown", "Revenue changed {value:+.1%} on the previous 30 days",
+                  priority='High', icon='📉'),
+    RankingRule('regional_growth', ['sales'], lambda s: _period_change(s, 'Sales', by='Region'),
+                "Market Opportunity", "{key} shows {value:.1%} growth over the last 30 days",
+                keep=lambda v: v > 0, priority=lambda g: 'High' if g > 0.1 else 'Medium', icon='🌏'),
+    RankingRule('product_satisfaction', ['sales'],
+                lambda s: _period_change(s, 'Customer_Satisfaction', by='Product', how='mean'),
+                "Product Optimization", "{key} satisfaction changed {value:+.1%} over the last 30 days",
+                ascending=True, keep=lambda v: v < 0, icon='📦'),
+]
@@ -0,0 +1,74 @@
+"""Prefix sums of daily sales totals for constant-time date-range KPIs.
+
+``KPIIndex`` aggregates the sales table once into daily totals per region
+and keeps their running sums, with a leading zero day, so the total of any
+measure over days ``[a, b]`` is ``cumulative[b + 1] - cumulative[a]``: two
+lookups per region whatever the length of the range.  The same-length
+period just before a range costs two more, which is what makes real
+period-over-period deltas free.
+
+Averages are served as ratios of sums (``Customer_Satisfaction`` is summed
+alongside the ``Rows`` count).
+"""
+import numpy as np
+import pandas as pd
+
+
+MEASURES = ['Sales', 'Units', 'Cost', 'Profit', 'Customer_Satisfaction', 'Rows']
+SOURCE_COLUMNS = ['Date', 'Region', 'Sales', 'Units', 'Cost', 'Customer_Satisfaction']
+
+
+class KPIIndex:
+    def __init__(self, df):
+        days = df['Date'].dt.normalize()
+        daily = (df.assign(Date=days, Profit=df['Sales'] - df['Cost'], Rows=1)
+                 .groupby(['Region', 'Date'])[MEASURES].sum())
+        self.start = days.min()
+        self.days = (days.max() - self.start).days + 1
+        self.regions = list(daily.index.levels[0])
+
+        region_codes = daily.index.codes[0]
+        day_offsets = (daily.index.get_level_values('Date') - self.start).days
+        totals = np.zeros((len(self.regions), self.days, len(MEASURES)))
+        totals[region_codes, day_offsets] = daily.to_numpy(dtype=np.float64)
+        # cumulative[r, d] = totals of region r over the first d days
+        self.cumulative = np.zeros((len(self.regions), self.days + 1, len(MEASURES)))
+        np.cumsum(totals, axis=1, out=self.cumulative[:, 1:])
+
+    def _offset(self, day):
+        return (pd.Timestamp(day).normalize() - self.start).days
+
+    def totals(self, start, end, regions=None):
+        """Measure totals over the calendar days start..end in ``regions`` (None: all)."""
+        first = min(max(self._offset(start), 0), self.days)
+        last = min(max(self._offset(end) + 1, first), self.days)
+        rows = [self.regions.index(r) for r in (self.regions if regions is None else regions)
+                if r in self.regions]
+        sums = (self.cumulative[rows, last] - self.cumulative[rows, first]).sum(axis=0)
+        return pd.Series(sums, index=MEASURES)
+
+    def covers(self, start, end):
+        return self._offset(start) >= 0 and self._offset(end) < self.days
+
+    def period_over_period(self, start, end, regions=None):
+        """Totals over start..end and over the same number of days just before.
+
+        The previous totals are NaN when that period reaches before the data.
+        """
+        length = pd.Timestamp(end) - pd.Timestamp(start) + pd.Timedelta(days=1)
+        previous_start, previous_end = pd.Timestamp(start) - length, pd.Timestamp(start) - pd.Timedelta(days=1)
+        current = self.totals(start, end, regions)
+        if not self.covers(previous_start, previous_end):
+            return current, pd.Series(np.nan, index=MEASURES)
+        return current, self.totals(previous_start, previous_end, regions)
+
+
+def change(current, previous):
+    """Relative change formatted for ``st.metric`` deltas (None when unknown).
+
+    Measured against ``abs(previous)``, so a rise from a negative value
+    (e.g. a loss shrinking) shows as an increase.
+    """
+    if not previous or np.isnan(previous):
+        return None
+    return f"{(current - previous) / abs(previous):+.1%}"
@@ -0,0 +1,33 @@
+"""Deferred imports for heavy modules.
+
+    px = lazy_import("plotly.express")
+
+binds ``px`` to a placeholder module; the real ``plotly.express`` is only
+imported the first time an attribute such as ``px.bar`` is looked up, so a
+script run that never draws a chart never pays for it.
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module placeholder that imports the real module on first attribute access."""
+
+    def __getattr__(self, attr):
+        # importlib.import_module holds the import lock, so concurrent script
+        # threads cannot observe a half-initialised module.
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_import(name):
+    """Return ``name`` if it is already imported, else a ``LazyModule`` for it."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -0,0 +1,191 @@
+"""Concurrent-session load test for the Streamlit dashboards.
+
+Each simulated user is an ``AppTest`` session that replays a scripted
+sequence of widget interactions (switching pages, changing the date range
+and regions, generating a forecast) with randomised values.  All sessions
+live in this one process, like the sessions of one server: they share
+``st.cache_data``, ``st.cache_resource`` and the on-disk caches, and the
+process's RSS is sampled throughout.  Up to ``--concurrency`` sessions are
+open at once and take turns, one interaction each; ``AppTest`` installs a
+process-wide mock runtime for every run, so the reruns themselves are
+serialised.
+
+    python load_test.py --sessions 50
+    python load_test.py --sessions 200 --concurrency 16 --iterations 3
+
+Reports throughput, p50/p99 latency per page, the process's RSS before the
+first session and at its peak, and keeps errors raised by the app
+(``at.exception``) apart from failures of the harness itself, with their
+messages.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from datetime import date, timedelta
+
+import numpy as np
+
+
+DEFAULT_CONCURRENCY = 8
+PAGES = ["📊 Executive Dashboard", "📈 Sales Analytics", "👥 Customer Intelligence",
+         "📦 Inventory Management", "🤖 AI Predictions", "⚙️ System Settings"]
+
+# (action, argument) steps replayed by every session
+SCENARIO = [
+    ('page', "📊 Executive Dashboard"),
+    ('date_range', None),
+    ('page', "📈 Sales Analytics"),
+    ('regions', None),
+    ('page', "👥 Customer Intelligence"),
+    ('page', "📦 Inventory Management"),
+    ('page', "🤖 AI Predictions"),
+    ('click', "🚀 Generate Forecast"),
+    ('date_range', None),
+    ('page', "📊 Executive Dashboard"),
+]
+
+
+def _step(at, action, arg, rng):
+    if action == 'page':
+        at.sidebar.radio[0].set_value(arg)
+    elif action == 'date_range':
+        end = date.today() - timedelta(days=rng.randint(0, 60))
+        at.sidebar.date_input[0].set_value((end - timedelta(days=rng.choice([30, 90, 180, 365])), end))
+    elif action == 'regions':
+        options = at.sidebar.multiselect[0].options
+        at.sidebar.multiselect[0].set_value(rng.sample(options, rng.randint(1, len(options))))
+    elif action == 'click':
+        next(b for b in at.button if b.label == arg).click()
+    at.run()
+
+
+def _timed(at, action, arg, rng):
+    """Run one step; returns (seconds, app error messages, harness error message or None)."""
+    t0 = time.perf_counter()
+    try:
+        if action == 'load':
+            at.run()
+        else:
+            _step(at, action, arg, rng)
+    except Exception as exc:
+        return time.perf_counter() - t0, [], f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - t0, [str(e.value) for e in at.exception], None
+
+
+class Session:
+    """One simulated user: the first load, then the scenario ``iterations`` times."""
+
+    def __init__(self, script, session_id, iterations, timeout):
+        from streamlit.testing.v1 import AppTest
+
+        self.at = AppTest.from_file(script, default_timeout=timeout)
+        self.rng = random.Random(session_id)
+        self.steps = deque([('load', None)] + SCENARIO * iterations)
+        self.page = '(first load)'
+
+    def step(self):
+        """Run the next interaction; returns (page, seconds, app errors, harness error)."""
+        action, arg = self.steps.popleft()
+        if action == 'page':
+            self.page = arg
+        return (self.page, *_timed(self.at, action, arg, self.rng))
+
+
+class RSSSampler:
+    """Peak resident set size of this process, sampled every ``interval`` seconds."""
+
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.peak = _current_rss()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._done.wait(self.interval):
+            self.peak = max(self.peak, _current_rss())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+        self.peak = max(self.peak, _current_rss())
+
+
+def run_sessions(script, sessions, concurrency, iterations, timeout):
+    """Replay the scenario in ``sessions`` sessions, ``concurrency`` open at a time, taking turns."""
+    samples = []
+    waiting = iter(range(sessions))
+    open_sessions = deque()
+    while True:
+        while len(open_sessions) < concurrency:
+            session_id = next(waiting, None)
+            if session_id is None:
+                break
+            open_sessions.append(Session(script, session_id, iterations, timeout))
+        if not open_sessions:
+            return samples
+        session = open_sessions.popleft()
+        samples.append(session.step())
+        if session.steps:
+            open_sessions.append(session)
+
+
+def _current_rss():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions.")
+    parser.add_argument('script', nargs='?', default='st_page02.py')
+    parser.add_argument('--sessions', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"sessions open at once (default {DEFAULT_CONCURRENCY})")
+    parser.add_argument('--iterations', type=int, default=1, help="scenario repetitions per session")
+    parser.add_argument('--timeout', type=float, default=300)
+    args = parser.parse_args()
+
+    script = os.path.abspath(args.script)
+    concurrency = max(1, min(args.concurrency, args.sessions))
+    baseline = _current_rss()
+    t0 = time.perf_counter()
+    with RSSSampler() as rss:
+        samples = run_sessions(script, args.sessions, concurrency, args.iterations, args.timeout)
+    elapsed = time.perf_counter() - t0
+
+    by_page = defaultdict(list)
+    app_errors, harness_errors = Counter(), Counter()
+    for page, seconds, app, harness in samples:
+        by_page[page].append(seconds)
+        app_errors.update(app)
+        if harness:
+            harness_errors[harness] += 1
+    total = len(samples)
+
+    print(f"{args.sessions} sessions x {args.iterations} iteration(s), {concurrency} open at a time: "
+          f"{total} interactions in {elapsed:.1f}s = {total / elapsed:.1f} reruns/s, "
+          f"{sum(app_errors.values())} app errors, {sum(harness_errors.values())} harness errors")
+    print(f"{'page':<28} {'n':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for page, values in by_page.items():
+        ms = np.array(values) * 1000
+        print(f"{page:<28} {len(ms):>6} {np.percentile(ms, 50):>9.0f} {np.percentile(ms, 99):>9.0f} {ms.max():>9.0f}")
+    print(f"process RSS: {baseline / 2**20:,.0f} MiB before the first session, peak {rss.peak / 2**20:,.0f} MiB "
+          f"(+{(rss.peak - baseline) / 2**20:,.0f} MiB for the shared caches and {concurrency} open sessions)")
+    for title, errors in (("App errors", app_errors), ("Harness errors", harness_errors)):
+        if errors:
+            print(f"\n{title}:")
+            for message, count in errors.most_common(10):
+                print(f"{count:>6} x {message[:200]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""On-demand profiling of a session's reruns.
+
+Add ``?profile=1`` to the URL and the next rerun of that session runs
+under ``cProfile``; the parameter is then removed, so only that rerun is
+profiled, and the end of the page shows the hottest functions and offers
+the raw pstats data and a collapsed-stack file (the input format of
+flamegraph.pl and speedscope) for download, plus a button to profile
+another rerun.
+
+On Python 3.12+ cProfile hooks the whole interpreter, so a profiled rerun
+also slows the other sessions' script threads.  Only one rerun in the
+process is profiled at a time (a module-level lock): other requests are
+turned down until it finishes.  Sessions that do not ask only pay for one
+query parameter lookup.
+
+    profiler = profiling.start()
+    ...  # the rest of the script
+    profiling.report(profiler)
+
+or, around a single call, ``with profiling.profile_rerun(): pg.run()``.
+"""
+import cProfile
+import marshal
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+from lazy_import import lazy_import
+
+pd = lazy_import("pandas")
+
+# A profiler left running by a rerun that never reached report() is
+# stopped by the next request after this long.
+MAX_SECONDS = 120
+
+_lock = threading.Lock()
+_active = None  # the profiler currently running in this process
+
+
+def _stop(profiler):
+    global _active
+    with _lock:
+        if _active is profiler:
+            _active = None
+    profiler.disable()
+
+
+def _request_profile():
+    st.query_params['profile'] = '1'
+
+
+def start():
+    """Profile this rerun if the URL asks for it; returns the profiler or None."""
+    global _active
+    # A rerun cut short by st.rerun()/st.stop() never reached report().
+    stale = st.session_state.pop('_profiler', None)
+    if stale is not None:
+        _stop(stale)
+    if st.query_params.get('profile') != '1':
+        return None
+    del st.query_params['profile']  # one rerun per request
+    with _lock:
+        if _active is not None:
+            if time.perf_counter() - _active.started < MAX_SECONDS:
+                st.toast("Another session is being profiled; try again shortly", icon="⏱️")
+                return None
+            _active.disable()
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+: a profiler not started here (e.g. an external one) is active.
+            _active = None
+            st.toast("Another profiler is active in this process", icon="⏱️")
+            return None
+        profiler.started = time.perf_counter()
+        _active = profiler
+    st.session_state._profiler = profiler
+    return profiler
+
+
+def _label(func):
+    filename, line, name = func
+    return name if filename == '~' else f"{name} ({filename.rsplit('/', 1)[-1]}:{line})"
+
+
+def hot_functions(stats, top=25):
+    rows = [
+        {'Function': func[2], 'Location': f"{func[0]}:{func[1]}", 'Calls': nc,
+         'Own_s': tt, 'Cumulative_s': ct}
+        for func, (cc, nc, tt, ct, callers) in stats.stats.items()
+    ]
+    return pd.DataFrame(rows).sort_values('Own_s', ascending=False).head(top)
+
+
+def collapsed_stacks(stats, min_seconds=1e-5, max_depth=64):
+    """Approximate collapsed stacks ("a;b;c <microseconds>") from the call graph.
+
+    cProfile only records caller -> callee edges, so a function's time is
+    split over its callers in proportion to the time spent under each edge.
+    """
+    callees = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+    roots = [func for func, entry in stats.stats.items() if not entry[4]]
+
+    lines = {}
+    todo = [((root,), 1.0) for root in roots]
+    while todo:
+        path, share = todo.pop()
+        func = path[-1]
+        own = stats.stats[func][2] * share
+        if own >= min_seconds:
+            key = ';'.join(_label(f) for f in path)
+            lines[key] = lines.get(key, 0) + own
+        if len(path) >= max_depth:
+            continue
+        for child, edge_seconds in callees.get(func, []):
+            child_total = stats.stats[child][3]
+            attributed = edge_seconds * share
+            if child in path or attributed < min_seconds or child_total <= 0:
+                continue
+            todo.append((path + (child,), min(attributed / child_total, 1.0)))
+    return ''.join(f"{stack} {round(seconds * 1e6)}\n" for stack, seconds in sorted(lines.items()))
+
+
+def report(profiler, top=25):
+    """Stop ``profiler`` and render its results (no-op for None)."""
+    if profiler is None:
+        return
+    _stop(profiler)
+    st.session_state.pop('_profiler', None)
+    elapsed = time.perf_counter() - profiler.started
+    stats = pstats.Stats(profiler)
+
+    with st.expander(f"⏱️ Profile of this rerun: {elapsed:.2f}s", expanded=True):
+        st.dataframe(
+            hot_functions(stats, top),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Own_s": st.column_config.NumberColumn("Own (s)", format="%.4f"),
+                "Cumulative_s": st.column_config.NumberColumn("Cumulative (s)", format="%.4f"),
+            }
+        )
+        col1, col2, col3 = st.columns(3)
+        # Downloads do not rerun the script, which would drop this report
+        with col1:
+            # Same format as Stats.dump_stats, loadable with pstats.Stats(path)
+            st.download_button("Download pstats", marshal.dumps(stats.stats), "rerun.prof",
+                               "application/octet-stream", on_click='ignore')
+        with col2:
+            st.download_button("Download collapsed stacks", collapsed_stacks(stats), "rerun.folded",
+                               "text/plain", on_click='ignore')
+        with col3:
+            # A callback: the button is gone from the (unprofiled) rerun its click starts
+            st.button("Profile another rerun", on_click=_request_profile)
+
+
+@contextmanager
+def profile_rerun(top=25):
+    profiler = start()
+    try:
+        yield
+    except BaseException:
+        # st.rerun()/st.stop() and errors: no report, but free the profiler for other sessions
+        if profiler is not None:
+            _stop(profiler)
+            st.session_state.pop('_profiler', None)
+        raise
+    report(profiler, top)
@@ -0,0 +1,52 @@
+"""Progress reporting for long-running operations.
+
+Operations accept an optional ``progress`` callback and call it with the
+real completion fraction as they work:
+
+    def render_report(df, progress=None):
+        progress = progress or null_progress
+        ...
+        progress(done / total, "Writing rows...")
+
+Pages wrap the call in ``st_progress()``, which shows a progress bar only
+while the block runs and removes it afterwards.
+"""
+from contextlib import contextmanager
+
+
+def null_progress(fraction, text=None):
+    """Progress sink used when the caller does not want updates."""
+
+
+def scaled(progress, start, end):
+    """Map a sub-step's 0..1 progress onto the ``start``..``end`` range."""
+    progress = progress or null_progress
+
+    def report(fraction, text=None):
+        progress(start + (end - start) * fraction, text)
+
+    return report
+
+
+def track(iterable, total, progress=None, text=None):
+    """Yield from ``iterable`` and report after each of the ``total`` items."""
+    progress = progress or null_progress
+    for i, item in enumerate(iterable, start=1):
+        yield item
+        progress(i / total if total else 1.0, text)
+
+
+@contextmanager
+def st_progress(text=None, container=None):
+    """Render a progress bar while the block runs and yield its callback."""
+    import streamlit as st
+
+    bar = (container or st).progress(0.0, text=text)
+
+    def report(fraction, text=text):
+        bar.progress(min(max(float(fraction), 0.0), 1.0), text=text)
+
+    try:
+        yield report
+    finally:
+        bar.empty()
@@ -0,0 +1,218 @@
+"""Pluggable query engines for the dashboard filter/aggregation queries.
+
+Every engine answers the same small set of queries the pages need, so a page
+only has to call ``get_engine()`` and the backend can be swapped with the
+``QUERY_ENGINE`` environment variable (``pandas``, ``duckdb`` or ``polars``).
+"""
+import os
+import threading
+import weakref
+
+import pandas as pd
+
+
+DEFAULT_ENGINE = "pandas"
+
+
+def _as_list(columns):
+    return [columns] if isinstance(columns, str) else list(columns)
+
+
+class BaseEngine:
+    """Queries shared by all engines, built on the engine's own primitives."""
+
+    def prepare(self, df):
+        """Convert ``df`` to the engine's own format ahead of the queries (a no-op by default)."""
+        return df
+
+    def pivot_agg(self, df, index, columns, values, how="mean"):
+        grouped = self.group_agg(df, [index, columns], values, how=how)
+        return grouped.pivot(index=index, columns=columns, values=values)
+
+
+class PandasEngine(BaseEngine):
+    """Reference engine: plain pandas boolean masks and groupbys."""
+
+    name = "pandas"
+
+    def filter_sales(self, df, start, end, regions):
+        dates = df['Date'].dt.date
+        mask = (dates >= start) & (dates <= end)
+        return df[mask & df['Region'].isin(regions)]
+
+    def filter_isin(self, df, filters):
+        mask = pd.Series(True, index=df.index)
+        for column, values in filters.items():
+            mask &= df[column].isin(values)
+        return df[mask]
+
+    def group_agg(self, df, by, column=None, how="sum"):
+        by = _as_list(by)
+        if how == "count":
+            return df.groupby(by).size().reset_index(name='Count')
+        return df.groupby(by)[column].agg(how).reset_index()
+
+    def below_reorder_point(self, df):
+        return df[df['Stock'] < df['Reorder_Point']]
+
+
+class DuckDBEngine(BaseEngine):
+    """Runs the same queries through an in-process DuckDB database.
+
+    DataFrames are registered as Arrow-backed views, so DuckDB scans them
+    without copying, pushes the filters into the scan and parallelises the
+    aggregation across all cores.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, database=":memory:"):
+        import duckdb
+
+        self._con = duckdb.connect(database)
+        self._lock = threading.Lock()
+
+    def _query(self, sql, params=None, **tables):
+        # One cursor per query: cursors are cheap and safe to use from the
+        # script threads of concurrent sessions.
+        with self._lock:
+            cur = self._con.cursor()
+        try:
+            for name, frame in tables.items():
+                cur.register(name, frame)
+            return cur.execute(sql, params or []).df()
+        finally:
+            cur.close()
+
+    def filter_sales(self, df, start, end, regions):
+        placeholders = ", ".join("?" for _ in regions) or "NULL"
+        sql = f"""
+            SELECT * FROM sales
+            WHERE CAST("Date" AS DATE) BETWEEN ? AND ?
+              AND "Region" IN ({placeholders})
+        """
+        return self._query(sql, [start, end, *regions], sales=df)
+
+    def filter_isin(self, df, filters):
+        clauses, params = [], []
+        for column, values in filters.items():
+            values = list(values)
+            placeholders = ", ".join("?" for _ in values) or "NULL"
+            clauses.append(f'"{column}" IN ({placeholders})')
+            params.extend(values)
+        where = " AND ".join(clauses) or "TRUE"
+        return self._query(f"SELECT * FROM t WHERE {where}", params, t=df)
+
+    def group_agg(self, df, by, column=None, how="sum"):
+        by = _as_list(by)
+        keys = ", ".join(f'"{c}"' for c in by)
+        if how == "count":
+            sql = f'SELECT {keys}, COUNT(*) AS "Count" FROM t GROUP BY {keys} ORDER BY {keys}'
+            return self._query(sql, t=df)
+        func = {"sum": "SUM", "mean": "AVG", "min": "MIN", "max": "MAX"}[how]
+        sql = f'SELECT {keys}, {func}("{column}") AS "{column}" FROM t GROUP BY {keys} ORDER BY {keys}'
+        out = self._query(sql, t=df)
+        # SUM over BIGINT comes back as HUGEINT/float; keep the pandas dtype.
+        if how in ("sum", "min", "max") and pd.api.types.is_integer_dtype(df[column]):
+            out[column] = out[column].astype(df[column].dtype)
+        return out
+
+    def below_reorder_point(self, df):
+        return self._query('SELECT * FROM t WHERE "Stock" < "Reorder_Point"', t=df)
+
+
+class PolarsEngine(BaseEngine):
+    """Runs the queries as Polars ``LazyFrame`` pipelines.
+
+    Each query is built lazily and collected once, so Polars prunes unused
+    columns, fuses the filters and executes on its multi-threaded engine.
+    Results are handed back to the pages as pandas frames.
+
+    The pandas -> Polars conversion is done once per source frame: the
+    LazyFrame is kept by ``id(df)`` until the frame is garbage collected, so
+    the several queries a page runs on one filtered frame share it.  Frames
+    are expected not to be modified in place once queried; a change of shape
+    or columns is detected and reconverted.
+    """
+
+    name = "polars"
+
+    def __init__(self):
+        import polars as pl
+
+        self._pl = pl
+        self._frames = {}  # id(df) -> (weakref to df, shape, columns, LazyFrame)
+        self._frames_lock = threading.Lock()
+
+    def _lazy(self, df):
+        key, signature = id(df), (df.shape, tuple(df.columns))
+        with self._frames_lock:
+            entry = self._frames.get(key)
+        if entry is not None and entry[0]() is df and entry[1:3] == signature:
+            return entry[3]
+        lazy = self._pl.from_pandas(df).lazy()
+        with self._frames_lock:
+            self._frames[key] = (weakref.ref(df), *signature, lazy)
+        weakref.finalize(df, self._forget, key)
+        return lazy
+
+    def _forget(self, key):
+        with self._frames_lock:
+            entry = self._frames.get(key)
+            if entry is not None and entry[0]() is None:
+                del self._frames[key]
+
+    def prepare(self, df):
+        self._lazy(df)
+        return df
+
+    def filter_sales(self, df, start, end, regions):
+        pl = self._pl
+        query = self._lazy(df).filter(
+            pl.col('Date').dt.date().is_between(start, end)
+            & pl.col('Region').is_in(list(regions))
+        )
+        return query.collect().to_pandas()
+
+    def filter_isin(self, df, filters):
+        pl = self._pl
+        predicate = pl.lit(True)
+        for column, values in filters.items():
+            predicate &= pl.col(column).is_in(list(values))
+        return self._lazy(df).filter(predicate).collect().to_pandas()
+
+    def group_agg(self, df, by, column=None, how="sum"):
+        pl = self._pl
+        by = _as_list(by)
+        if how == "count":
+            agg = pl.len().cast(pl.Int64).alias('Count')
+        else:
+            agg = getattr(pl.col(column), how)()
+        query = self._lazy(df).group_by(by).agg(agg).sort(by)
+        return query.collect().to_pandas()
+
+    def below_reorder_point(self, df):
+        pl = self._pl
+        query = self._lazy(df).filter(pl.col('Stock') < pl.col('Reorder_Point'))
+        return query.collect().to_pandas()
+
+
+ENGINES = {
+    "pandas": PandasEngine,
+    "duckdb": DuckDBEngine,
+    "polars": PolarsEngine,
+}
+
+_instances = {}
+_instances_lock = threading.Lock()
+
+
+def get_engine(name=None):
+    """Return the (shared) engine selected by ``name`` or ``QUERY_ENGINE``."""
+    name = (name or os.environ.get("QUERY_ENGINE", DEFAULT_ENGINE)).lower()
+    if name not in ENGINES:
+        raise ValueError(f"Unknown query engine {name!r}; choose one of {sorted(ENGINES)}")
+    with _instances_lock:
+        if name not in _instances:
+            _instances[name] = ENGINES[name]()
+        return _instances[name]
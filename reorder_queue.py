@@ -0,0 +1,121 @@
+"""Incrementally maintained reorder index for the inventory page.
+
+An item needs reordering when ``Stock < Reorder_Point``.  Its daily demand
+is implied by the reorder point (``Reorder_Point = demand * Lead_Time_Days``),
+so its days of cover are ``Stock / (Reorder_Point / Lead_Time_Days)``.
+
+``ReorderQueue`` keeps the items below their reorder point in a heap
+ordered by days of cover, together with running counts per warehouse.
+Stock changes update the heap and counts in O(log n) instead of rescanning
+the whole inventory table.  ``token`` identifies the inventory data the
+queue was built from; a page rebuilds the queue when it changes.
+"""
+import heapq
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from versioned_data import content_token
+
+
+class ReorderQueue:
+    def __init__(self, df, token=None):
+        self.token = content_token(df) if token is None else token
+        self.warehouse = df['Warehouse'].to_numpy()
+        self.sku = df['SKU'].to_numpy()
+        self.stock = df['Stock'].to_numpy(dtype=float).copy()
+        self.reorder_point = df['Reorder_Point'].to_numpy(dtype=float)
+        self.lead_time = df['Lead_Time_Days'].to_numpy(dtype=float)
+        self.demand = self.reorder_point / self.lead_time
+        self._index = pd.Series(np.arange(len(df)), index=pd.MultiIndex.from_arrays([self.warehouse, self.sku]))
+        self._labels = df.index
+        self._version = np.zeros(len(df), dtype=np.int64)
+        self._changed = {}
+        self._overlaid = None  # (version, overlaid frame)
+        self.version = 0
+
+        self._low = self.stock < self.reorder_point
+        cover = self.stock / self.demand
+        low = np.flatnonzero(self._low)
+        # Heap entries are (days_of_cover, row, version); an entry is stale
+        # once the row's version has moved on.
+        self._heap = list(zip(cover[low].tolist(), low.tolist(), [0] * len(low)))
+        heapq.heapify(self._heap)
+        self.low_by_warehouse = Counter(self.warehouse[low].tolist())
+
+    def __len__(self):
+        """Number of items currently below their reorder point."""
+        return int(sum(self.low_by_warehouse.values()))
+
+    def days_of_cover(self, row):
+        return self.stock[row] / self.demand[row]
+
+    def update_stock(self, warehouse, sku, stock):
+        """Record a new stock level for one Warehouse x SKU item."""
+        row = int(self._index[(warehouse, sku)])
+        was_low = self._low[row]
+        self.stock[row] = stock
+        self._version[row] += 1
+        self.version += 1
+        self._changed[row] = stock
+        now_low = stock < self.reorder_point[row]
+        self._low[row] = now_low
+
+        if now_low:
+            heapq.heappush(self._heap, (self.days_of_cover(row), row, int(self._version[row])))
+        if was_low != now_low:
+            self.low_by_warehouse[warehouse] += 1 if now_low else -1
+        if len(self._heap) > 2 * len(self) + 64:
+            self._compact()
+
+    def _compact(self):
+        self._heap = [entry for entry in self._heap if self._valid(entry)]
+        heapq.heapify(self._heap)
+
+    def _valid(self, entry):
+        return entry[2] == self._version[entry[1]]
+
+    def most_urgent(self, n=None):
+        """Rows below reorder point, lowest days of cover first."""
+        live = (entry for entry in self._heap if self._valid(entry))
+        entries = heapq.nsmallest(n, live) if n is not None else sorted(live)
+        return [row for _, row, _ in entries]
+
+    def to_frame(self, n=None):
+        rows = self.most_urgent(n)
+        return pd.DataFrame({
+            'Warehouse': self.warehouse[rows],
+            'SKU': self.sku[rows],
+            'Stock': self.stock[rows],
+            'Reorder_Point': self.reorder_point[rows],
+            'Lead_Time_Days': self.lead_time[rows],
+            'Days_of_Cover': self.stock[rows] / self.demand[rows],
+        })
+
+    def counts_by_warehouse(self):
+        counts = {w: c for w, c in self.low_by_warehouse.items() if c > 0}
+        return pd.DataFrame({'Warehouse': list(counts), 'Count': list(counts.values())})
+
+    def overlay(self, df):
+        """Return ``df`` with the recorded stock changes applied.
+
+        ``df`` must be the data the queue was built from (same ``token``).
+        Only the ``Stock`` column is copied (the others are shared with
+        ``df``) and only the changed rows are written.  The result is reused
+        until the next ``update_stock``.
+        """
+        if not self._changed:
+            return df
+        if self._overlaid is not None and self._overlaid[0] == self.version:
+            return self._overlaid[1]
+        positions = df.index.get_indexer(self._labels[list(self._changed)])
+        values = np.fromiter(self._changed.values(), dtype=float, count=len(self._changed))
+        stock = df['Stock'].to_numpy(copy=True)
+        if stock.dtype.kind in 'iu' and (values % 1).any():
+            stock = stock.astype(float)
+        stock[positions] = values
+        overlaid = df.copy(deep=False)
+        overlaid['Stock'] = stock
+        self._overlaid = (self.version, overlaid)
+        return overlaid
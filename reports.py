@@ -0,0 +1,149 @@
+"""Report rendering for the Sales Analytics "Reports" tab."""
+import io
+
+import pandas as pd
+
+from progress import null_progress, scaled
+
+
+FORMATS = {
+    # format: (file extension, MIME type)
+    "PDF": ("pdf", "application/pdf"),
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "CSV": ("csv", "text/csv"),
+}
+CHUNK_ROWS = 5000
+PDF_LINES_PER_PAGE = 76
+PDF_MARGIN = 40
+
+
+def _sections(df, report_type):
+    profit = df['Sales'] - df['Cost']
+    kpis = pd.DataFrame({
+        'Metric': ['Total Revenue', 'Units Sold', 'Net Profit', 'Avg Satisfaction'],
+        'Value': [df['Sales'].sum(), df['Units'].sum(), profit.sum(),
+                  round(df['Customer_Satisfaction'].mean(), 2)],
+    })
+    by_region = df.assign(Profit=profit).groupby('Region')[['Sales', 'Units', 'Cost', 'Profit']].sum().reset_index()
+    by_product = df.assign(Profit=profit).groupby('Product')[['Sales', 'Units', 'Cost', 'Profit']].sum().reset_index()
+
+    if report_type == "Executive":
+        return {'KPIs': kpis, 'By Region': by_region}
+    if report_type == "Summary":
+        return {'KPIs': kpis, 'By Region': by_region, 'By Product': by_product}
+    return {'KPIs': kpis, 'By Region': by_region, 'By Product': by_product, 'Transactions': df}
+
+
+def _chunks(frame):
+    for start in range(0, max(len(frame), 1), CHUNK_ROWS):
+        yield frame.iloc[start:start + CHUNK_ROWS]
+
+
+def _write_csv(sections, progress):
+    buffer = io.StringIO()
+    total = sum(max(len(f), 1) for f in sections.values())
+    done = 0
+    for title, frame in sections.items():
+        buffer.write(f"# {title}\n")
+        for i, chunk in enumerate(_chunks(frame)):
+            chunk.to_csv(buffer, index=False, header=(i == 0))
+            done += max(len(chunk), 1)
+            progress(done / total, f"Writing {title}...")
+        buffer.write("\n")
+    return buffer.getvalue().encode()
+
+
+def _write_excel(sections, progress):
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer) as writer:  # needs openpyxl or xlsxwriter
+        for i, (title, frame) in enumerate(sections.items(), start=1):
+            frame.to_excel(writer, sheet_name=title[:31], index=False)
+            progress(i / len(sections), f"Writing {title}...")
+    return buffer.getvalue()
+
+
+def _pdf_page(commands):
+    return "\n".join(commands).encode("latin-1", "replace")
+
+
+def _pdf_text(line):
+    return "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ") Tj T*"
+
+
+def _pdf_chart(title, frame, x, y):
+    """Bar chart of ``frame``'s second column, drawn from the top-left corner at (x, y)."""
+    labels, values = frame.iloc[:, 0].astype(str), frame.iloc[:, 1].astype(float)
+    top = max(values.max(), 1.0)
+    commands = [f"BT /F1 12 Tf {x} {y} Td {_pdf_text(title)} ET"]
+    for i, (label, value) in enumerate(zip(labels, values)):
+        row = y - 30 - 22 * i
+        commands.append(f"q 0.4 0.49 0.92 rg {x + 90} {row} {400 * value / top:.1f} 14 re f Q")
+        commands.append(f"BT /F1 8 Tf {x} {row + 4} Td {_pdf_text(label[:18])} ET")
+        commands.append(f"BT /F1 8 Tf {x + 95 + 400 * value / top:.1f} {row + 4} Td {_pdf_text(f'{value:,.0f}')} ET")
+    return commands
+
+
+def _write_pdf(sections, progress, chart):
+    """Plain-text PDF (Courier, one table row per line) written without a PDF library."""
+    pages = [_pdf_page(_pdf_chart("Revenue by Region", chart, PDF_MARGIN, 800))] if chart is not None else []
+    lines = []
+    total = sum(max(len(f), 1) for f in sections.values())
+    done = 0
+    for title, frame in sections.items():
+        lines.extend([title.upper(), ""])
+        for i, chunk in enumerate(_chunks(frame)):
+            lines.extend(chunk.to_string(index=False, header=(i == 0)).splitlines())
+            done += max(len(chunk), 1)
+            progress(0.9 * done / total, f"Writing {title}...")
+        lines.append("")
+    for start in range(0, max(len(lines), 1), PDF_LINES_PER_PAGE):
+        body = [_pdf_text(line) for line in lines[start:start + PDF_LINES_PER_PAGE]]
+        pages.append(_pdf_page([f"BT /F1 8 Tf 10 TL {PDF_MARGIN} 800 Td"] + body + ["ET"]))
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content stream per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>"]
+    kids = []
+    for stream in pages:
+        kids.append(f"{len(objects) + 1} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects) + 2} 0 R >>".encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    buffer = io.BytesIO()
+    buffer.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(buffer.tell())
+        buffer.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = buffer.tell()
+    buffer.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    buffer.writelines(b"%010d 00000 n \n" % offset for offset in offsets)
+    buffer.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    progress(1.0, "Writing PDF...")
+    return buffer.getvalue()
+
+
+def render_report(df, report_type="Summary", format_type="PDF", include_charts=True, progress=None):
+    """Render ``df`` (filtered sales) into a downloadable report.
+
+    Returns ``(data, file_name, mime)``.
+    """
+    progress = progress or null_progress
+    extension, mime = FORMATS[format_type]
+
+    progress(0.0, "Aggregating data...")
+    sections = _sections(df, report_type)
+    progress(0.2, "Aggregating data...")
+
+    chart = sections['By Region'][['Region', 'Sales']] if include_charts and format_type == "PDF" else None
+    progress(0.3, "Rendering charts...")
+
+    write = scaled(progress, 0.3, 1.0)
+    if format_type == "CSV":
+        data = _write_csv(sections, write)
+    elif format_type == "Excel":
+        data = _write_excel(sections, write)
+    else:
+        data = _write_pdf(sections, write, chart)
+    return data, f"{report_type.lower()}_report.{extension}", mime
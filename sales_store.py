@@ -0,0 +1,372 @@
+"""Month-partitioned store of the dashboard's sales table with pushdown reads.
+
+Rows are kept on disk under one directory per calendar month, each holding
+one or more segment files, and ``catalog.json`` records every partition's
+date range, row count and segments:
+
+    data/sales_store/catalog.json
+    data/sales_store/2026-10/part-00000.parquet
+    data/sales_store/2026-10/part-00001.parquet   # appended day(s)
+
+``read`` takes the columns a page shows and its filters: only partitions
+whose catalog date range overlaps the requested range are opened, and only
+the requested (and predicate) columns are decoded.  Parquet segments are
+written with one row group per ``ROW_GROUP_DAYS`` days and Date statistics,
+so a partition the range only partly covers is read from just the row
+groups that may overlap it, and a 7-day view decodes about a week rather
+than the whole month.  ``append`` writes new
+days as an extra segment of their month, so older partitions are never
+rewritten; ``compact`` later merges a partition's segments into one file.
+
+Decoded columns are kept in memory per (partition, column) and evicted
+least recently used first once they exceed ``SALES_STORE_MEMORY_MB``.
+Partly covered partitions are served from memory when their columns are
+already there; otherwise the row-group read bypasses the memory tier,
+which only holds whole partitions.
+
+Segments are Parquet files, or pickles when pyarrow is not installed.
+"""
+import importlib.util
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+
+STORE_DIR = os.environ.get('SALES_STORE_DIR', os.path.join('data', 'sales_store'))
+MEMORY_BYTES = int(float(os.environ.get('SALES_STORE_MEMORY_MB', '256')) * 1024 * 1024)
+CATALOG = 'catalog.json'
+ROW_GROUP_DAYS = 7
+
+
+def _date_bounds(start, end):
+    """Half-open [lower, upper) timestamps covering the calendar days start..end."""
+    lower = pd.Timestamp(start) if start is not None else None
+    upper = pd.Timestamp(end) + pd.Timedelta(days=1) if end is not None else None
+    return lower, upper
+
+
+def _mask(df, lower, upper, regions):
+    mask = pd.Series(True, index=df.index)
+    if lower is not None:
+        mask &= df['Date'] >= lower
+    if upper is not None:
+        mask &= df['Date'] < upper
+    if regions is not None:
+        mask &= df['Region'].isin(regions)
+    return mask
+
+
+def _segment_format():
+    return 'parquet' if importlib.util.find_spec('pyarrow') else 'pickle'
+
+
+class SalesStore:
+    def __init__(self, directory=STORE_DIR, memory_bytes=MEMORY_BYTES, loader=None):
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.loader = loader  # builds the table when the store is empty
+        self.last_read = None
+        self._catalog = None
+        self._memory = OrderedDict()  # (month, column) -> (Series, bytes)
+        self._memory_used = 0
+        self._lock = threading.RLock()
+
+    # Catalog
+
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            try:
+                with open(os.path.join(self.directory, CATALOG), encoding='utf-8') as f:
+                    self._catalog = json.load(f)
+            except FileNotFoundError:
+                return None
+        return self._catalog
+
+    def _save_catalog(self, catalog):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, CATALOG)
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, indent=1)
+        os.replace(tmp, path)
+        self._catalog = catalog
+
+    def _copy_catalog(self):
+        return dict(self.catalog, partitions={month: dict(p, files=list(p['files']))
+                                              for month, p in self.catalog['partitions'].items()})
+
+    def exists(self):
+        return self.catalog is not None
+
+    @property
+    def version(self):
+        """Changes whenever rows are written or appended (not on compaction).
+
+        A fresh random token each time, so a rewritten store never repeats
+        the version of earlier contents, even across restarts.
+        """
+        return self.catalog['version'] if self.exists() else None
+
+    def max_date(self):
+        if not self.exists() or not self.catalog['partitions']:
+            return None
+        return max(pd.Timestamp(p['max']) for p in self.catalog['partitions'].values())
+
+    def partitions(self, start=None, end=None):
+        """Months whose rows may fall in start..end (calendar days, None: open)."""
+        lower, upper = _date_bounds(start, end)
+        return self._overlapping(lower, upper)
+
+    def _overlapping(self, lower, upper):
+        months = []
+        for month, meta in sorted(self.catalog['partitions'].items()):
+            if lower is not None and pd.Timestamp(meta['max']) < lower:
+                continue
+            if upper is not None and pd.Timestamp(meta['min']) >= upper:
+                continue
+            months.append(month)
+        return months
+
+    # Segments
+
+    def _write_segment(self, catalog, month, df):
+        partition = catalog['partitions'].setdefault(month, {'files': [], 'rows': 0, 'next': 0})
+        extension = 'parquet' if catalog['format'] == 'parquet' else 'pkl'
+        name = f"{month}/part-{partition['next']:05d}.{extension}"
+        partition['next'] += 1
+        path = os.path.join(self.directory, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{uuid.uuid4().hex}.tmp'
+        if catalog['format'] == 'parquet':
+            rows_per_day = max(1, len(df) // max(1, df['Date'].dt.normalize().nunique()))
+            df.to_parquet(tmp, index=False, row_group_size=rows_per_day * ROW_GROUP_DAYS, write_statistics=True)
+        else:
+            df.to_pickle(tmp)
+        os.replace(tmp, path)
+
+        low, high = df['Date'].min(), df['Date'].max()
+        if partition['files']:
+            low, high = min(low, pd.Timestamp(partition['min'])), max(high, pd.Timestamp(partition['max']))
+        partition['files'].append(name)
+        partition['rows'] += len(df)
+        partition['min'], partition['max'] = low.isoformat(), high.isoformat()
+
+    def _read_segments(self, month, columns):
+        frames = []
+        for name in self.catalog['partitions'][month]['files']:
+            path = os.path.join(self.directory, name)
+            if self.catalog['format'] == 'parquet':
+                frames.append(pd.read_parquet(path, columns=columns))
+            else:
+                frames.append(pd.read_pickle(path)[columns])
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    def _read_row_groups(self, month, columns, lower, upper):
+        """The partition's rows from Parquet row groups whose Date statistics may fall in [lower, upper).
+
+        Returns (frame or None when no row group overlaps, row groups read, row groups).
+        """
+        import pyarrow.parquet as pq
+
+        frames, read, total = [], 0, 0
+        for name in self.catalog['partitions'][month]['files']:
+            with pq.ParquetFile(os.path.join(self.directory, name)) as parquet:
+                metadata = parquet.metadata
+                date_index = parquet.schema_arrow.names.index('Date')
+                keep = []
+                for i in range(metadata.num_row_groups):
+                    stats = metadata.row_group(i).column(date_index).statistics
+                    if stats is not None and stats.has_min_max:
+                        if lower is not None and pd.Timestamp(stats.max) < lower:
+                            continue
+                        if upper is not None and pd.Timestamp(stats.min) >= upper:
+                            continue
+                    keep.append(i)
+                total += metadata.num_row_groups
+                read += len(keep)
+                if keep:
+                    frames.append(parquet.read_row_groups(keep, columns=columns).to_pandas())
+        if not frames:
+            return None, read, total
+        return (pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]), read, total
+
+    # Writing
+
+    def write(self, df):
+        """Replace the stored table with ``df``, one partition per month."""
+        with self._lock:
+            self._drop()
+            catalog = {'version': uuid.uuid4().hex, 'format': _segment_format(), 'columns': list(df.columns),
+                       'partitions': {}}
+            df = df.sort_values('Date', kind='stable')
+            for month, rows in df.groupby(df['Date'].dt.strftime('%Y-%m'), sort=True):
+                self._write_segment(catalog, month, rows.reset_index(drop=True))
+            self._save_catalog(catalog)
+
+    def append(self, df):
+        """Add the rows of ``df`` newer than the stored data; returns how many were added.
+
+        Only the partitions of the new days get a new segment.  When the new
+        rows start a new month, the previous months are compacted.
+        """
+        with self._lock:
+            last = self.max_date()
+            if last is not None:
+                df = df[df['Date'] > last]
+            if df.empty:
+                return 0
+            if not self.exists():
+                self.write(df)
+                return len(df)
+            catalog = self._copy_catalog()
+            df = df.sort_values('Date', kind='stable')
+            new_months = []
+            for month, rows in df.groupby(df['Date'].dt.strftime('%Y-%m'), sort=True):
+                if month not in catalog['partitions']:
+                    new_months.append(month)
+                self._write_segment(catalog, month, rows.reset_index(drop=True))
+                self._evict_partition(month)
+            catalog['version'] = uuid.uuid4().hex
+            self._save_catalog(catalog)
+            if new_months:
+                self.compact([m for m in catalog['partitions'] if m < new_months[0]])
+            return len(df)
+
+    def compact(self, months=None):
+        """Merge the segments of each partition in ``months`` (None: all) into one file."""
+        with self._lock:
+            if not self.exists():
+                return
+            catalog = self._copy_catalog()
+            obsolete = []
+            for month in sorted(catalog['partitions'] if months is None else months):
+                partition = catalog['partitions'][month]
+                if len(partition['files']) < 2:
+                    continue
+                rows = self._read_segments(month, catalog['columns'])
+                obsolete.extend(partition['files'])
+                catalog['partitions'][month] = {'files': [], 'rows': 0, 'next': partition['next']}
+                self._write_segment(catalog, month, rows)
+            self._save_catalog(catalog)
+            for name in obsolete:
+                os.remove(os.path.join(self.directory, name))
+
+    def invalidate(self):
+        """Drop the stored table; the next ``read`` or ``ensure`` rewrites it."""
+        with self._lock:
+            self._drop()
+
+    def _drop(self):
+        self._catalog = None
+        self._memory.clear()
+        self._memory_used = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def ensure(self, loader=None):
+        """Write ``loader()`` (default: ``self.loader``) if the store is empty; returns self."""
+        with self._lock:
+            if not self.exists():
+                loader = loader or self.loader
+                if loader is None:
+                    raise FileNotFoundError(f"Sales store {self.directory} is empty and has no loader")
+                self.write(loader())
+        return self
+
+    # Memory tier
+
+    def _columns(self, month, columns):
+        """The partition's ``columns`` as a frame, decoding only those not in memory."""
+        with self._lock:
+            cached = {}
+            for column in columns:
+                entry = self._memory.get((month, column))
+                if entry is not None:
+                    self._memory.move_to_end((month, column))
+                    cached[column] = entry[0]
+            missing = [c for c in columns if c not in cached]
+            if missing:
+                loaded = self._read_segments(month, missing)
+                for column in missing:
+                    series = loaded[column]
+                    size = int(series.memory_usage(index=False, deep=series.dtype == object))
+                    self._memory[(month, column)] = (series, size)
+                    self._memory_used += size
+                    cached[column] = series
+                self.trim()
+            return pd.DataFrame({column: cached[column] for column in columns}), len(missing)
+
+    def _in_memory(self, month, columns):
+        return all((month, column) in self._memory for column in columns)
+
+    def _evict_partition(self, month):
+        for key in [key for key in self._memory if key[0] == month]:
+            self._memory_used -= self._memory.pop(key)[1]
+
+    def trim(self, max_bytes=None):
+        """Evict least recently used columns until the memory tier fits ``max_bytes``."""
+        max_bytes = self.memory_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            while self._memory and self._memory_used > max_bytes:
+                self._memory_used -= self._memory.popitem(last=False)[1][1]
+
+    @property
+    def memory_used(self):
+        return self._memory_used
+
+    # Reading
+
+    def read(self, columns=None, start=None, end=None, regions=None):
+        """Rows with start <= Date.date() <= end in ``regions``, only ``columns`` (None: all).
+
+        Any of the filters may be None to leave that dimension unfiltered.
+        """
+        lower, upper = _date_bounds(start, end)
+        # Catalog and segment files are read under the lock, so an
+        # invalidate() or compact() in another session cannot remove them
+        # halfway through; a store invalidated since is rebuilt first.
+        with self._lock:
+            catalog = self.ensure().catalog
+            columns = list(catalog['columns'] if columns is None else columns)
+            # Predicate columns are read too, then dropped after filtering
+            wanted = list(columns)
+            if (lower is not None or upper is not None) and 'Date' not in wanted:
+                wanted.append('Date')
+            if regions is not None and 'Region' not in wanted:
+                wanted.append('Region')
+
+            months = self._overlapping(lower, upper)
+            frames, decoded, groups_read, groups_total = [], 0, 0, 0
+            for month in months:
+                meta = catalog['partitions'][month]
+                partial = ((lower is not None and pd.Timestamp(meta['min']) < lower)
+                           or (upper is not None and pd.Timestamp(meta['max']) >= upper))
+                if partial and catalog['format'] == 'parquet' and not self._in_memory(month, wanted):
+                    frame, read, total = self._read_row_groups(month, wanted, lower, upper)
+                    groups_read += read
+                    groups_total += total
+                    if frame is not None:
+                        frames.append(frame)
+                    continue
+                frame, n = self._columns(month, wanted)
+                frames.append(frame)
+                decoded += n
+        if frames:
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        else:
+            df = pd.DataFrame({column: pd.Series(dtype='datetime64[ns]' if column == 'Date' else object)
+                               for column in wanted})
+        df = df[_mask(df, lower, upper, regions)][columns]
+        self.last_read = {'partitions': len(months), 'total_partitions': len(catalog['partitions']),
+                          'columns_decoded': decoded, 'row_groups_read': groups_read,
+                          'row_groups_total': groups_total, 'columns': columns, 'rows': len(df)}
+        return df.reset_index(drop=True)
+
+    def distinct(self, column):
+        """Unique values of ``column``, in order of first appearance."""
+        return self.read([column])[column].unique()
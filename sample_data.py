@@ -0,0 +1,81 @@
+"""Cached datasets shared by the pages of app.py."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from disk_cache import persistent_cache
+from versioned_data import VersionedFrame
+
+
+DEFAULT_ROWS = 1000
+
+
+# Generate sample data
+@st.cache_data
+@persistent_cache
+def generate_sample_data(rows=1000):
+    """Generate comprehensive sample dataset"""
+    np.random.seed(42)
+    dates = pd.date_range(start='2023-01-01', periods=rows, freq='H')
+
+    df = pd.DataFrame({
+        'timestamp': dates,
+        'category': np.random.choice(['A', 'B', 'C', 'D'], rows),
+        'value': np.random.randn(rows).cumsum() + 100,
+        'count': np.random.randint(1, 100, rows),
+        'temperature': np.random.normal(25, 5, rows),
+        'humidity': np.random.uniform(30, 90, rows),
+        'status': np.random.choice(['Active', 'Inactive', 'Pending'], rows),
+        'latitude': np.random.uniform(40.7, 40.8, rows),
+        'longitude': np.random.uniform(-74.0, -73.9, rows),
+        'score': np.random.uniform(0, 100, rows)
+    })
+    return df
+
+# Generate additional datasets
+@st.cache_data
+@persistent_cache
+def generate_timeseries_data():
+    dates = pd.date_range(start='2023-01-01', periods=365, freq='D')
+    return pd.DataFrame({
+        'date': dates,
+        'metric1': np.random.randn(365).cumsum() + 50,
+        'metric2': np.random.randn(365).cumsum() + 30,
+        'metric3': np.random.randn(365).cumsum() + 70
+    })
+
+
+@st.cache_data
+@persistent_cache
+def expensive_computation(n):
+    time.sleep(2)  # Simulate expensive computation
+    return np.random.randn(n).cumsum()
+
+
+def data_rows():
+    """Row count chosen with the sidebar "Data Rows" slider."""
+    return st.session_state.get('data_rows', DEFAULT_ROWS)
+
+
+def versioned_sample_data():
+    """This session's copy of the sample data, which data_editor edits are applied to.
+
+    Changing the row count starts over from freshly generated data.
+    """
+    name = f"sample_data:{data_rows()}"
+    data = st.session_state.get('sample_data')
+    if data is None or data.name != name:
+        data = VersionedFrame(generate_sample_data(data_rows()), name)
+        st.session_state.sample_data = data
+    return data
+
+
+def dataset_version():
+    """Identifies the contents of ``load_sample_data()`` for cache keys."""
+    return versioned_sample_data().key
+
+
+def load_sample_data():
+    return versioned_sample_data().df
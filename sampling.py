@@ -0,0 +1,102 @@
+"""Reproducible sampling for chart subsets.
+
+Charts that cannot draw every row go through ``cached_sample`` instead of
+``df.sample()``: the same (dataset version, size, strata, seed) always
+gives the same rows, so charts stay put while the user plays with
+unrelated widgets, and the sample is computed once per combination.
+"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+def _allocate(sizes, n):
+    """Split ``n`` across strata proportionally (largest remainder method)."""
+    total = sizes.sum()
+    if n >= total:
+        return sizes.copy()
+    exact = sizes / total * n
+    alloc = np.floor(exact).astype(int)
+    remainder = n - alloc.sum()
+    order = np.argsort(-(exact - alloc), kind='stable')
+    alloc.iloc[order[:remainder]] += 1
+    return alloc
+
+
+def stratified_sample(df, n, strata=None, seed=0):
+    """Draw ``n`` rows, allocated to the ``strata`` column(s) in proportion to size.
+
+    Every row gets a seeded uniform key and each stratum keeps its rows
+    with the smallest keys, so the draw is uniform within strata and
+    fully determined by ``seed``. Rows keep their original order.
+    """
+    if n >= len(df):
+        return df
+    keys = pd.Series(np.random.default_rng(seed).random(len(df)), index=df.index)
+    if strata is None:
+        return df.loc[keys.nsmallest(n).index.sort_values()]
+
+    strata = [strata] if isinstance(strata, str) else list(strata)
+    groups = keys.groupby([df[c] for c in strata], sort=False, observed=True)
+    alloc = _allocate(groups.size(), n).to_numpy()
+    rank = groups.rank(method='first').to_numpy()
+    quota = alloc[groups.ngroup().to_numpy()]
+    return df[rank <= quota]
+
+
+class Reservoir:
+    """Uniform fixed-size sample over a stream of DataFrame chunks.
+
+    Implemented as bottom-k sampling: each row gets a random key and the
+    ``k`` rows with the smallest keys seen so far are kept, which is
+    equivalent to classic reservoir sampling but processes whole chunks
+    with vectorised operations. Two reservoirs can be merged.
+    """
+
+    def __init__(self, k, seed=0):
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.sample = None
+        self.keys = np.empty(0)
+        self.seen = 0
+
+    def update(self, chunk):
+        keys = self.rng.random(len(chunk))
+        self.seen += len(chunk)
+        return self._keep(chunk, keys)
+
+    def merge(self, other):
+        self.seen += other.seen
+        if other.sample is None:
+            return self
+        return self._keep(other.sample, other.keys)
+
+    def _keep(self, rows, keys):
+        if self.sample is not None:
+            rows = pd.concat([self.sample, rows], ignore_index=True)
+            keys = np.concatenate([self.keys, keys])
+        else:
+            rows = rows.reset_index(drop=True)
+        if len(keys) > self.k:
+            idx = np.argpartition(keys, self.k - 1)[:self.k]
+            idx.sort()
+            rows, keys = rows.iloc[idx].reset_index(drop=True), keys[idx]
+        self.sample, self.keys = rows, keys
+        return self
+
+
+def reservoir_sample(chunks, k, seed=0):
+    """Sample ``k`` rows uniformly from an iterable of DataFrame chunks."""
+    reservoir = Reservoir(k, seed=seed)
+    for chunk in chunks:
+        reservoir.update(chunk)
+    return reservoir.sample
+
+
+@st.cache_data(max_entries=64)
+def cached_sample(_df, version, n, strata=None, seed=0):
+    """``stratified_sample`` cached by (dataset version, n, strata, seed).
+
+    ``_df`` is not hashed; ``version`` must change whenever its contents do.
+    """
+    return stratified_sample(_df, n, strata=strata, seed=seed)
@@ -0,0 +1,102 @@
+"""Customer segmentation with mini-batch k-means.
+
+Features are z-scored with one ``StreamingStats`` pass, then centres are
+fitted on random mini-batches (Sculley, 2010): each batch is assigned to
+its nearest centres and every centre moves towards the mean of its points
+with a per-centre learning rate of 1 / (points seen).  Only the float32
+feature matrix and one batch x k distance block are held in memory, and
+final labels are assigned chunk by chunk, so millions of customers fit
+comfortably.
+"""
+import numpy as np
+import pandas as pd
+
+from streaming_stats import StreamingStats
+
+
+FEATURES = ['Employees', 'Annual_Revenue', 'Contract_Value', 'NPS_Score', 'Account_Age_Days']
+
+
+def _sq_distances(x, centers):
+    # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, without an n x k x d temporary.
+    d = (x * x).sum(axis=1)[:, None] - 2 * x @ centers.T + (centers * centers).sum(axis=1)
+    return np.maximum(d, 0)
+
+
+def _kmeans_plus_plus(x, k, rng):
+    centers = [x[rng.integers(len(x))]]
+    closest = _sq_distances(x, centers[0][None])[:, 0]
+    for _ in range(1, k):
+        total = closest.sum()
+        i = rng.choice(len(x), p=closest / total) if total > 0 else rng.integers(len(x))
+        centers.append(x[i])
+        closest = np.minimum(closest, _sq_distances(x, x[i][None])[:, 0])
+    return np.array(centers)
+
+
+def assign(x, centers, chunk_rows=100_000):
+    """Nearest centre and squared distance for every row, in chunks."""
+    labels = np.empty(len(x), dtype=np.int32)
+    dist = np.empty(len(x), dtype=np.float64)
+    for start in range(0, len(x), chunk_rows):
+        d = _sq_distances(x[start:start + chunk_rows], centers)
+        labels[start:start + chunk_rows] = d.argmin(axis=1)
+        dist[start:start + chunk_rows] = d[np.arange(len(d)), labels[start:start + chunk_rows]]
+    return labels, dist
+
+
+def minibatch_kmeans(x, k, batch_size=1024, max_iter=200, tol=1e-4, seed=0):
+    """Fit ``k`` centres to the rows of ``x``; returns (centers, labels, inertia)."""
+    rng = np.random.default_rng(seed)
+    k = min(k, len(x))
+    init_sample = x[rng.choice(len(x), size=min(len(x), 10 * batch_size), replace=False)]
+    centers = _kmeans_plus_plus(init_sample, k, rng).astype(np.float64)
+    counts = np.zeros(k)
+
+    for _ in range(max_iter):
+        batch = x[rng.integers(len(x), size=min(batch_size, len(x)))]
+        labels = _sq_distances(batch, centers).argmin(axis=1)
+        batch_counts = np.bincount(labels, minlength=k).astype(np.float64)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, batch)
+
+        hit = batch_counts > 0
+        counts[hit] += batch_counts[hit]
+        old = centers.copy()
+        # Same as applying the per-point update c += (x - c) / n for each
+        # point of the batch in turn, but in one step per centre.
+        centers[hit] += (sums[hit] - batch_counts[hit, None] * centers[hit]) / counts[hit, None]
+        if np.abs(centers - old).max() < tol:
+            break
+
+    labels, dist = assign(x, centers)
+    return centers, labels, float(dist.sum())
+
+
+def segment_customers(df, k=4, features=FEATURES, seed=0, batch_size=1024):
+    """Cluster ``df`` on z-scored ``features``.
+
+    Returns the cluster label per row and a profile table with the size and
+    mean feature values (in original units) of every cluster.
+    """
+    stats = StreamingStats.from_frame(df, features)
+    std = stats.std()
+    std[~(std > 0)] = 1.0
+    x = np.empty((len(df), len(features)), dtype=np.float32)
+    for start in range(0, len(df), 100_000):
+        chunk = df.iloc[start:start + 100_000][features].to_numpy(dtype=np.float64)
+        x[start:start + len(chunk)] = (chunk - stats.mean) / std
+
+    centers, labels, inertia = minibatch_kmeans(x, k, batch_size=batch_size, seed=seed)
+    # Order clusters by size so labels are stable across reruns with the same seed.
+    order = np.argsort(-np.bincount(labels, minlength=len(centers)), kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    labels = rank[labels]
+
+    names = [f'Cluster {i + 1}' for i in range(len(centers))]
+    profile = pd.DataFrame(centers[order] * std + stats.mean, columns=features)
+    profile.insert(0, 'Customers', np.bincount(labels, minlength=len(centers)))
+    profile.insert(0, 'Cluster', names)
+    clusters = pd.Series(pd.Categorical.from_codes(labels, names), index=df.index, name='Cluster')
+    return clusters, profile, inertia
@@ -0,0 +1,79 @@
+"""Spatial aggregation of latitude/longitude points into grid cells.
+
+Maps draw one marker per occupied cell instead of one per point, so the
+payload depends on the grid resolution, not on the number of points.
+"""
+import numpy as np
+import pandas as pd
+
+
+SQRT3 = np.sqrt(3.0)
+
+
+def _aggregate(a, b, values):
+    # Pack the two integer cell coordinates into one int64 key so a single
+    # 1-D np.unique (a sort) groups the points.
+    a, b = a.astype(np.int64), b.astype(np.int64)
+    a0, b0 = (a.min(), b.min()) if len(a) else (0, 0)
+    width = (b.max() - b0 + 1) if len(b) else 1
+    keys, inverse, counts = np.unique((a - a0) * width + (b - b0), return_inverse=True, return_counts=True)
+    means = None
+    if values is not None:
+        means = np.bincount(inverse.ravel(), weights=values, minlength=len(keys)) / counts
+    return keys // width + a0, keys % width + b0, counts, means
+
+
+def _frame(lat, lon, counts, means, value_name):
+    out = pd.DataFrame({'latitude': lat, 'longitude': lon, 'points': counts})
+    if means is not None:
+        out[f'{value_name}_mean'] = means
+    return out
+
+
+def square_bin(lat, lon, cell_deg, values=None, value_name='value'):
+    """Bin points into ``cell_deg`` x ``cell_deg`` degree squares."""
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    rows, cols, counts, means = _aggregate(np.floor(lat / cell_deg), np.floor(lon / cell_deg),
+                                           None if values is None else np.asarray(values, dtype=float))
+    return _frame((rows + 0.5) * cell_deg, (cols + 0.5) * cell_deg, counts, means, value_name)
+
+
+def hex_bin(lat, lon, size_deg, values=None, value_name='value'):
+    """Bin points into pointy-top hexagons with a ``size_deg`` circumradius.
+
+    Longitudes are scaled by cos(latitude) first so hexagons stay regular on
+    the map at the data's latitude.
+    """
+    lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+    scale = np.cos(np.radians(np.nanmean(lat))) if len(lat) else 1.0
+    x, y = lon * scale, lat
+
+    # Fractional axial coordinates, then cube rounding to the nearest hex.
+    q = (SQRT3 / 3 * x - y / 3) / size_deg
+    r = (2 / 3 * y) / size_deg
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+
+    cq, cr, counts, means = _aggregate(rq, rr, None if values is None else np.asarray(values, dtype=float))
+    cx = size_deg * SQRT3 * (cq + cr / 2)
+    cy = size_deg * 1.5 * cr
+    return _frame(cy, cx / scale, counts, means, value_name)
+
+
+def bin_points(df, kind='hex', cells_across=40, lat='latitude', lon='longitude', value=None):
+    """Bin ``df`` so that roughly ``cells_across`` cells span its longitude range."""
+    if df.empty:
+        return _frame([], [], [], None if value is None else [], value or 'value')
+    span = max(df[lon].max() - df[lon].min(), 1e-9)
+    cell = span / cells_across
+    values = None if value is None else df[value].to_numpy()
+    if kind == 'square':
+        return square_bin(df[lat].to_numpy(), df[lon].to_numpy(), cell, values, value or 'value')
+    scale = np.cos(np.radians(df[lat].mean()))
+    # Hex columns are sqrt(3) * size apart in scaled-longitude units.
+    return hex_bin(df[lat].to_numpy(), df[lon].to_numpy(), cell * scale / SQRT3, values, value or 'value')
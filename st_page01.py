@@ -1,8 +1,11 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
 import datetime
 
+from lazy_import import lazy_import
+
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
+
 # Page config
 st.set_page_config(page_title="Page Features Demo", layout="wide", initial_sidebar_state="collapsed")
 
@@ -1,10 +1,38 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import time
+from datetime import datetime
+
+import cache_warmer
+import disk_cache
+import profiling
+from assets import asset
+from backtesting import TOTAL as TOTAL_SERIES, best_models, score as backtest_score
+from dashboard_data import (customer_clusters, default_date_range, forecast_backtest, generate_customer_data,
+                            generate_inventory_data, kpi_index, read_sales, reset_sales, sales_regions,
+                            sales_stats, sales_store)
+from forecasting import MODELS as FORECAST_MODELS, fit_forecast
+from insights import DASHBOARD_RULES, InsightsEngine, growth_window
+from inventory_sim import POLICIES as REORDER_POLICIES, simulate_inventory
+from kpi_index import change
+from lazy_import import lazy_import
+from progress import st_progress
+from query_engine import get_engine
+from reorder_queue import ReorderQueue
+from reports import FORMATS as REPORT_FORMATS, render_report
+from versioned_data import content_token
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
+# Sales columns each page reads (None: all of them); pages not listed read no sales rows
+PAGE_COLUMNS = {
+    "📊 Executive Dashboard": ['Date', 'Region', 'Product', 'Sales', 'Customer_Satisfaction'],
+    "📈 Sales Analytics": None,
+    "🤖 AI Predictions": ['Date', 'Sales'],
+}
+INSIGHT_COLUMNS = PAGE_COLUMNS["📊 Executive Dashboard"]
+AUTO_MODEL = "Auto (best backtest)"
 
 # Page Configuration
 st.set_page_config(
@@ -14,6 +42,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Profile this rerun when the URL has ?profile=1
+profiler = profiling.start()
+
 # Custom CSS for better styling
 st.markdown("""
     <style>
@@ -30,81 +61,19 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# Generate realistic data
-@st.cache_data
-def generate_sales_data():
-    dates = pd.date_range(end=datetime.now(), periods=365, freq='D')
-    regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
-    products = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E']
-    
-    data = []
-    for date in dates:
-        for region in regions:
-            for product in products:
-                data.append({
-                    'Date': date,
-                    'Region': region,
-                    'Product': product,
-                    'Sales': np.random.randint(1000, 50000),
-                    'Units': np.random.randint(10, 500),
-                    'Cost': np.random.randint(500, 30000),
-                    'Customer_Satisfaction': round(np.random.uniform(3.5, 5.0), 2),
-                    'Returns': np.random.randint(0, 50)
-                })
-    
-    return pd.DataFrame(data)
-
-@st.cache_data
-def generate_customer_data():
-    segments = ['Enterprise', 'Mid-Market', 'SMB', 'Startup']
-    industries = ['Technology', 'Healthcare', 'Finance', 'Retail', 'Manufacturing']
-    
-    data = []
-    for i in range(500):
-        data.append({
-            'Customer_ID': f'CUST{i:04d}',
-            'Company': f'Company {i}',
-            'Segment': np.random.choice(segments),
-            'Industry': np.random.choice(industries),
-            'Annual_Revenue': np.random.randint(50000, 5000000),
-            'Employees': np.random.randint(10, 10000),
-            'Contract_Value': np.random.randint(5000, 500000),
-            'Churn_Risk': np.random.choice(['Low', 'Medium', 'High'], p=[0.6, 0.3, 0.1]),
-            'NPS_Score': np.random.randint(0, 100),
-            'Account_Age_Days': np.random.randint(30, 1825)
-        })
-    
-    return pd.DataFrame(data)
-
-@st.cache_data
-def generate_inventory_data():
-    warehouses = ['WH-NY', 'WH-LA', 'WH-CHI', 'WH-HOU', 'WH-PHX']
-    products = [f'SKU-{i:04d}' for i in range(50)]
-    
-    data = []
-    for warehouse in warehouses:
-        for product in products:
-            data.append({
-                'Warehouse': warehouse,
-                'SKU': product,
-                'Stock': np.random.randint(0, 1000),
-                'Reorder_Point': np.random.randint(50, 200),
-                'Lead_Time_Days': np.random.randint(7, 30),
-                'Unit_Cost': round(np.random.uniform(10, 500), 2),
-                'Last_Restocked': datetime.now() - timedelta(days=np.random.randint(1, 60))
-            })
-    
-    return pd.DataFrame(data)
+# Precompute common cache entries in the background (once per server)
+warmer = cache_warmer.start(cache_warmer.DASHBOARD_ENTRIES)
 
 # Load data
-df_sales = generate_sales_data()
+engine = get_engine()
 df_customers = generate_customer_data()
 df_inventory = generate_inventory_data()
 
 # Sidebar Navigation
 with st.sidebar:
-    st.image("https://via.placeholder.com/150x50/667eea/ffffff?text=LOGO", use_container_width=True)
+    st.image(asset("dashboard_logo"), use_container_width=True)
     st.title("🎛️ Control Center")
+    cache_warmer.show_status(warmer)
     
     page = st.radio(
         "Navigation",
@@ -119,14 +88,15 @@ with st.sidebar:
     st.subheader("🔍 Global Filters")
     date_range = st.date_input(
         "Date Range",
-        value=(datetime.now() - timedelta(days=90), datetime.now()),
+        value=default_date_range(),
         max_value=datetime.now()
     )
     
+    regions = sales_regions()
     selected_regions = st.multiselect(
         "Regions",
-        options=df_sales['Region'].unique(),
-        default=df_sales['Region'].unique()
+        options=regions,
+        default=regions
     )
     
     st.divider()
@@ -138,11 +108,13 @@ with st.sidebar:
     
     if st.button("🔄 Refresh Dashboard", use_container_width=True):
         st.cache_data.clear()
+        disk_cache.clear()
+        reset_sales()
+        st.session_state.pop('reorder_queue', None)
+        st.session_state.pop('insights', None)
         st.rerun()
     
     if st.button("📧 Email Report", use_container_width=True):
-        with st.spinner("Sending report..."):
-            time.sleep(1)
         st.success("✅ Report sent!")
     
     st.divider()
@@ -151,9 +123,30 @@ with st.sidebar:
     st.caption("👤 John Doe | Admin")
     st.caption(f"🕐 {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
-# Filter data based on selections
-mask = (df_sales['Date'].dt.date >= date_range[0]) & (df_sales['Date'].dt.date <= date_range[1])
-df_filtered = df_sales[mask & df_sales['Region'].isin(selected_regions)]
+# Filter data based on selections, reading only the rows and columns the page shows
+def filtered_sales(columns):
+    return read_sales(None if columns is None else tuple(columns), date_range[0], date_range[1], tuple(selected_regions))
+
+
+df_filtered = filtered_sales(PAGE_COLUMNS[page]) if page in PAGE_COLUMNS else None
+
+# Reorder index, built once per session (and per inventory data) and updated as stock moves
+inventory_token = content_token(df_inventory)
+if st.session_state.get('reorder_queue') is None or st.session_state.reorder_queue.token != inventory_token:
+    st.session_state.reorder_queue = ReorderQueue(df_inventory, inventory_token)
+reorder_queue = st.session_state.reorder_queue
+df_inventory = reorder_queue.overlay(df_inventory)
+
+# Alerts and recommendations, re-evaluated only for inputs that changed
+if 'insights' not in st.session_state:
+    st.session_state.insights = InsightsEngine(DASHBOARD_RULES)
+insights = st.session_state.insights.evaluate(
+    # Growth compares the 30 days up to the selected end date with the 30 before, ignoring the start date
+    {'sales': lambda: read_sales(tuple(INSIGHT_COLUMNS), *growth_window(date_range[1]), tuple(selected_regions)),
+     'customers': df_customers, 'inventory': df_inventory},
+    {'sales': (sales_store().version, date_range[1], tuple(selected_regions)), 'customers': 0,
+     'inventory': (reorder_queue.token, reorder_queue.version)},
+)
 
 # PAGE 1: Executive Dashboard
 if page == "📊 Executive Dashboard":
@@ -163,21 +156,24 @@ if page == "📊 Executive Dashboard":
     # KPI Metrics Row
     col1, col2, col3, col4, col5 = st.columns(5)
     
-    total_sales = df_filtered['Sales'].sum()
-    total_units = df_filtered['Units'].sum()
-    avg_satisfaction = df_filtered['Customer_Satisfaction'].mean()
-    total_profit = (df_filtered['Sales'] - df_filtered['Cost']).sum()
+    # Totals and deltas against the previous period of the same length, from prefix sums
+    current, previous = kpi_index().period_over_period(date_range[0], date_range[1], selected_regions)
+    avg_satisfaction = current['Customer_Satisfaction'] / current['Rows'] if current['Rows'] else float('nan')
+    previous_satisfaction = previous['Customer_Satisfaction'] / previous['Rows'] if previous['Rows'] else float('nan')
+    satisfaction_delta = avg_satisfaction - previous_satisfaction
     
     with col1:
-        st.metric("Total Revenue", f"${total_sales:,.0f}", f"+{np.random.randint(5,15)}%")
+        st.metric("Total Revenue", f"${current['Sales']:,.0f}", change(current['Sales'], previous['Sales']))
     with col2:
-        st.metric("Units Sold", f"{total_units:,}", f"+{np.random.randint(3,12)}%")
+        st.metric("Units Sold", f"{current['Units']:,.0f}", change(current['Units'], previous['Units']))
     with col3:
-        st.metric("Avg Satisfaction", f"{avg_satisfaction:.2f}/5.0", f"+{np.random.uniform(0.1,0.5):.2f}")
+        st.metric("Avg Satisfaction", f"{avg_satisfaction:.2f}/5.0",
+                  None if np.isnan(satisfaction_delta) else f"{satisfaction_delta:+.2f}")
     with col4:
-        st.metric("Net Profit", f"${total_profit:,.0f}", f"+{np.random.randint(8,20)}%")
+        st.metric("Net Profit", f"${current['Profit']:,.0f}", change(current['Profit'], previous['Profit']))
     with col5:
-        st.metric("Active Customers", f"{len(df_customers):,}", f"+{np.random.randint(2,8)}%")
+        # Customer records carry no dates, so there is no previous period to compare with
+        st.metric("Active Customers", f"{len(df_customers):,}")
     
     st.divider()
     
@@ -186,7 +182,7 @@ if page == "📊 Executive Dashboard":
     
     with col1:
         st.subheader("📈 Revenue Trend Over Time")
-        daily_sales = df_filtered.groupby('Date')['Sales'].sum().reset_index()
+        daily_sales = engine.group_agg(df_filtered, 'Date', 'Sales')
         fig = px.line(daily_sales, x='Date', y='Sales', 
                       title='Daily Revenue Performance',
                       labels={'Sales': 'Revenue ($)', 'Date': 'Date'})
@@ -195,7 +191,7 @@ if page == "📊 Executive Dashboard":
     
     with col2:
         st.subheader("🌍 Revenue by Region")
-        region_sales = df_filtered.groupby('Region')['Sales'].sum().reset_index()
+        region_sales = engine.group_agg(df_filtered, 'Region', 'Sales')
         fig = px.pie(region_sales, values='Sales', names='Region',
                      color_discrete_sequence=px.colors.sequential.Viridis)
         st.plotly_chart(fig, use_container_width=True)
@@ -207,14 +203,14 @@ if page == "📊 Executive Dashboard":
     
     with col1:
         st.subheader("📦 Product Performance")
-        product_sales = df_filtered.groupby('Product')['Sales'].sum().sort_values(ascending=True).reset_index()
+        product_sales = engine.group_agg(df_filtered, 'Product', 'Sales').sort_values('Sales')
         fig = px.bar(product_sales, x='Sales', y='Product', orientation='h',
                      color='Sales', color_continuous_scale='Bluered')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("😊 Customer Satisfaction by Product")
-        satisfaction_data = df_filtered.groupby('Product')['Customer_Satisfaction'].mean().reset_index()
+        satisfaction_data = engine.group_agg(df_filtered, 'Product', 'Customer_Satisfaction', how='mean')
         fig = px.bar(satisfaction_data, x='Product', y='Customer_Satisfaction',
                      color='Customer_Satisfaction', color_continuous_scale='RdYlGn')
         st.plotly_chart(fig, use_container_width=True)
@@ -223,13 +219,13 @@ if page == "📊 Executive Dashboard":
     st.divider()
     st.subheader("🔔 Recent Activity & Alerts")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.info("📊 New sales report generated")
-    with col2:
-        st.warning("⚠️ 3 inventory items below threshold")
-    with col3:
-        st.success("✅ Q4 targets achieved")
+    alerts = {'info': st.info, 'warning': st.warning, 'success': st.success, 'error': st.error}
+    if insights:
+        for col, alert in zip(st.columns(3), insights[:3]):
+            with col:
+                alerts[alert['level']](f"{alert['icon']} **{alert['title']}:** {alert['description']}")
+    else:
+        st.success("✅ No alerts for the current selection")
 
 # PAGE 2: Sales Analytics
 elif page == "📈 Sales Analytics":
@@ -248,10 +244,7 @@ elif page == "📈 Sales Analytics":
         
         st.divider()
         
-        if group_by == "Date":
-            grouped = df_filtered.groupby('Date')[metric_type if metric_type != "Profit" else 'Sales'].sum().reset_index()
-        else:
-            grouped = df_filtered.groupby(group_by)[metric_type if metric_type != "Profit" else 'Sales'].sum().reset_index()
+        grouped = engine.group_agg(df_filtered, group_by, metric_type if metric_type != "Profit" else 'Sales')
         
         if chart_type == "Line":
             fig = px.line(grouped, x=grouped.columns[0], y=grouped.columns[1])
@@ -281,7 +274,7 @@ elif page == "📈 Sales Analytics":
         
         with col1:
             # Heatmap
-            heatmap_data = df_filtered.groupby(['Region', 'Product'])['Sales'].sum().reset_index()
+            heatmap_data = engine.group_agg(df_filtered, ['Region', 'Product'], 'Sales')
             heatmap_pivot = heatmap_data.pivot(index='Product', columns='Region', values='Sales')
             
             fig = go.Figure(data=go.Heatmap(
@@ -295,7 +288,7 @@ elif page == "📈 Sales Analytics":
         
         with col2:
             # Sunburst chart
-            sunburst_data = df_filtered.groupby(['Region', 'Product'])['Sales'].sum().reset_index()
+            sunburst_data = engine.group_agg(df_filtered, ['Region', 'Product'], 'Sales')
             fig = px.sunburst(sunburst_data, path=['Region', 'Product'], values='Sales',
                             title='Hierarchical Sales Distribution')
             st.plotly_chart(fig, use_container_width=True)
@@ -304,9 +297,19 @@ elif page == "📈 Sales Analytics":
         st.subheader("🔍 Deep Dive Analysis")
         
         # Statistical summary
-        st.write("**Statistical Summary**")
-        summary_stats = df_filtered[['Sales', 'Units', 'Cost', 'Customer_Satisfaction']].describe()
-        st.dataframe(summary_stats, use_container_width=True)
+        summary = sales_stats(date_range[0], date_range[1], selected_regions)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Statistical Summary**")
+            st.dataframe(summary.describe(), use_container_width=True)
+        
+        with col2:
+            st.write("**Correlation Matrix**")
+            fig = px.imshow(summary.correlation(), text_auto='.2f', zmin=-1, zmax=1,
+                            color_continuous_scale='RdBu_r')
+            st.plotly_chart(fig, use_container_width=True)
         
         st.divider()
         
@@ -338,18 +341,33 @@ elif page == "📈 Sales Analytics":
                 include_charts = st.checkbox("Include Charts", value=True)
             
             with col2:
-                format_type = st.selectbox("Format", ["PDF", "Excel", "CSV"])
+                format_type = st.selectbox("Format", list(REPORT_FORMATS))
                 email_report = st.checkbox("Email Report", value=False)
             
-            if st.form_submit_button("Generate Report", use_container_width=True):
-                with st.spinner("Generating report..."):
-                    progress_bar = st.progress(0)
-                    for i in range(100):
-                        time.sleep(0.01)
-                        progress_bar.progress(i + 1)
-                
+            submitted = st.form_submit_button("Generate Report", use_container_width=True)
+        
+        # A rendered report is only offered for the inputs it was rendered from
+        report_key = (report_type, format_type, include_charts, tuple(date_range), tuple(selected_regions),
+                      sales_store().version)
+        if st.session_state.get('report_key') != report_key:
+            st.session_state.pop('report', None)
+        
+        if submitted:
+            try:
+                with st_progress("Generating report...") as progress:
+                    st.session_state.report = render_report(df_filtered, report_type, format_type,
+                                                            include_charts, progress=progress)
+                st.session_state.report_key = report_key
+            except ImportError:
+                st.error("Excel export needs `openpyxl` (`pip install openpyxl`).")
+            else:
                 st.success(f"✅ {report_type} report generated in {format_type} format!")
                 st.balloons()
+        
+        if 'report' in st.session_state:
+            report_data, report_name, report_mime = st.session_state.report
+            st.download_button(f"📥 Download {report_name}", report_data, file_name=report_name,
+                               mime=report_mime, use_container_width=True)
 
 # PAGE 3: Customer Intelligence
 elif page == "👥 Customer Intelligence":
@@ -377,18 +395,50 @@ elif page == "👥 Customer Intelligence":
     
     with col1:
         st.subheader("🎯 Customer Segmentation")
+        seg_col1, seg_col2 = st.columns(2)
+        with seg_col1:
+            n_clusters = st.slider("Clusters", 2, 8, 4)
+        with seg_col2:
+            color_by = st.radio("Color by", ["Cluster", "Segment"], horizontal=True)
+        
+        clusters, cluster_profile, _ = customer_clusters(n_clusters)
         segment_data = df_customers.groupby('Segment').agg({
             'Customer_ID': 'count',
             'Contract_Value': 'sum',
             'Annual_Revenue': 'mean'
         }).reset_index()
         
-        fig = px.scatter(df_customers, x='Employees', y='Annual_Revenue',
-                        color='Segment', size='Contract_Value',
-                        hover_data=['Company', 'Industry'],
+        fig = px.scatter(df_customers.assign(Cluster=clusters), x='Employees', y='Annual_Revenue',
+                        color=color_by, size='Contract_Value',
+                        hover_data=['Company', 'Industry', 'Segment'],
                         title='Customer Segmentation Analysis',
                         log_x=True, log_y=True)
         st.plotly_chart(fig, use_container_width=True)
+        
+        tab_clusters, tab_segments = st.tabs(["Cluster Profiles", "Assigned Segments"])
+        with tab_clusters:
+            st.dataframe(
+                cluster_profile,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Annual_Revenue": st.column_config.NumberColumn("Annual Revenue", format="$%d"),
+                    "Contract_Value": st.column_config.NumberColumn("Contract Value", format="$%d"),
+                    "Employees": st.column_config.NumberColumn("Employees", format="%d"),
+                    "NPS_Score": st.column_config.NumberColumn("NPS Score", format="%.1f"),
+                    "Account_Age_Days": st.column_config.NumberColumn("Account Age (days)", format="%d"),
+                }
+            )
+        with tab_segments:
+            st.dataframe(
+                segment_data.rename(columns={'Customer_ID': 'Customers'}),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Contract_Value": st.column_config.NumberColumn("Total Contract Value", format="$%d"),
+                    "Annual_Revenue": st.column_config.NumberColumn("Avg Annual Revenue", format="$%d"),
+                }
+            )
     
     with col2:
         st.subheader("⚠️ Churn Risk Distribution")
@@ -413,11 +463,11 @@ elif page == "👥 Customer Intelligence":
     with col3:
         filter_risk = st.multiselect("Churn Risk", df_customers['Churn_Risk'].unique(), default=df_customers['Churn_Risk'].unique())
     
-    filtered_customers = df_customers[
-        (df_customers['Segment'].isin(filter_segment)) &
-        (df_customers['Industry'].isin(filter_industry)) &
-        (df_customers['Churn_Risk'].isin(filter_risk))
-    ]
+    filtered_customers = engine.filter_isin(df_customers, {
+        'Segment': filter_segment,
+        'Industry': filter_industry,
+        'Churn_Risk': filter_risk
+    })
     
     st.dataframe(
         filtered_customers,
@@ -439,7 +489,7 @@ elif page == "📦 Inventory Management":
     col1, col2, col3, col4 = st.columns(4)
     
     total_stock = df_inventory['Stock'].sum()
-    low_stock = len(df_inventory[df_inventory['Stock'] < df_inventory['Reorder_Point']])
+    low_stock = len(reorder_queue)
     total_value = (df_inventory['Stock'] * df_inventory['Unit_Cost']).sum()
     avg_lead_time = df_inventory['Lead_Time_Days'].mean()
     
@@ -458,21 +508,95 @@ elif page == "📦 Inventory Management":
     
     with col1:
         st.subheader("📊 Stock Levels by Warehouse")
-        warehouse_stock = df_inventory.groupby('Warehouse')['Stock'].sum().reset_index()
+        warehouse_stock = engine.group_agg(df_inventory, 'Warehouse', 'Stock')
         fig = px.bar(warehouse_stock, x='Warehouse', y='Stock', 
                      color='Stock', color_continuous_scale='Blues')
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.subheader("⚠️ Items Needing Reorder")
-        low_stock_items = df_inventory[df_inventory['Stock'] < df_inventory['Reorder_Point']]
-        reorder_by_warehouse = low_stock_items.groupby('Warehouse').size().reset_index()
-        reorder_by_warehouse.columns = ['Warehouse', 'Count']
+        reorder_by_warehouse = reorder_queue.counts_by_warehouse()
         
         fig = px.pie(reorder_by_warehouse, values='Count', names='Warehouse',
                      title=f'Total: {low_stock} items')
         st.plotly_chart(fig, use_container_width=True)
     
+    # Highlight low stock items
+    def highlight_low_stock(row):
+        if row['Stock'] < row['Reorder_Point']:
+            return ['background-color: #ffcccc'] * len(row)
+        return [''] * len(row)
+    
+    st.subheader("🚨 Reorder Queue")
+    st.caption("Items below their reorder point, least days of cover first")
+    st.dataframe(
+        reorder_queue.to_frame(n=50).style.apply(highlight_low_stock, axis=1),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Days_of_Cover": st.column_config.NumberColumn("Days of Cover", format="%.1f"),
+        }
+    )
+    
+    with st.expander("🔁 Record Stock Movement"):
+        with st.form("stock_movement"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                move_warehouse = st.selectbox("Warehouse", df_inventory['Warehouse'].unique())
+            with col2:
+                move_sku = st.selectbox("SKU", df_inventory['SKU'].unique())
+            with col3:
+                move_stock = st.number_input("New Stock Level", min_value=0, value=0, step=10)
+            
+            if st.form_submit_button("Update Stock"):
+                reorder_queue.update_stock(move_warehouse, move_sku, move_stock)
+                st.rerun()
+    
+    st.divider()
+    
+    # What-if simulation
+    st.subheader("🧪 What-if Simulation")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sim_days = st.slider("Horizon (days)", 30, 365, 90, step=15)
+    with col2:
+        sim_multiplier = st.slider("Demand Multiplier", 0.5, 3.0, 1.0, step=0.1)
+    with col3:
+        sim_cv = st.slider("Demand Variability (CV)", 0.0, 1.0, 0.2, step=0.05)
+    with col4:
+        sim_policy = st.selectbox("Reorder Policy", list(REORDER_POLICIES),
+                                  index=1, format_func=REORDER_POLICIES.get)
+    
+    sim_result, sim_summary = simulate_inventory(df_inventory, days=sim_days, demand_multiplier=sim_multiplier,
+                                                 policy=sim_policy, demand_cv=sim_cv)
+    stockouts = sim_summary.dropna(subset=['Stockout_Date']).sort_values('Stockout_Date')
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Items Stocking Out", f"{len(stockouts)} / {len(sim_summary)}")
+    with col2:
+        st.metric("Projected Holding Cost", f"${sim_summary['Holding_Cost'].sum():,.0f}")
+    with col3:
+        st.metric("Lost Sales Units", f"{sim_summary['Lost_Units'].sum():,.0f}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        fig = px.area(sim_result.daily_totals(), x='Date', y='Stock', title='Projected Total Stock')
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        st.dataframe(
+            stockouts.head(20),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Stockout_Date": st.column_config.DateColumn("Stockout Date"),
+                "Lost_Units": st.column_config.NumberColumn("Lost Units", format="%.0f"),
+                "Holding_Cost": st.column_config.NumberColumn("Holding Cost", format="$%.2f"),
+                "End_Stock": st.column_config.NumberColumn("End Stock", format="%.0f"),
+            }
+        )
+    
     st.divider()
     
     # Inventory table
@@ -482,16 +606,10 @@ elif page == "📦 Inventory Management":
                                      df_inventory['Warehouse'].unique(),
                                      default=df_inventory['Warehouse'].unique())
     
-    filtered_inventory = df_inventory[df_inventory['Warehouse'].isin(warehouse_filter)]
-    
-    # Highlight low stock items
-    def highlight_low_stock(row):
-        if row['Stock'] < row['Reorder_Point']:
-            return ['background-color: #ffcccc'] * len(row)
-        return [''] * len(row)
+    filtered_inventory = engine.filter_isin(df_inventory, {'Warehouse': warehouse_filter})
     
     st.dataframe(
-        filtered_inventory.head(50),
+        filtered_inventory.head(50).style.apply(highlight_low_stock, axis=1),
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -516,65 +634,83 @@ elif page == "🤖 AI Predictions":
             confidence_interval = st.select_slider("Confidence Interval", [80, 90, 95, 99], value=95)
         
         with col2:
-            model_type = st.radio("Model Type", ["Linear", "Exponential", "Prophet"])
+            model_type = st.radio("Model Type", [AUTO_MODEL] + FORECAST_MODELS)
+        
+        # Rolling-origin backtest of every model, computed in the background
+        backtest = forecast_backtest()
+        backtest_results = backtest.results if backtest.finished.is_set() else None
+        series_key = ('Region', selected_regions[0]) if len(selected_regions) == 1 else TOTAL_SERIES
+        if backtest_results is None:
+            st.caption(f"⏳ Backtesting forecast models... {backtest.fraction:.0%}")
+        if model_type == AUTO_MODEL:
+            if backtest_results is not None and series_key in best_models(backtest_results).index:
+                model_type = best_models(backtest_results).loc[series_key, 'Model']
+            else:
+                model_type = FORECAST_MODELS[0]
+            st.caption(f"Using the **{model_type}** model (best on full-history backtests)")
         
         if st.button("🚀 Generate Forecast", use_container_width=True):
-            with st.spinner("Training AI model..."):
-                progress = st.progress(0)
-                for i in range(100):
-                    time.sleep(0.02)
-                    progress.progress(i + 1)
-            
-            # Generate forecast data
-            last_date = df_filtered['Date'].max()
-            future_dates = pd.date_range(start=last_date + timedelta(days=1), periods=forecast_days)
+            history = engine.group_agg(df_filtered, 'Date', 'Sales').set_index('Date')['Sales']
             
-            # Simulate forecast
-            base_value = df_filtered.groupby('Date')['Sales'].sum().tail(30).mean()
-            trend = np.linspace(0, forecast_days * 100, forecast_days)
-            noise = np.random.normal(0, 5000, forecast_days)
-            forecast = base_value + trend + noise
+            if len(history) < 2:
+                st.warning("Not enough history in the selected date range to fit a forecast.")
+            else:
+                with st_progress("Training forecast model...") as progress:
+                    forecast_df = fit_forecast(history, forecast_days, model=model_type,
+                                               confidence=confidence_interval, progress=progress)
             
-            forecast_df = pd.DataFrame({
-                'Date': future_dates,
-                'Forecast': forecast,
-                'Upper_Bound': forecast * 1.1,
-                'Lower_Bound': forecast * 0.9
-            })
+                # Plot forecast
+                fig = go.Figure()
             
-            # Plot forecast
-            fig = go.Figure()
+                # Historical data
+                historical = history.reset_index()
+                fig.add_trace(go.Scatter(x=historical['Date'], y=historical['Sales'],
+                                        name='Historical', line=dict(color='blue')))
             
-            # Historical data
-            historical = df_filtered.groupby('Date')['Sales'].sum().reset_index()
-            fig.add_trace(go.Scatter(x=historical['Date'], y=historical['Sales'],
-                                    name='Historical', line=dict(color='blue')))
+                # Forecast
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Forecast'],
+                                        name='Forecast', line=dict(color='red', dash='dash')))
             
-            # Forecast
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Forecast'],
-                                    name='Forecast', line=dict(color='red', dash='dash')))
+                # Confidence interval
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Upper_Bound'],
+                                        fill=None, mode='lines', line_color='lightgray',
+                                        showlegend=False))
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Lower_Bound'],
+                                        fill='tonexty', mode='lines', line_color='lightgray',
+                                        name=f'{confidence_interval}% Confidence'))
             
-            # Confidence interval
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Upper_Bound'],
-                                    fill=None, mode='lines', line_color='lightgray',
-                                    showlegend=False))
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Lower_Bound'],
-                                    fill='tonexty', mode='lines', line_color='lightgray',
-                                    name=f'{confidence_interval}% Confidence'))
+                fig.update_layout(title='Sales Forecast with Confidence Interval',
+                                xaxis_title='Date', yaxis_title='Sales ($)')
             
-            fig.update_layout(title='Sales Forecast with Confidence Interval',
-                            xaxis_title='Date', yaxis_title='Sales ($)')
-            
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
             
-            # Forecast metrics
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Predicted Revenue", f"${forecast_df['Forecast'].sum():,.0f}")
-            with col2:
-                st.metric("Growth Rate", f"+{np.random.randint(5, 15)}%")
-            with col3:
-                st.metric("Model Accuracy", f"{np.random.randint(85, 95)}%")
+                # Forecast metrics
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Predicted Revenue", f"${forecast_df['Forecast'].sum():,.0f}")
+                with col2:
+                    growth = forecast_df['Forecast'].mean() / history.tail(30).mean() - 1
+                    st.metric("Growth Rate", f"{growth:+.1%}")
+                with col3:
+                    scores = None if backtest_results is None else backtest_score(backtest_results, series_key, model_type)
+                    if scores is not None:
+                        st.metric("Backtest Accuracy", f"{max(0.0, 100 - scores['MAPE']):.1f}%",
+                                  help=f"100% - MAPE over {scores['Origins']} rolling {scores['Horizon']}-day "
+                                       "backtests on the full sales history, not only the selected dates")
+                    else:
+                        st.metric("Backtest Accuracy", "—", help="Backtest still running")
+        
+        if backtest_results is not None:
+            with st.expander("📏 Backtest Results"):
+                st.dataframe(
+                    backtest_results,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        "MAPE": st.column_config.NumberColumn("MAPE (%)", format="%.1f"),
+                        "RMSE": st.column_config.NumberColumn("RMSE ($)", format="%,.0f"),
+                    }
+                )
     
     with tab2:
         st.subheader("👥 Customer Churn Prediction")
@@ -631,13 +767,8 @@ elif page == "🤖 AI Predictions":
         
         st.write("### 🎯 Strategic Insights")
         
-        insights = [
-            {"title": "Market Opportunity", "description": "Asia Pacific shows 23% growth potential", "priority": "High", "icon": "🌏"},
-            {"title": "Product Optimization", "description": "Product C has declining satisfaction scores", "priority": "Medium", "icon": "📦"},
-            {"title": "Customer Retention", "description": "15 high-value customers at churn risk", "priority": "High", "icon": "⚠️"},
-            {"title": "Inventory Alert", "description": "23 items below reorder point", "priority": "Medium", "icon": "📊"},
-            {"title": "Pricing Strategy", "description": "Competitor pricing analysis suggests 5% increase opportunity", "priority": "Low", "icon": "💰"}
-        ]
+        if not insights:
+            st.info("No recommendations for the current selection")
         
         for insight in insights:
             with st.container(border=True):
@@ -649,7 +780,10 @@ elif page == "🤖 AI Predictions":
                 with col2:
                     st.write(f"**{insight['title']}**")
                     st.write(insight['description'])
+                
+                with col3:
+                    st.write(f"Priority: **{insight['priority']}**")
 
-
+profiling.report(profiler)
 
 # streamlit run st_page02.py
\ No newline at end of file
@@ -1,10 +1,24 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import time
+
+import disk_cache
+from assets import asset
+from backtesting import TOTAL as TOTAL_SERIES, BacktestJob, daily_series, score as backtest_score
+from disk_cache import persistent_cache
+from forecasting import MODELS as FORECAST_MODELS, fit_forecast
+from insights import DASHBOARD_RULES, InsightsEngine, growth_window
+from kpi_index import KPIIndex, change
+from lazy_import import lazy_import
+from progress import st_progress
+from reports import FORMATS as REPORT_FORMATS, render_report
+from segmentation import segment_customers
+from streaming_stats import StreamingStats
+from versioned_data import content_token
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
 
 # Page Configuration
 st.set_page_config(
@@ -32,6 +46,7 @@ st.markdown("""
 
 # Generate realistic data
 @st.cache_data
+@persistent_cache(daily=True)
 def generate_sales_data():
     dates = pd.date_range(end=datetime.now(), periods=365, freq='D')
     regions = ['North America', 'Europe', 'Asia Pacific', 'Latin America', 'Middle East']
@@ -55,6 +70,7 @@ def generate_sales_data():
     return pd.DataFrame(data)
 
 @st.cache_data
+@persistent_cache
 def generate_customer_data():
     segments = ['Enterprise', 'Mid-Market', 'SMB', 'Startup']
     industries = ['Technology', 'Healthcare', 'Finance', 'Retail', 'Manufacturing']
@@ -77,6 +93,7 @@ def generate_customer_data():
     return pd.DataFrame(data)
 
 @st.cache_data
+@persistent_cache(daily=True)
 def generate_inventory_data():
     warehouses = ['WH-NY', 'WH-LA', 'WH-CHI', 'WH-HOU', 'WH-PHX']
     products = [f'SKU-{i:04d}' for i in range(50)]
@@ -101,12 +118,24 @@ df_sales = generate_sales_data()
 df_customers = generate_customer_data()
 df_inventory = generate_inventory_data()
 
+@st.cache_data
+def customer_clusters(k, seed=0):
+    """k-means clusters of the customer base, cached per parameter set."""
+    return segment_customers(generate_customer_data(), k=k, seed=seed)
+
+@st.cache_data
+def kpi_index():
+    """Running sums of the daily sales totals per region, for date-range KPIs."""
+    return KPIIndex(generate_sales_data())
+
+@st.cache_resource(max_entries=1)
+def forecast_backtest(day):
+    """Backtest of the forecast models on ``day``'s sales data, running in the background."""
+    return BacktestJob(daily_series(generate_sales_data())).start()
+
 # Sidebar Navigation
 with st.sidebar:
-    st.image(
-        "https://placehold.co/150x50/667eea/ffffff?text=LOGO",
-        use_container_width=True
-    )
+    st.image(asset("dashboard_logo"), use_container_width=True)
     st.title("🎛️ Control Center")
     
     page = st.radio(
@@ -141,11 +170,11 @@ with st.sidebar:
     
     if st.button("🔄 Refresh Dashboard", use_container_width=True):
         st.cache_data.clear()
+        disk_cache.clear()
+        forecast_backtest.clear()
         st.rerun()
     
     if st.button("📧 Email Report", use_container_width=True):
-        with st.spinner("Sending report..."):
-            time.sleep(1)
         st.success("✅ Report sent!")
     
     st.divider()
@@ -158,6 +187,20 @@ with st.sidebar:
 mask = (df_sales['Date'].dt.date >= date_range[0]) & (df_sales['Date'].dt.date <= date_range[1])
 df_filtered = df_sales[mask & df_sales['Region'].isin(selected_regions)]
 
+# Alerts and recommendations, re-evaluated only for inputs that changed
+if 'insights' not in st.session_state:
+    st.session_state.insights = InsightsEngine(DASHBOARD_RULES)
+sales_token = content_token(df_sales)
+# Growth compares the 30 days up to the selected end date with the 30 before, ignoring the start date
+growth_start, growth_end = growth_window(date_range[1])
+growth_mask = (df_sales['Date'].dt.date >= growth_start) & (df_sales['Date'].dt.date <= growth_end)
+insights = st.session_state.insights.evaluate(
+    {'sales': lambda: df_sales[growth_mask & df_sales['Region'].isin(selected_regions)],
+     'customers': df_customers, 'inventory': df_inventory},
+    {'sales': (sales_token, date_range[1], tuple(selected_regions)),
+     'customers': content_token(df_customers), 'inventory': content_token(df_inventory)},
+)
+
 # PAGE 1: Executive Dashboard
 if page == "📊 Executive Dashboard":
     st.title("📊 Executive Dashboard")
@@ -166,21 +209,24 @@ if page == "📊 Executive Dashboard":
     # KPI Metrics Row
     col1, col2, col3, col4, col5 = st.columns(5)
     
-    total_sales = df_filtered['Sales'].sum()
-    total_units = df_filtered['Units'].sum()
-    avg_satisfaction = df_filtered['Customer_Satisfaction'].mean()
-    total_profit = (df_filtered['Sales'] - df_filtered['Cost']).sum()
+    # Totals and deltas against the previous period of the same length, from prefix sums
+    current, previous = kpi_index().period_over_period(date_range[0], date_range[1], selected_regions)
+    avg_satisfaction = current['Customer_Satisfaction'] / current['Rows'] if current['Rows'] else float('nan')
+    previous_satisfaction = previous['Customer_Satisfaction'] / previous['Rows'] if previous['Rows'] else float('nan')
+    satisfaction_delta = avg_satisfaction - previous_satisfaction
     
     with col1:
-        st.metric("Total Revenue", f"${total_sales:,.0f}", f"+{np.random.randint(5,15)}%")
+        st.metric("Total Revenue", f"${current['Sales']:,.0f}", change(current['Sales'], previous['Sales']))
     with col2:
-        st.metric("Units Sold", f"{total_units:,}", f"+{np.random.randint(3,12)}%")
+        st.metric("Units Sold", f"{current['Units']:,.0f}", change(current['Units'], previous['Units']))
     with col3:
-        st.metric("Avg Satisfaction", f"{avg_satisfaction:.2f}/5.0", f"+{np.random.uniform(0.1,0.5):.2f}")
+        st.metric("Avg Satisfaction", f"{avg_satisfaction:.2f}/5.0",
+                  None if np.isnan(satisfaction_delta) else f"{satisfaction_delta:+.2f}")
     with col4:
-        st.metric("Net Profit", f"${total_profit:,.0f}", f"+{np.random.randint(8,20)}%")
+        st.metric("Net Profit", f"${current['Profit']:,.0f}", change(current['Profit'], previous['Profit']))
     with col5:
-        st.metric("Active Customers", f"{len(df_customers):,}", f"+{np.random.randint(2,8)}%")
+        # Customer records carry no dates, so there is no previous period to compare with
+        st.metric("Active Customers", f"{len(df_customers):,}")
     
     st.divider()
     
@@ -226,13 +272,13 @@ if page == "📊 Executive Dashboard":
     st.divider()
     st.subheader("🔔 Recent Activity & Alerts")
     
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.info("📊 New sales report generated")
-    with col2:
-        st.warning("⚠️ 3 inventory items below threshold")
-    with col3:
-        st.success("✅ Q4 targets achieved")
+    alerts = {'info': st.info, 'warning': st.warning, 'success': st.success, 'error': st.error}
+    if insights:
+        for col, alert in zip(st.columns(3), insights[:3]):
+            with col:
+                alerts[alert['level']](f"{alert['icon']} **{alert['title']}:** {alert['description']}")
+    else:
+        st.success("✅ No alerts for the current selection")
 
 # PAGE 2: Sales Analytics
 elif page == "📈 Sales Analytics":
@@ -307,9 +353,19 @@ elif page == "📈 Sales Analytics":
         st.subheader("🔍 Deep Dive Analysis")
         
         # Statistical summary
-        st.write("**Statistical Summary**")
-        summary_stats = df_filtered[['Sales', 'Units', 'Cost', 'Customer_Satisfaction']].describe()
-        st.dataframe(summary_stats, use_container_width=True)
+        summary = StreamingStats.from_frame(df_filtered, ['Sales', 'Units', 'Cost', 'Customer_Satisfaction', 'Returns'])
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Statistical Summary**")
+            st.dataframe(summary.describe(), use_container_width=True)
+        
+        with col2:
+            st.write("**Correlation Matrix**")
+            fig = px.imshow(summary.correlation(), text_auto='.2f', zmin=-1, zmax=1,
+                            color_continuous_scale='RdBu_r')
+            st.plotly_chart(fig, use_container_width=True)
         
         st.divider()
         
@@ -341,18 +397,33 @@ elif page == "📈 Sales Analytics":
                 include_charts = st.checkbox("Include Charts", value=True)
             
             with col2:
-                format_type = st.selectbox("Format", ["PDF", "Excel", "CSV"])
+                format_type = st.selectbox("Format", list(REPORT_FORMATS))
                 email_report = st.checkbox("Email Report", value=False)
             
-            if st.form_submit_button("Generate Report", use_container_width=True):
-                with st.spinner("Generating report..."):
-                    progress_bar = st.progress(0)
-                    for i in range(100):
-                        time.sleep(0.01)
-                        progress_bar.progress(i + 1)
-                
+            submitted = st.form_submit_button("Generate Report", use_container_width=True)
+        
+        # A rendered report is only offered for the inputs it was rendered from
+        report_key = (report_type, format_type, include_charts, tuple(date_range), tuple(selected_regions),
+                      sales_token)
+        if st.session_state.get('report_key') != report_key:
+            st.session_state.pop('report', None)
+        
+        if submitted:
+            try:
+                with st_progress("Generating report...") as progress:
+                    st.session_state.report = render_report(df_filtered, report_type, format_type,
+                                                            include_charts, progress=progress)
+                st.session_state.report_key = report_key
+            except ImportError:
+                st.error("Excel export needs `openpyxl` (`pip install openpyxl`).")
+            else:
                 st.success(f"✅ {report_type} report generated in {format_type} format!")
                 st.balloons()
+        
+        if 'report' in st.session_state:
+            report_data, report_name, report_mime = st.session_state.report
+            st.download_button(f"📥 Download {report_name}", report_data, file_name=report_name,
+                               mime=report_mime, use_container_width=True)
 
 # PAGE 3: Customer Intelligence
 elif page == "👥 Customer Intelligence":
@@ -380,18 +451,50 @@ elif page == "👥 Customer Intelligence":
     
     with col1:
         st.subheader("🎯 Customer Segmentation")
+        seg_col1, seg_col2 = st.columns(2)
+        with seg_col1:
+            n_clusters = st.slider("Clusters", 2, 8, 4)
+        with seg_col2:
+            color_by = st.radio("Color by", ["Cluster", "Segment"], horizontal=True)
+        
+        clusters, cluster_profile, _ = customer_clusters(n_clusters)
         segment_data = df_customers.groupby('Segment').agg({
             'Customer_ID': 'count',
             'Contract_Value': 'sum',
             'Annual_Revenue': 'mean'
         }).reset_index()
         
-        fig = px.scatter(df_customers, x='Employees', y='Annual_Revenue',
-                        color='Segment', size='Contract_Value',
-                        hover_data=['Company', 'Industry'],
+        fig = px.scatter(df_customers.assign(Cluster=clusters), x='Employees', y='Annual_Revenue',
+                        color=color_by, size='Contract_Value',
+                        hover_data=['Company', 'Industry', 'Segment'],
                         title='Customer Segmentation Analysis',
                         log_x=True, log_y=True)
         st.plotly_chart(fig, use_container_width=True)
+        
+        tab_clusters, tab_segments = st.tabs(["Cluster Profiles", "Assigned Segments"])
+        with tab_clusters:
+            st.dataframe(
+                cluster_profile,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Annual_Revenue": st.column_config.NumberColumn("Annual Revenue", format="$%d"),
+                    "Contract_Value": st.column_config.NumberColumn("Contract Value", format="$%d"),
+                    "Employees": st.column_config.NumberColumn("Employees", format="%d"),
+                    "NPS_Score": st.column_config.NumberColumn("NPS Score", format="%.1f"),
+                    "Account_Age_Days": st.column_config.NumberColumn("Account Age (days)", format="%d"),
+                }
+            )
+        with tab_segments:
+            st.dataframe(
+                segment_data.rename(columns={'Customer_ID': 'Customers'}),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Contract_Value": st.column_config.NumberColumn("Total Contract Value", format="$%d"),
+                    "Annual_Revenue": st.column_config.NumberColumn("Avg Annual Revenue", format="$%d"),
+                }
+            )
     
     with col2:
         st.subheader("⚠️ Churn Risk Distribution")
@@ -513,65 +616,65 @@ elif page == "🤖 AI Predictions":
             confidence_interval = st.select_slider("Confidence Interval", [80, 90, 95, 99], value=95)
         
         with col2:
-            model_type = st.radio("Model Type", ["Linear", "Exponential", "Prophet"])
+            model_type = st.radio("Model Type", FORECAST_MODELS)
+        
+        # Rolling-origin backtest of every model, computed in the background
+        backtest = forecast_backtest(datetime.now().date())
+        backtest_results = backtest.results if backtest.finished.is_set() else None
+        series_key = ('Region', selected_regions[0]) if len(selected_regions) == 1 else TOTAL_SERIES
+        if backtest_results is None:
+            st.caption(f"⏳ Backtesting forecast models... {backtest.fraction:.0%}")
         
         if st.button("🚀 Generate Forecast", use_container_width=True):
-            with st.spinner("Training AI model..."):
-                progress = st.progress(0)
-                for i in range(100):
-                    time.sleep(0.02)
-                    progress.progress(i + 1)
-            
-            # Generate forecast data
-            last_date = df_filtered['Date'].max()
-            future_dates = pd.date_range(start=last_date + timedelta(days=1), periods=forecast_days)
-            
-            # Simulate forecast
-            base_value = df_filtered.groupby('Date')['Sales'].sum().tail(30).mean()
-            trend = np.linspace(0, forecast_days * 100, forecast_days)
-            noise = np.random.normal(0, 5000, forecast_days)
-            forecast = base_value + trend + noise
+            history = df_filtered.groupby('Date')['Sales'].sum()
             
-            forecast_df = pd.DataFrame({
-                'Date': future_dates,
-                'Forecast': forecast,
-                'Upper_Bound': forecast * 1.1,
-                'Lower_Bound': forecast * 0.9
-            })
+            if len(history) < 2:
+                st.warning("Not enough history in the selected date range to fit a forecast.")
+            else:
+                with st_progress("Training forecast model...") as progress:
+                    forecast_df = fit_forecast(history, forecast_days, model=model_type,
+                                               confidence=confidence_interval, progress=progress)
             
-            # Plot forecast
-            fig = go.Figure()
+                # Plot forecast
+                fig = go.Figure()
             
-            # Historical data
-            historical = df_filtered.groupby('Date')['Sales'].sum().reset_index()
-            fig.add_trace(go.Scatter(x=historical['Date'], y=historical['Sales'],
-                                    name='Historical', line=dict(color='blue')))
+                # Historical data
+                historical = history.reset_index()
+                fig.add_trace(go.Scatter(x=historical['Date'], y=historical['Sales'],
+                                        name='Historical', line=dict(color='blue')))
             
-            # Forecast
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Forecast'],
-                                    name='Forecast', line=dict(color='red', dash='dash')))
+                # Forecast
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Forecast'],
+                                        name='Forecast', line=dict(color='red', dash='dash')))
             
-            # Confidence interval
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Upper_Bound'],
-                                    fill=None, mode='lines', line_color='lightgray',
-                                    showlegend=False))
-            fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Lower_Bound'],
-                                    fill='tonexty', mode='lines', line_color='lightgray',
-                                    name=f'{confidence_interval}% Confidence'))
+                # Confidence interval
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Upper_Bound'],
+                                        fill=None, mode='lines', line_color='lightgray',
+                                        showlegend=False))
+                fig.add_trace(go.Scatter(x=forecast_df['Date'], y=forecast_df['Lower_Bound'],
+                                        fill='tonexty', mode='lines', line_color='lightgray',
+                                        name=f'{confidence_interval}% Confidence'))
             
-            fig.update_layout(title='Sales Forecast with Confidence Interval',
-                            xaxis_title='Date', yaxis_title='Sales ($)')
+                fig.update_layout(title='Sales Forecast with Confidence Interval',
+                                xaxis_title='Date', yaxis_title='Sales ($)')
             
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
             
-            # Forecast metrics
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Predicted Revenue", f"${forecast_df['Forecast'].sum():,.0f}")
-            with col2:
-                st.metric("Growth Rate", f"+{np.random.randint(5, 15)}%")
-            with col3:
-                st.metric("Model Accuracy", f"{np.random.randint(85, 95)}%")
+                # Forecast metrics
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Predicted Revenue", f"${forecast_df['Forecast'].sum():,.0f}")
+                with col2:
+                    growth = forecast_df['Forecast'].mean() / history.tail(30).mean() - 1
+                    st.metric("Growth Rate", f"{growth:+.1%}")
+                with col3:
+                    scores = None if backtest_results is None else backtest_score(backtest_results, series_key, model_type)
+                    if scores is not None:
+                        st.metric("Backtest Accuracy", f"{max(0.0, 100 - scores['MAPE']):.1f}%",
+                                  help=f"100% - MAPE over {scores['Origins']} rolling {scores['Horizon']}-day "
+                                       "backtests on the full sales history, not only the selected dates")
+                    else:
+                        st.metric("Backtest Accuracy", "—", help="Backtest still running")
     
     with tab2:
         st.subheader("👥 Customer Churn Prediction")
@@ -628,13 +731,8 @@ elif page == "🤖 AI Predictions":
         
         st.write("### 🎯 Strategic Insights")
         
-        insights = [
-            {"title": "Market Opportunity", "description": "Asia Pacific shows 23% growth potential", "priority": "High", "icon": "🌏"},
-            {"title": "Product Optimization", "description": "Product C has declining satisfaction scores", "priority": "Medium", "icon": "📦"},
-            {"title": "Customer Retention", "description": "15 high-value customers at churn risk", "priority": "High", "icon": "⚠️"},
-            {"title": "Inventory Alert", "description": "23 items below reorder point", "priority": "Medium", "icon": "📊"},
-            {"title": "Pricing Strategy", "description": "Competitor pricing analysis suggests 5% increase opportunity", "priority": "Low", "icon": "💰"}
-        ]
+        if not insights:
+            st.info("No recommendations for the current selection")
         
         for insight in insights:
             with st.container(border=True):
@@ -0,0 +1,121 @@
+"""Single-pass summary statistics that can be merged and updated.
+
+``StreamingStats`` keeps, per column, the count, mean, sum of squared
+deviations (M2), min and max, plus the co-moment matrix of the rows that
+have no missing values.  Chunks are folded in with Chan et al.'s parallel
+update of Welford's algorithm, so statistics of separate partitions can be
+combined with ``merge`` and appended rows only cost a pass over the new
+rows.  Each column also has a ``KLLSketch``, so ``describe`` can report
+approximate quartiles without sorting or keeping the values.
+"""
+import numpy as np
+import pandas as pd
+
+from quantile_sketch import KLLSketch
+
+
+def _combine(n_a, mean_a, n_b, mean_b):
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    weight = np.divide(n_b, n, out=np.zeros_like(delta), where=n > 0)
+    return n, delta, mean_a + delta * weight, np.divide(n_a * n_b, n, out=np.zeros_like(delta), where=n > 0)
+
+
+class StreamingStats:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.count = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+        # Rows without missing values, for the covariance matrix.
+        self.pair_count = 0
+        self.pair_mean = np.zeros(k)
+        self.comoment = np.zeros((k, k))
+        self.sketches = [KLLSketch() for _ in self.columns]
+
+    @classmethod
+    def from_frame(cls, df, columns=None, chunk_rows=100_000):
+        columns = df.select_dtypes('number').columns if columns is None else columns
+        stats = cls(columns)
+        for start in range(0, len(df), chunk_rows):
+            stats.update(df.iloc[start:start + chunk_rows])
+        return stats
+
+    def update(self, chunk):
+        """Fold in a DataFrame (or 2-D array with ``columns`` order) of new rows."""
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk[self.columns].to_numpy(dtype=np.float64)
+        chunk = np.asarray(chunk, dtype=np.float64)
+        if not len(chunk):
+            return self
+        present = ~np.isnan(chunk)
+        other = StreamingStats(self.columns)
+        other.count = present.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            other.mean = np.where(other.count > 0, np.nansum(chunk, axis=0) / other.count, 0.0)
+        other.m2 = np.nansum((chunk - other.mean) ** 2, axis=0)
+        other.min = np.where(other.count > 0, np.nanmin(np.where(present, chunk, np.inf), axis=0), np.inf)
+        other.max = np.where(other.count > 0, np.nanmax(np.where(present, chunk, -np.inf), axis=0), -np.inf)
+
+        for sketch, values in zip(other.sketches, chunk.T):
+            sketch.update(values)
+
+        complete = chunk[present.all(axis=1)]
+        if len(complete):
+            other.pair_count = len(complete)
+            other.pair_mean = complete.mean(axis=0)
+            centered = complete - other.pair_mean
+            other.comoment = centered.T @ centered
+        return self.merge(other)
+
+    def merge(self, other):
+        """Combine with statistics computed over other rows of the same columns."""
+        n, delta, self.mean, scale = _combine(self.count, self.mean, other.count, other.mean)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * scale
+        self.count = n
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+        if other.pair_count:
+            n = self.pair_count + other.pair_count
+            delta = other.pair_mean - self.pair_mean
+            self.comoment = (self.comoment + other.comoment
+                             + np.outer(delta, delta) * self.pair_count * other.pair_count / n)
+            self.pair_mean = self.pair_mean + delta * other.pair_count / n
+            self.pair_count = n
+        return self
+
+    def std(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+    def quantile(self, q):
+        """Approximate ``q`` quantile of every column, as a Series."""
+        return pd.Series([sketch.quantile(q) for sketch in self.sketches], index=self.columns)
+
+    def describe(self, percentiles=(0.25, 0.5, 0.75)):
+        """Summary table laid out like ``DataFrame.describe()`` (percentiles are approximate)."""
+        empty = self.count == 0
+        quantiles = [self.quantile(q).to_numpy() for q in percentiles]
+        return pd.DataFrame(
+            [self.count, np.where(empty, np.nan, self.mean), self.std(), np.where(empty, np.nan, self.min),
+             *quantiles, np.where(empty, np.nan, self.max)],
+            index=['count', 'mean', 'std', 'min', *(f'{q:.0%}' for q in percentiles), 'max'],
+            columns=self.columns,
+        )
+
+    def covariance(self):
+        cov = self.comoment / (self.pair_count - 1) if self.pair_count > 1 else np.full_like(self.comoment, np.nan)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        cov = self.covariance().to_numpy()
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = cov / np.outer(std, std)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
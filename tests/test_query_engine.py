@@ -0,0 +1,57 @@
+"""Every query engine must return the pandas engine's results.
+
+Run from the repository root with ``python -m pytest``.  Engines whose
+package is not installed are skipped.
+"""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from bench_query_engine import REGIONS, check_parity, make_sales, pipeline
+from query_engine import get_engine
+
+
+ROWS = 20_000
+ENGINES = {'duckdb': 'duckdb', 'polars': 'polars'}  # engine: package it needs
+
+
+@pytest.fixture(scope='module')
+def sales():
+    return make_sales(ROWS)
+
+
+@pytest.fixture(params=sorted(ENGINES))
+def engine(request):
+    pytest.importorskip(ENGINES[request.param])
+    return get_engine(request.param)
+
+
+@pytest.mark.parametrize('start, end, regions', [
+    (date(2025, 10, 1), date(2025, 12, 31), REGIONS[:3]),
+    (date(2025, 1, 1), date(2025, 12, 31), REGIONS),
+    (date(2025, 6, 15), date(2025, 6, 15), REGIONS[4:]),
+    (date(2026, 1, 1), date(2026, 1, 31), REGIONS),  # no rows
+])
+def test_pipeline_matches_pandas(engine, sales, start, end, regions):
+    expected = pipeline(get_engine('pandas'), sales, start, end, regions)
+    engine.prepare(sales)
+    check_parity(expected, pipeline(engine, sales, start, end, regions), engine.name)
+
+
+def test_filter_isin_matches_pandas(engine, sales):
+    filters = {'Region': REGIONS[1:3], 'Product': ['Product A', 'Product E']}
+    expected = get_engine('pandas').filter_isin(sales, filters).reset_index(drop=True)
+    actual = engine.filter_isin(sales, filters).reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
+
+
+def test_below_reorder_point_matches_pandas(engine):
+    inventory = pd.DataFrame({
+        'SKU': [f'SKU-{i}' for i in range(6)],
+        'Stock': [5, 50, 0, 20, 19, 100],
+        'Reorder_Point': [10, 40, 1, 20, 20, 99],
+    })
+    expected = get_engine('pandas').below_reorder_point(inventory).reset_index(drop=True)
+    actual = engine.below_reorder_point(inventory).reset_index(drop=True)
+    pd.testing.assert_frame_equal(expected, actual, check_dtype=False)
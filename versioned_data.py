@@ -0,0 +1,145 @@
+"""A DataFrame that is edited through row deltas and carries a version.
+
+``st.data_editor`` records its changes in session state as
+
+    {"edited_rows": {0: {"value": 12.5}}, "added_rows": [{...}], "deleted_rows": [3]}
+
+where row numbers are positions in the frame that was passed to the editor.
+``VersionedFrame.apply_editor_state`` maps those positions back to labels of
+the full dataset and applies the changes without copying it: edited cells
+are written one by one, deleted rows are recorded as tombstones and added
+rows go to an append buffer.  ``df`` materialises the current view from
+those once per version, when it is next read.  Every application bumps
+``version`` and records which columns changed, so aggregates registered
+through ``aggregate`` are recomputed only when a column they read has
+changed, or updated from just the new rows when rows were appended.
+"""
+import uuid
+
+import numpy as np
+import pandas as pd
+
+
+def content_token(df):
+    """Hash of ``df``'s values, to tell a regenerated table from the one state was derived from."""
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+class VersionedFrame:
+    def __init__(self, df, name='data'):
+        self._base = df
+        self._deleted = set()  # labels of deleted rows
+        self._added = []  # frames of added rows, in order
+        self._next_label = df.index.max() + 1 if len(df) else 0
+        self._view = (0, df)  # (version, materialised frame)
+        self.name = name
+        self.version = 0
+        self.token = uuid.uuid4().hex  # tells apart edited copies of the same data
+        self._column_versions = dict.fromkeys(df.columns, 0)
+        self._aggregates = {}
+        self._appended = (None, None)  # (version, rows) of the last append-only change
+
+    @property
+    def key(self):
+        """String identifying the current contents, for use in cache keys.
+
+        Unedited frames share ``name:0``; once edited, the key includes this
+        instance's token, so edits made in different sessions never collide
+        in a global cache.
+        """
+        if not self.version:
+            return f"{self.name}:0"
+        return f"{self.name}:{self.token}:{self.version}"
+
+    @property
+    def df(self):
+        """The current rows: the original ones minus deleted ones, then the added ones."""
+        if self._view[0] != self.version:
+            frame = self._base
+            if self._deleted:
+                frame = frame[~frame.index.isin(self._deleted)]
+            if self._added:
+                frame = pd.concat([frame, *self._added])
+            self._view = (self.version, frame)
+        return self._view[1]
+
+    def _frame_of(self, label):
+        """The base or append-buffer frame holding ``label``."""
+        if label in self._base.index:
+            return self._base
+        return next(frame for frame in self._added if label in frame.index)
+
+    def _coerce(self, column, value):
+        dtype = self._base[column].dtype
+        if value is None:
+            return None
+        if pd.api.types.is_integer_dtype(dtype) and float(value).is_integer():
+            return dtype.type(value)
+        if pd.api.types.is_float_dtype(dtype):
+            return float(value)
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return pd.Timestamp(value)
+        return value
+
+    def apply_editor_state(self, state, view_index):
+        """Apply a data_editor state dict; ``view_index`` is the edited view's index.
+
+        Returns the set of columns that changed.
+        """
+        changed = set()
+        new_rows = None
+        for position, cells in state.get('edited_rows', {}).items():
+            label = view_index[int(position)]
+            if label in self._deleted:
+                continue
+            frame = self._frame_of(label)
+            for column, value in cells.items():
+                frame.at[label, column] = self._coerce(column, value)
+                changed.add(column)
+
+        deleted = {view_index[int(p)] for p in state.get('deleted_rows', [])} - self._deleted
+        if deleted:
+            self._deleted |= deleted
+            changed.update(self._base.columns)
+
+        added = [row for row in state.get('added_rows', []) if row]
+        if added:
+            start = self._next_label
+            self._next_label += len(added)
+            new_rows = pd.DataFrame(added, index=np.arange(start, start + len(added)))
+            new_rows = new_rows.reindex(columns=self._base.columns)
+            for column in new_rows.columns:
+                try:
+                    new_rows[column] = new_rows[column].astype(self._base[column].dtype)
+                except (TypeError, ValueError):
+                    pass  # e.g. missing values in an integer column
+            self._added.append(new_rows)
+            changed.update(self._base.columns)
+
+        if changed:
+            append_only = new_rows is not None and not deleted and not state.get('edited_rows')
+            self.version += 1
+            for column in changed:
+                self._column_versions[column] = self.version
+            self._appended = (self.version, new_rows if append_only else None)
+        return changed
+
+    def aggregate(self, name, columns, func, append=None):
+        """``func(df)``, cached until one of ``columns`` changes.
+
+        If the only change since the cached value was appending rows and
+        ``append`` is given, the value is updated with
+        ``append(value, new_rows)`` instead of being recomputed.
+        """
+        seen = max(self._column_versions.get(c, self.version) for c in columns)
+        cached = self._aggregates.get(name)
+        if cached is not None and cached[0] < seen:
+            appended_version, new_rows = self._appended
+            if append is not None and new_rows is not None and cached[0] + 1 == appended_version == seen:
+                cached = (self.version, append(cached[1], new_rows))
+            else:
+                cached = None
+        if cached is None:
+            cached = (self.version, func(self.df))
+        self._aggregates[name] = cached
+        return cached[1]